@@ -0,0 +1,381 @@
+import csv
+import hashlib
+import mmap
+import os
+import shutil
+import struct
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Column order of entries stored in the index, matching Dictionary entries
+FIELDS = ("word", "phonetic", "pos", "translation", "definition", "exchange",
+          "collins", "oxford", "tag", "bnc", "frq", "audio", "detail")
+FIELD_SEPARATOR = "\x1f"
+# ECDICT exchange types naming inflected forms of the entry word: past tense,
+# past participle, present participle, third person, comparative, superlative, plural
+INFLECTION_TYPES = ("p", "d", "i", "3", "r", "t", "s")
+
+# magic, version, count, source size, source mtime_ns, source sha1,
+# table offset, keys offset, entries offset, lemma table offset, lemma count
+_HEADER = struct.Struct("<4sIIQQ20sQQQQI")
+# key offset, key length, entry offset, entry length
+_ROW = struct.Struct("<IIII")
+# form key offset, form key length, row of the lemma entry
+_LEMMA_ROW = struct.Struct("<III")
+
+
+def file_sha1(path: Path) -> bytes:
+    """Hash a file in chunks."""
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def parse_exchange(exchange: str) -> Dict[str, str]:
+    """Split an ECDICT exchange field such as "p:went/d:gone/i:going" into {type: value}."""
+    fields = {}
+    for part in exchange.split("/"):
+        kind, sep, value = part.partition(":")
+        if sep and value.strip():
+            fields[kind.strip()] = value.strip()
+    return fields
+
+
+class LemmaMap:
+    """
+    Collects inflected form -> lemma links from the exchange fields of entries.
+    A form's own "0:" declaration wins; otherwise the most frequent lemma
+    listing the form among its inflections is chosen.
+    """
+
+    def __init__(self):
+        self._declared: Dict[str, str] = {}
+        self._candidates: Dict[str, List[Tuple[int, str]]] = {}
+
+    def add(self, word: str, exchange: str, frq: str = ""):
+        """Record the links of one entry."""
+        if not exchange:
+            return
+        key = word.lower()
+        fields = parse_exchange(exchange)
+        lemma = fields.get("0", "").lower()
+        if lemma and lemma != key:
+            self._declared[key] = lemma
+        try:
+            rank = int(frq) or sys.maxsize
+        except ValueError:
+            rank = sys.maxsize
+        for kind in INFLECTION_TYPES:
+            form = fields.get(kind, "").lower()
+            if form and form != key:
+                self._candidates.setdefault(form, []).append((rank, key))
+
+    def resolve(self, known: Iterable[str]) -> Dict[str, str]:
+        """Return form -> lemma for every lemma that is itself a dictionary key."""
+        known = known if isinstance(known, (set, dict)) else set(known)
+        lemmas = {}
+        for form, candidates in self._candidates.items():
+            for _, lemma in sorted(candidates):
+                if lemma in known:
+                    lemmas[form] = lemma
+                    break
+        for form, lemma in self._declared.items():
+            if lemma in known:
+                lemmas[form] = lemma
+        return lemmas
+
+
+class DictionaryIndex:
+    """
+    Read-only, memory-mapped ECDICT index compiled from the CSV.
+    Layout: header, fixed-size rows sorted by lowercase key, a key blob, an
+    entry blob and a table of inflected forms sorted by form, each pointing at
+    the row of its lemma. Lookups binary search the rows and decode a single entry.
+    """
+
+    MAGIC = b"ECDX"
+    VERSION = 2
+
+    def __init__(self, index_path: Path):
+        """Open and validate a compiled index file."""
+        self.path = Path(index_path)
+        self._file = self.path.open("rb")
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._file.close()
+            raise
+        (magic, version, self._count, self.source_size, self.source_mtime_ns, self.source_sha1,
+         self._table_offset, self._keys_offset, self._entries_offset,
+         self._lemma_offset, self._lemma_count) = _HEADER.unpack_from(self._mm, 0)
+        if magic != self.MAGIC or version != self.VERSION:
+            self.close()
+            raise ValueError(f"Unsupported dictionary index: {self.path}")
+
+    def __len__(self) -> int:
+        return self._count
+
+    def close(self):
+        """Release the memory map and file handle."""
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        self._file.close()
+
+    @classmethod
+    def read_header(cls, index_path: Path):
+        """Return the raw header tuple of an index file, or None if unreadable."""
+        try:
+            with open(index_path, "rb") as f:
+                data = f.read(_HEADER.size)
+            header = _HEADER.unpack(data)
+        except (OSError, struct.error):
+            return None
+        if header[0] != cls.MAGIC or header[1] != cls.VERSION:
+            return None
+        return header
+
+    @classmethod
+    def is_current(cls, index_path: Path, csv_path: Path) -> bool:
+        """Check whether the index was compiled from the current CSV.
+
+        Size and mtime are compared first; when they differ the CSV content
+        hash decides, and a matching hash refreshes the stored mtime.
+        """
+        header = cls.read_header(index_path)
+        if header is None:
+            return False
+        st = csv_path.stat()
+        if header[3] == st.st_size and header[4] == st.st_mtime_ns:
+            return True
+        if header[3] != st.st_size or header[5] != file_sha1(csv_path):
+            return False
+        # Content unchanged (e.g. file copied or touched): just record the new mtime
+        try:
+            with open(index_path, "r+b") as f:
+                f.write(_HEADER.pack(header[0], header[1], header[2], st.st_size, st.st_mtime_ns,
+                                     *header[5:]))
+        except OSError:
+            pass
+        return True
+
+    @classmethod
+    def open_or_build(cls, csv_path: Path, index_path: Path) -> "DictionaryIndex":
+        """Open the index for a CSV, compiling it first when missing or stale."""
+        csv_path = Path(csv_path)
+        index_path = Path(index_path)
+        if not cls.is_current(index_path, csv_path):
+            print(f"Compiling dictionary index: {index_path}")
+            cls.compile(csv_path, index_path)
+        return cls(index_path)
+
+    @classmethod
+    def compile(cls, csv_path: Path, index_path: Path) -> int:
+        """Compile the ECDICT CSV into an index file.
+
+        Args:
+            csv_path: Source ECDICT CSV
+            index_path: Destination index file, replaced atomically
+
+        Returns:
+            Number of distinct keys written
+        """
+        csv_path = Path(csv_path)
+        index_path = Path(index_path)
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        st = csv_path.stat()
+        source_sha1 = file_sha1(csv_path)
+
+        # Entries are streamed to a scratch file; only key -> (offset, length) stays in memory.
+        # Later rows with the same key win, as with the in-memory loader.
+        spans: Dict[str, tuple] = {}
+        lemma_map = LemmaMap()
+        with tempfile.TemporaryFile(dir=str(index_path.parent)) as entries_tmp:
+            offset = 0
+            with csv_path.open("r", encoding="utf-8-sig", newline="") as f:
+                for row in csv.DictReader(f):
+                    word = (row.get("word") or "").strip()
+                    if not word:
+                        continue
+                    values = [word] + [(row.get(name) or "").strip() for name in FIELDS[1:]]
+                    data = FIELD_SEPARATOR.join(v.replace(FIELD_SEPARATOR, " ") for v in values).encode("utf-8")
+                    entries_tmp.write(data)
+                    spans[word.lower()] = (offset, len(data))
+                    offset += len(data)
+                    lemma_map.add(word, values[5], values[10])
+
+            keys = sorted(spans)
+            key_blob = bytearray()
+            table = bytearray(_ROW.size * len(keys))
+            rows = {}
+            for i, key in enumerate(keys):
+                key_bytes = key.encode("utf-8")
+                entry_offset, entry_length = spans[key]
+                _ROW.pack_into(table, i * _ROW.size, len(key_blob), len(key_bytes), entry_offset, entry_length)
+                key_blob += key_bytes
+                rows[key] = i
+
+            # Inflected forms resolve to their lemma's row without any scan at query time
+            lemmas = lemma_map.resolve(rows)
+            forms = sorted(lemmas)
+            lemma_table = bytearray(_LEMMA_ROW.size * len(forms))
+            for i, form in enumerate(forms):
+                form_bytes = form.encode("utf-8")
+                _LEMMA_ROW.pack_into(lemma_table, i * _LEMMA_ROW.size, len(key_blob), len(form_bytes),
+                                     rows[lemmas[form]])
+                key_blob += form_bytes
+
+            table_offset = _HEADER.size
+            lemma_offset = table_offset + len(table)
+            keys_offset = lemma_offset + len(lemma_table)
+            entries_offset = keys_offset + len(key_blob)
+            header = _HEADER.pack(cls.MAGIC, cls.VERSION, len(keys), st.st_size, st.st_mtime_ns,
+                                  source_sha1, table_offset, keys_offset, entries_offset,
+                                  lemma_offset, len(forms))
+
+            fd, tmp_name = tempfile.mkstemp(dir=str(index_path.parent), suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as out:
+                    out.write(header)
+                    out.write(table)
+                    out.write(lemma_table)
+                    out.write(key_blob)
+                    entries_tmp.seek(0)
+                    shutil.copyfileobj(entries_tmp, out, 1024 * 1024)
+                os.replace(tmp_name, index_path)
+            except Exception:
+                try:
+                    os.remove(tmp_name)
+                except OSError:
+                    pass
+                raise
+        return len(keys)
+
+    def _row(self, i: int):
+        return _ROW.unpack_from(self._mm, self._table_offset + i * _ROW.size)
+
+    def key_at(self, i: int) -> bytes:
+        """Return the UTF-8 key stored at row i."""
+        key_offset, key_length, _, _ = self._row(i)
+        start = self._keys_offset + key_offset
+        return self._mm[start:start + key_length]
+
+    def _bisect_left(self, key: bytes, lo: int = 0) -> int:
+        hi = self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.key_at(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def find(self, key: str) -> int:
+        """Return the row of an exact lowercase key, or -1."""
+        key_bytes = key.encode("utf-8")
+        i = self._bisect_left(key_bytes)
+        if i < self._count and self.key_at(i) == key_bytes:
+            return i
+        return -1
+
+    def prefix_keys(self, prefix: str, limit: int) -> List[str]:
+        """Return up to limit keys starting with an already normalized prefix, in sorted order."""
+        prefix_bytes = prefix.encode("utf-8")
+        keys = []
+        i = self._bisect_left(prefix_bytes)
+        while i < self._count and len(keys) < limit:
+            key = self.key_at(i)
+            if not key.startswith(prefix_bytes):
+                break
+            keys.append(key.decode("utf-8"))
+            i += 1
+        return keys
+
+    def find_many(self, keys: Iterable[str]) -> Dict[str, int]:
+        """Return {key: row} for the given normalized keys that exist.
+
+        Keys are searched in sorted order, galloping forward from the previous
+        match: neighbouring keys usually share a long prefix, so each search
+        only covers the short distance to the next one.
+        """
+        found = {}
+        lo = 0
+        for key in sorted(set(keys)):
+            key_bytes = key.encode("utf-8")
+            step = 1
+            hi = lo
+            while hi < self._count and self.key_at(hi) < key_bytes:
+                lo = hi + 1
+                hi = lo + step
+                step *= 2
+            hi = min(hi, self._count)
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if self.key_at(mid) < key_bytes:
+                    lo = mid + 1
+                else:
+                    hi = mid
+            if lo >= self._count:
+                break
+            if self.key_at(lo) == key_bytes:
+                found[key] = lo
+        return found
+
+    def existing_keys(self, candidates: Iterable[str]) -> List[str]:
+        """Return the candidates that are keys, in sorted order."""
+        return sorted(self.find_many(candidates))
+
+    def entry_at(self, i: int) -> Dict[str, str]:
+        """Decode the entry stored at row i."""
+        _, _, entry_offset, entry_length = self._row(i)
+        start = self._entries_offset + entry_offset
+        values = self._mm[start:start + entry_length].decode("utf-8").split(FIELD_SEPARATOR)
+        return dict(zip(FIELDS, values))
+
+    def lookup(self, key: str) -> Optional[Dict[str, str]]:
+        """Look up an already normalized (stripped, lowercase) key."""
+        i = self.find(key)
+        return self.entry_at(i) if i >= 0 else None
+
+    def _form_at(self, i: int) -> bytes:
+        form_offset, form_length, _ = _LEMMA_ROW.unpack_from(self._mm, self._lemma_offset + i * _LEMMA_ROW.size)
+        start = self._keys_offset + form_offset
+        return self._mm[start:start + form_length]
+
+    def lemma_row(self, key: str) -> int:
+        """Return the row of the lemma of an inflected form, or -1."""
+        key_bytes = key.encode("utf-8")
+        lo, hi = 0, self._lemma_count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._form_at(mid) < key_bytes:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self._lemma_count and self._form_at(lo) == key_bytes:
+            return _LEMMA_ROW.unpack_from(self._mm, self._lemma_offset + lo * _LEMMA_ROW.size)[2]
+        return -1
+
+    def lookup_lemma(self, key: str) -> Optional[Dict[str, str]]:
+        """Look up the lemma entry of an already normalized inflected form."""
+        i = self.lemma_row(key)
+        return self.entry_at(i) if i >= 0 else None
+
+
+def main(argv=None):
+    """Compile an index ahead of time, e.g. when preparing a release."""
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) != 2:
+        print("Usage: python -m Echoscribe.Core.dict_index <ecdict.csv> <output.idx>")
+        return 2
+    count = DictionaryIndex.compile(Path(argv[0]), Path(argv[1]))
+    print(f"Wrote {count} entries to {argv[1]}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,19 +1,144 @@
 import csv
 import sys
+from bisect import bisect_left
+from collections.abc import Mapping
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+from Echoscribe.Core.dict_index import FIELDS, DictionaryIndex, LemmaMap
+from Echoscribe.Core.fulltext_index import FullTextIndex
+
+# Characters tried by fuzzy matching; ECDICT keys also contain phrases and hyphenated words
+FUZZY_ALPHABET = "abcdefghijklmnopqrstuvwxyz-' "
+
+
+def single_edits(word: str) -> Iterator[str]:
+    """Yield every string one deletion, transposition, substitution or insertion away from word."""
+    for i in range(len(word) + 1):
+        head, tail = word[:i], word[i:]
+        if tail:
+            yield head + tail[1:]
+            if len(tail) > 1:
+                yield head + tail[1] + tail[0] + tail[2:]
+            for c in FUZZY_ALPHABET:
+                if c != tail[0]:
+                    yield head + c + tail[1:]
+        for c in FUZZY_ALPHABET:
+            yield head + c + tail
+
+
+# Entry fields kept in memory; the rest are rarely used and re-read from the CSV on access
+EAGER_FIELDS = FIELDS[:11]
+LAZY_FIELDS = FIELDS[11:]
+# Columns with few distinct values, shared between entries
+# (single-character values such as collins and oxford already are)
+_POOLED_FIELDS = frozenset(("pos", "tag", "bnc", "frq"))
+_NO_LAZY_VALUES = ("",) * len(LAZY_FIELDS)
+
+
+class _RecordSource:
+    """Re-reads single records of a dictionary CSV by byte offset."""
+
+    def __init__(self, path: Path, columns: List[int]):
+        self.path = path
+        # Header positions of LAZY_FIELDS, -1 if a column is missing
+        self.columns = columns
+
+    def read(self, offset: int) -> Tuple[str, ...]:
+        with self.path.open("rb") as f:
+            f.seek(offset)
+            row = next(csv.reader(line.decode("utf-8") for line in f), [])
+        return tuple(row[c].strip() if 0 <= c < len(row) else "" for c in self.columns)
+
+
+class DictEntry(Mapping):
+    """
+    Compact in-memory dictionary entry: one slot per field instead of a
+    13-key dict, with repeated values shared between entries. The rarely used
+    audio and detail fields are only kept as the record's offset in the CSV
+    and loaded on first access. Reads like the dict entries of the compiled
+    index (entry.get(name), entry[name]).
+    """
+
+    __slots__ = EAGER_FIELDS + ("_lazy", "_source")
+
+    def __init__(self, values, lazy: Union[int, Tuple[str, ...]] = _NO_LAZY_VALUES,
+                 source: Optional[_RecordSource] = None):
+        """Initialize from EAGER_FIELDS values, plus the LAZY_FIELDS values or the CSV offset to read them from."""
+        (self.word, self.phonetic, self.pos, self.translation, self.definition, self.exchange,
+         self.collins, self.oxford, self.tag, self.bnc, self.frq) = values
+        self._lazy = lazy
+        self._source = source
+
+    def _lazy_values(self) -> Tuple[str, ...]:
+        lazy = self._lazy
+        if isinstance(lazy, int):
+            try:
+                lazy = self._source.read(lazy)
+            except (OSError, csv.Error) as e:
+                print(f"Warning: Cannot read dictionary record - {e}")
+                lazy = _NO_LAZY_VALUES
+            self._lazy = lazy
+        return lazy
+
+    def __getitem__(self, name: str) -> str:
+        if name in EAGER_FIELDS:
+            return getattr(self, name)
+        if name in LAZY_FIELDS:
+            return self._lazy_values()[LAZY_FIELDS.index(name)]
+        raise KeyError(name)
+
+    def get(self, name: str, default=None):
+        try:
+            return self[name]
+        except KeyError:
+            return default
+
+    def __iter__(self):
+        return iter(FIELDS)
+
+    def __len__(self) -> int:
+        return len(FIELDS)
+
+    def __repr__(self) -> str:
+        return f"DictEntry({self.word!r})"
 
 
 class Dictionary:
     """
     Simple local dictionary reader that reads from CSV: Assets/dict/ecdict.csv
-    Caches necessary fields, indexed by lowercase word.
+    Entries are served from a compiled memory-mapped index (see dict_index),
+    falling back to compact in-memory entries (DictEntry), indexed by lowercase word.
     """
 
-    def __init__(self, csv_path: Optional[Path] = None):
-        """Initialize dictionary with optional custom CSV path."""
-        self._entries: Dict[str, Dict[str, str]] = {}
-        self._load(csv_path)
+    def __init__(self, csv_path: Optional[Path] = None, index_path: Optional[Path] = None,
+                 use_index: bool = True):
+        """Initialize dictionary with optional custom CSV and index paths.
+
+        Args:
+            csv_path: ECDICT CSV file, defaults to Assets/dict/ecdict.csv
+            index_path: Compiled index location, defaults to the CSV path with an .idx suffix
+            use_index: Set False to always load the CSV into memory
+        """
+        self._entries: Dict[str, DictEntry] = {}
+        # Inflected form -> lemma key, used when there is no compiled index
+        self._lemmas: Dict[str, str] = {}
+        # Sorted keys of _entries for prefix search, built on first use
+        self._sorted_keys: Optional[List[str]] = None
+        # Optional inverted index over translations and definitions, see open_fulltext
+        self._fulltext: Optional[FullTextIndex] = None
+        self._index: Optional[DictionaryIndex] = None
+        path = Path(csv_path) if csv_path else self._default_csv_path()
+        if use_index and path.exists():
+            try:
+                self._index = DictionaryIndex.open_or_build(path, Path(index_path) if index_path
+                                                            else path.with_suffix(".idx"))
+            except Exception as e:
+                print(f"Warning: Dictionary index unavailable, loading CSV instead - {e}")
+                self._index = None
+        if self._index is None:
+            self._load(path)
 
     def _get_application_path(self) -> Path:
         """Get application root directory path."""
@@ -31,56 +156,56 @@ class Dictionary:
         if not path.exists():
             print(f"Warning: Dictionary file not found - {path}")
             return
-        try:
-            # Try UTF-8 encoding first
-            with path.open("r", encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    word = (row.get("word") or "").strip()
-                    if not word:
-                        continue
-                    key = word.lower()
-                    entry = {
-                        "word": word,
-                        "phonetic": (row.get("phonetic") or "").strip(),
-                        "pos": (row.get("pos") or "").strip(),
-                        "translation": (row.get("translation") or "").strip(),
-                        "definition": (row.get("definition") or "").strip(),
-                        "exchange": (row.get("exchange") or "").strip(),
-                        "collins": (row.get("collins") or "").strip(),
-                        "oxford": (row.get("oxford") or "").strip(),
-                        "tag": (row.get("tag") or "").strip(),
-                        "bnc": (row.get("bnc") or "").strip(),
-                        "frq": (row.get("frq") or "").strip(),
-                        "audio": (row.get("audio") or "").strip(),
-                        "detail": (row.get("detail") or "").strip(),
-                    }
-                    self._entries[key] = entry
-        except UnicodeDecodeError:
-            # Fallback to UTF-8-SIG for BOM files
-            with path.open("r", encoding="utf-8-sig") as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    word = (row.get("word") or "").strip()
-                    if not word:
-                        continue
-                    key = word.lower()
-                    entry = {
-                        "word": word,
-                        "phonetic": (row.get("phonetic") or "").strip(),
-                        "pos": (row.get("pos") or "").strip(),
-                        "translation": (row.get("translation") or "").strip(),
-                        "definition": (row.get("definition") or "").strip(),
-                        "exchange": (row.get("exchange") or "").strip(),
-                        "collins": (row.get("collins") or "").strip(),
-                        "oxford": (row.get("oxford") or "").strip(),
-                        "tag": (row.get("tag") or "").strip(),
-                        "bnc": (row.get("bnc") or "").strip(),
-                        "frq": (row.get("frq") or "").strip(),
-                        "audio": (row.get("audio") or "").strip(),
-                        "detail": (row.get("detail") or "").strip(),
-                    }
-                    self._entries[key] = entry
+        # Read as bytes to know where each record starts, for the lazily loaded fields
+        with path.open("rb") as f:
+            position = [0]
+
+            def lines():
+                for line in f:
+                    position[0] += len(line)
+                    yield line.decode("utf-8")
+
+            reader = csv.reader(lines())
+            # Files saved with a BOM keep it in front of the first column name
+            header = [name.strip().lstrip("\ufeff") for name in next(reader, [])]
+            columns = [header.index(name) if name in header else -1 for name in FIELDS]
+            self._load_rows(reader, columns, position, _RecordSource(path, columns[len(EAGER_FIELDS):]))
+
+    def _load_rows(self, reader, columns: List[int], position: List[int], source: _RecordSource):
+        """Build entries from CSV records; position[0] is the byte offset of the next unread record."""
+        lemma_map = LemmaMap()
+        pool: Dict[str, str] = {}
+        pooled = [i for i, name in enumerate(EAGER_FIELDS) if name in _POOLED_FIELDS]
+        # A missing column reads index -1, the empty string appended to every row
+        eager_values = itemgetter(*columns[:len(EAGER_FIELDS)])
+        lazy_values = itemgetter(*columns[len(EAGER_FIELDS):])
+        entries = self._entries
+        while True:
+            offset = position[0]
+            row = next(reader, None)
+            if row is None:
+                break
+            row.append("")
+            try:
+                values = [v.strip() for v in eager_values(row)]
+                has_lazy = any(lazy_values(row))
+            except IndexError:
+                # Short record: absent trailing columns are empty
+                size = len(row)
+                values = [row[c].strip() if c < size else "" for c in columns[:len(EAGER_FIELDS)]]
+                has_lazy = any(row[c] for c in columns[len(EAGER_FIELDS):] if c < size)
+            word = values[0]
+            if not word:
+                continue
+            for i in pooled:
+                value = values[i]
+                values[i] = pool.setdefault(value, value)
+            # Only remember where audio/detail are when the record actually has them
+            entry = DictEntry(values, offset if has_lazy else _NO_LAZY_VALUES, source)
+            entries[word.lower()] = entry
+            if entry.exchange:
+                lemma_map.add(word, entry.exchange, entry.frq)
+        self._lemmas = lemma_map.resolve(entries)
 
     def lookup(self, word: str) -> Optional[Dict[str, str]]:
         """Look up a word in the dictionary.
@@ -93,6 +218,107 @@ class Dictionary:
         """
         if not word:
             return None
-        return self._entries.get(word.strip().lower())
+        key = word.strip().lower()
+        if self._index is not None:
+            return self._index.lookup(key)
+        return self._entries.get(key)
+
+    def lookup_lemma(self, word: str) -> Optional[Dict[str, str]]:
+        """Look up the lemma entry of an inflected form, e.g. "go" for "went".
+
+        Returns:
+            The lemma's entry, or None if word is not a known inflection
+        """
+        if not word:
+            return None
+        key = word.strip().lower()
+        if self._index is not None:
+            return self._index.lookup_lemma(key)
+        lemma = self._lemmas.get(key)
+        return self._entries.get(lemma) if lemma else None
+
+    def lookup_with_lemma(self, word: str) -> Tuple[Optional[Dict[str, str]], Optional[Dict[str, str]]]:
+        """Look up a word and the lemma it is an inflection of.
+
+        Returns:
+            Tuple of (surface entry, lemma entry); either may be None
+        """
+        return self.lookup(word), self.lookup_lemma(word)
+
+    def lookup_many(self, words) -> Dict[str, Tuple[Optional[Dict[str, str]], Optional[Dict[str, str]]]]:
+        """Look up many words at once, e.g. every distinct token of a transcript.
+
+        Returns:
+            {normalized key: (surface entry, lemma entry)} for every non-empty key
+        """
+        keys = {w.strip().lower() for w in words if w}
+        keys.discard("")
+        if self._index is None:
+            return {k: (self._entries.get(k), self._entries.get(self._lemmas.get(k, ""))) for k in keys}
+        index = self._index
+        rows = index.find_many(keys)
+        results = {}
+        for key in keys:
+            row = rows.get(key, -1)
+            lemma_row = index.lemma_row(key)
+            results[key] = (index.entry_at(row) if row >= 0 else None,
+                            index.entry_at(lemma_row) if lemma_row >= 0 else None)
+        return results
+
+    def complete(self, prefix: str, limit: int = 20) -> List[str]:
+        """Return up to limit dictionary keys starting with prefix, in sorted order."""
+        prefix = prefix.strip().lower()
+        if not prefix:
+            return []
+        if self._index is not None:
+            return self._index.prefix_keys(prefix, limit)
+        if self._sorted_keys is None:
+            self._sorted_keys = sorted(self._entries)
+        keys = []
+        i = bisect_left(self._sorted_keys, prefix)
+        while i < len(self._sorted_keys) and len(keys) < limit and self._sorted_keys[i].startswith(prefix):
+            keys.append(self._sorted_keys[i])
+            i += 1
+        return keys
 
+    def suggest(self, word: str, limit: int = 10) -> List[str]:
+        """Return up to limit dictionary keys within edit distance 1 of word, in sorted order."""
+        key = word.strip().lower()
+        if len(key) < 2:
+            return []
+        candidates = set(single_edits(key))
+        candidates.discard(key)
+        if self._index is not None:
+            found = self._index.existing_keys(candidates)
+        else:
+            found = sorted(c for c in candidates if c in self._entries)
+        return found[:limit]
 
+    def open_fulltext(self, index_path: Path) -> FullTextIndex:
+        """Open the full-text index, compiling it first when missing or stale.
+
+        Compiling reads every entry and can take a while, so call this from a
+        background thread. Requires the compiled dictionary index.
+        """
+        if self._index is None:
+            raise RuntimeError("Full-text search requires the compiled dictionary index")
+        self._fulltext = FullTextIndex.open_or_build(self._index, index_path)
+        return self._fulltext
+
+    def search_text(self, query: str, limit: int = 30) -> List[Tuple[Dict[str, str], float]]:
+        """Find entries whose translation or definition matches query.
+
+        Returns:
+            Up to limit (entry, score) tuples, best first; entries containing the
+            query verbatim rank above those matching only some of its terms
+        """
+        if self._fulltext is None or not query.strip():
+            return []
+        q = query.strip().lower()
+        ranked = []
+        for row, score in self._fulltext.search(q, limit * 4):
+            entry = self._index.entry_at(row)
+            verbatim = q in entry.get("translation", "").lower() or q in entry.get("definition", "").lower()
+            ranked.append((verbatim, score, entry))
+        ranked.sort(key=lambda r: (r[0], r[1]), reverse=True)
+        return [(entry, score) for _, score, entry in ranked[:limit]]
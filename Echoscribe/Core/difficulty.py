@@ -0,0 +1,73 @@
+from typing import Dict, Iterable, Mapping, Optional
+
+from Echoscribe.Core.vocab_annotator import WordAnnotation, normalize_word
+
+# Difficulty tiers, stored one byte per transcript word
+TIER_UNKNOWN = 0  # not a dictionary word (names, numbers, recognition errors)
+TIER_BASIC = 1  # school vocabulary, most frequent words
+TIER_INTERMEDIATE = 2  # CET-4
+TIER_ADVANCED = 3  # CET-6 / postgraduate entrance
+TIER_EXPERT = 4  # IELTS / TOEFL / GRE, rare words
+TIER_COUNT = 5
+TIER_NAMES = ("unknown", "basic", "intermediate", "advanced", "expert")
+
+# ECDICT exam tags; a word in several lists takes its easiest tier
+TAG_TIERS = {
+    "zk": TIER_BASIC, "gk": TIER_BASIC,
+    "cet4": TIER_INTERMEDIATE,
+    "cet6": TIER_ADVANCED, "ky": TIER_ADVANCED,
+    "ielts": TIER_EXPERT, "toefl": TIER_EXPERT, "gre": TIER_EXPERT,
+}
+# Upper bounds of the frq/bnc frequency rank of each tier
+RANK_TIERS = ((3000, TIER_BASIC), (8000, TIER_INTERMEDIATE), (15000, TIER_ADVANCED))
+# Collins star ratings (5 = most common)
+COLLINS_TIERS = {5: TIER_BASIC, 4: TIER_BASIC, 3: TIER_INTERMEDIATE, 2: TIER_ADVANCED, 1: TIER_EXPERT}
+
+
+def tier_of(annotation: Optional[WordAnnotation]) -> int:
+    """Difficulty tier of one word from its exam tags, frequency ranks, Collins stars and Oxford 3000 flag."""
+    if annotation is None or not annotation.found:
+        return TIER_UNKNOWN
+    candidates = [TAG_TIERS[t] for t in annotation.tags if t in TAG_TIERS]
+    ranks = [r for r in (annotation.frq, annotation.bnc) if r > 0]
+    if ranks:
+        rank = min(ranks)
+        candidates.append(next((tier for bound, tier in RANK_TIERS if rank <= bound), TIER_EXPERT))
+    if annotation.collins in COLLINS_TIERS:
+        candidates.append(COLLINS_TIERS[annotation.collins])
+    if annotation.oxford:
+        candidates.append(TIER_INTERMEDIATE)
+    # A dictionary word without any frequency information is a rare one
+    return min(candidates) if candidates else TIER_EXPERT
+
+
+def compute_tiers(words: Iterable[str], annotations: Mapping[str, WordAnnotation]) -> bytearray:
+    """Tier of every transcript word, in transcript order.
+
+    Each distinct word text is normalized and classified once; the per-word
+    pass is a single dict lookup.
+    """
+    word_tiers: Dict[str, int] = {}
+    tiers = bytearray()
+    for word in words:
+        tier = word_tiers.get(word)
+        if tier is None:
+            tier = word_tiers[word] = tier_of(annotations.get(normalize_word(word)))
+        tiers.append(tier)
+    return tiers
+
+
+def tier_summary(tiers: bytes) -> Dict[str, int]:
+    """Number of words in each tier, counted over the whole tier array at once."""
+    return {name: tiers.count(tier) for tier, name in enumerate(TIER_NAMES)}
+
+
+def format_summary(tiers: bytes) -> str:
+    """Human-readable distribution, e.g. "basic 71% · intermediate 14% · ... (12% above CET-4)"."""
+    counts = tier_summary(tiers)
+    known = len(tiers) - counts["unknown"]
+    if not known:
+        return "No dictionary words"
+    parts = [f"{name} {counts[name] * 100 / known:.0f}%" for name in TIER_NAMES[1:]]
+    hard = counts["advanced"] + counts["expert"]
+    return " · ".join(parts) + f" ({hard} of {known} words above CET-4)"
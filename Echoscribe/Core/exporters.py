@@ -0,0 +1,157 @@
+"""
+EchoScribe Transcript Export
+
+Writes word-level transcripts as SubRip (.srt) or WebVTT (.vtt) subtitles,
+JSON Lines (.jsonl, one word object per line) or tab-separated values (.tsv).
+Every format is a generator of text chunks over the word dicts produced by
+Transcriber.iter_word_batches or TranscriptStore.iter_dicts, so a transcript
+is written as it is read and the document never exists as one string.
+"""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, Optional, TextIO, Tuple
+
+# Subtitle cues follow the recognizer's segments, split further to stay readable
+MAX_CUE_CHARS = 84
+MAX_CUE_MS = 7000
+TSV_COLUMNS = ("start_ms", "end_ms", "segment", "probability", "word")
+# Keep one TSV record per line
+_TSV_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+Cue = Tuple[int, int, str]
+
+
+def format_timestamp(ms: int, separator: str = ",") -> str:
+    """HH:MM:SS,mmm as used by SRT (separator '.' for WebVTT)."""
+    seconds, millis = divmod(max(0, int(ms)), 1000)
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}{separator}{millis:03d}"
+
+
+def iter_cues(words: Iterable[Dict], max_chars: int = MAX_CUE_CHARS, max_ms: int = MAX_CUE_MS) -> Iterator[Cue]:
+    """Group consecutive words into subtitle cues of (start ms, end ms, text).
+
+    A cue ends with its segment, or earlier once it would exceed max_chars
+    characters or last longer than max_ms.
+    """
+    parts = []
+    length = 0
+    segment = start = end = None
+    for w in words:
+        text = w.get('word', '')
+        word_start = w.get('start_ms', 0)
+        word_end = w.get('end_ms', word_start)
+        if parts and (w.get('segment') != segment or length + len(text) > max_chars
+                      or word_end - start > max_ms):
+            cue_text = "".join(parts).strip()
+            if cue_text:
+                yield start, end, cue_text
+            parts = []
+            length = 0
+        if not parts:
+            segment = w.get('segment')
+            start = word_start
+        parts.append(text)
+        length += len(text)
+        end = max(word_end, start)
+    if parts:
+        cue_text = "".join(parts).strip()
+        if cue_text:
+            yield start, end, cue_text
+
+
+def iter_srt(words: Iterable[Dict]) -> Iterator[str]:
+    for number, (start, end, text) in enumerate(iter_cues(words), 1):
+        yield f"{number}\n{format_timestamp(start)} --> {format_timestamp(end)}\n{text}\n\n"
+
+
+def iter_vtt(words: Iterable[Dict]) -> Iterator[str]:
+    yield "WEBVTT\n\n"
+    for start, end, text in iter_cues(words):
+        yield f"{format_timestamp(start, '.')} --> {format_timestamp(end, '.')}\n{text}\n\n"
+
+
+def iter_jsonl(words: Iterable[Dict]) -> Iterator[str]:
+    # One encoder for all lines; json.dumps with options builds a new one per call
+    encode = json.JSONEncoder(ensure_ascii=False).encode
+    for w in words:
+        yield encode(w) + "\n"
+
+
+def iter_tsv(words: Iterable[Dict]) -> Iterator[str]:
+    yield "\t".join(TSV_COLUMNS) + "\n"
+    for w in words:
+        probability = w.get('probability')
+        segment = w.get('segment')
+        yield (f"{w.get('start_ms', 0)}\t{w.get('end_ms', '')}\t{'' if segment is None else segment}\t"
+               f"{'' if probability is None else probability}\t"
+               f"{w.get('word', '').strip().translate(_TSV_ESCAPES)}\n")
+
+
+# Format name -> (chunk generator, file suffix, file dialog description)
+FORMATS: Dict[str, Tuple[Callable[[Iterable[Dict]], Iterator[str]], str, str]] = {
+    "srt": (iter_srt, ".srt", "SubRip Subtitles"),
+    "vtt": (iter_vtt, ".vtt", "WebVTT Subtitles"),
+    "jsonl": (iter_jsonl, ".jsonl", "JSON Lines"),
+    "tsv": (iter_tsv, ".tsv", "Tab-Separated Values"),
+}
+
+
+def format_for_path(path: Path) -> Optional[str]:
+    """Export format implied by a file suffix, or None."""
+    suffix = Path(path).suffix.lower()
+    return next((name for name, (_, fmt_suffix, _) in FORMATS.items() if fmt_suffix == suffix), None)
+
+
+def write_export(words: Iterable[Dict], out: TextIO, fmt: str) -> int:
+    """Stream words to an open text file in the given format.
+
+    Returns:
+        Number of characters written
+
+    Raises:
+        ValueError: If the format is unknown
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown export format: {fmt}")
+    written = 0
+    write = out.write
+    for chunk in FORMATS[fmt][0](words):
+        write(chunk)
+        written += len(chunk)
+    return written
+
+
+def export_file(words: Iterable[Dict], path: Path, fmt: Optional[str] = None) -> Path:
+    """Export to a file, replacing it atomically so a failed export never leaves a truncated file.
+
+    Args:
+        words: Word dicts in playback order; consumed once
+        path: Destination file
+        fmt: Format name, or None to pick it from the file suffix
+
+    Raises:
+        ValueError: If the format is unknown or cannot be inferred
+    """
+    path = Path(path)
+    fmt = fmt or format_for_path(path)
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown export format for {path.name}: {fmt}")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=str(path.parent), suffix=".tmp")
+    try:
+        # newline="" keeps "\n" line endings on every platform
+        with os.fdopen(fd, "w", encoding="utf-8", newline="") as out:
+            write_export(words, out, fmt)
+        os.replace(tmp_name, path)
+    except Exception:
+        try:
+            os.remove(tmp_name)
+        except OSError:
+            pass
+        raise
+    return path
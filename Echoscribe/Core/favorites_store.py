@@ -0,0 +1,107 @@
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS favorites (
+    word TEXT PRIMARY KEY,
+    added_at REAL NOT NULL,
+    source_file TEXT,
+    position_ms INTEGER,
+    review_count INTEGER NOT NULL DEFAULT 0,
+    last_reviewed_at REAL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS favorites_added_at ON favorites (added_at);
+"""
+
+
+class FavoritesStore:
+    """
+    Favorite words in a local SQLite database, one row per word with metadata:
+    when and from which audio file (and position) it was added, and how often
+    it was reviewed. Every change is a single-row insert, update or delete.
+    Membership tests are served from an in-memory set, as the transcript
+    renderer checks every word.
+    """
+
+    SCHEMA_VERSION = 1
+
+    def __init__(self, db_path: Path):
+        """Open (or create) the database."""
+        self.path = Path(db_path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Autocommit: each statement is its own small transaction
+        self._db = sqlite3.connect(str(self.path), isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+        self._db.execute(f"PRAGMA user_version={self.SCHEMA_VERSION}")
+        self._words = {row[0] for row in self._db.execute("SELECT word FROM favorites")}
+
+    def __contains__(self, word: str) -> bool:
+        return word in self._words
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._words)
+
+    def words(self) -> List[str]:
+        """All favorite words, sorted."""
+        return sorted(self._words)
+
+    def migrate_json(self, json_path: Path) -> int:
+        """Import the word list of a favorites.json file in one transaction.
+
+        Returns:
+            Number of words imported
+        """
+        json_path = Path(json_path)
+        with json_path.open("r", encoding="utf-8") as f:
+            data = json.load(f)
+        words = [w for w in data if isinstance(w, str) and w] if isinstance(data, list) else []
+        added_at = json_path.stat().st_mtime
+        with self._db:
+            self._db.execute("BEGIN")
+            self._db.executemany("INSERT OR IGNORE INTO favorites (word, added_at) VALUES (?, ?)",
+                                 [(w, added_at) for w in words])
+        self._words.update(words)
+        return len(words)
+
+    def add(self, word: str, source_file: Optional[str] = None, position_ms: Optional[int] = None) -> bool:
+        """Add a word with where it was found; returns False if it already was a favorite."""
+        if word in self._words:
+            return False
+        self._db.execute("INSERT OR IGNORE INTO favorites (word, added_at, source_file, position_ms) "
+                         "VALUES (?, ?, ?, ?)", (word, time.time(), source_file, position_ms))
+        self._words.add(word)
+        return True
+
+    def remove(self, word: str) -> bool:
+        """Remove a word; returns False if it was not a favorite."""
+        if word not in self._words:
+            return False
+        self._db.execute("DELETE FROM favorites WHERE word = ?", (word,))
+        self._words.discard(word)
+        return True
+
+    def record_review(self, word: str):
+        """Count one review of a favorite, e.g. opening its details."""
+        if word in self._words:
+            self._db.execute("UPDATE favorites SET review_count = review_count + 1, last_reviewed_at = ? "
+                             "WHERE word = ?", (time.time(), word))
+
+    def info(self, word: str) -> Optional[Dict]:
+        """Metadata of a favorite, or None if the word is not one."""
+        row = self._db.execute("SELECT word, added_at, source_file, position_ms, review_count, last_reviewed_at "
+                               "FROM favorites WHERE word = ?", (word,)).fetchone()
+        if row is None:
+            return None
+        return dict(zip(("word", "added_at", "source_file", "position_ms", "review_count",
+                         "last_reviewed_at"), row))
+
+    def close(self):
+        self._db.close()
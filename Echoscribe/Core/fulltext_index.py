@@ -0,0 +1,266 @@
+import heapq
+import math
+import mmap
+import os
+import re
+import struct
+import sys
+import tempfile
+from array import array
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from Echoscribe.Core.dict_index import DictionaryIndex
+
+# Postings are weighted per field: a hit in the Chinese translation counts double
+FIELD_WEIGHTS = (("translation", 2), ("definition", 1))
+# English tokens too common in definitions to be useful, plus ECDICT part-of-speech markers
+STOPWORDS = frozenset("""
+    a an and are as at be by for from in is it of on or that the to with
+    adj adv art abbr aux conj int num pl prep pron vi vt
+""".split())
+
+# English words, or runs of CJK ideographs
+_TOKEN_RE = re.compile(r"[a-z0-9]+|[\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff]+")
+
+# magic, version, document count, term count, dictionary source sha1,
+# term table offset, term blob offset, docs offset, weights offset, doc lengths offset
+_HEADER = struct.Struct("<4sIII20sQQQQQ")
+# term offset, term length, first posting, posting count
+_TERM_ROW = struct.Struct("<IIII")
+
+
+def _is_cjk(ch: str) -> bool:
+    return ch >= "\u3400"
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into index terms: English words, and for runs of Chinese
+    characters every single character plus every overlapping bigram."""
+    terms = []
+    for match in _TOKEN_RE.finditer(text.lower()):
+        run = match.group()
+        if _is_cjk(run[0]):
+            terms.extend(run)
+            terms.extend(run[i:i + 2] for i in range(len(run) - 1))
+        elif len(run) > 1 and run not in STOPWORDS:
+            terms.append(run)
+    return terms
+
+
+def query_terms(query: str) -> List[str]:
+    """Split a query into terms; multi-character Chinese runs use bigrams only."""
+    terms = []
+    for match in _TOKEN_RE.finditer(query.lower()):
+        run = match.group()
+        if _is_cjk(run[0]):
+            if len(run) == 1:
+                terms.append(run)
+            else:
+                terms.extend(run[i:i + 2] for i in range(len(run) - 1))
+        else:
+            terms.append(run)
+    return list(dict.fromkeys(terms))
+
+
+class FullTextIndex:
+    """
+    Memory-mapped inverted index over the translation and definition fields of
+    a compiled DictionaryIndex. Documents are dictionary rows; each term maps to
+    a row-sorted posting list of (row, weighted term frequency). Queries are
+    ranked with BM25, preferring rows that contain more of the query terms.
+    """
+
+    MAGIC = b"ECFT"
+    VERSION = 1
+    # BM25 parameters
+    K1 = 1.2
+    B = 0.75
+
+    def __init__(self, index_path: Path):
+        """Open and validate a compiled full-text index."""
+        self.path = Path(index_path)
+        self._file = self.path.open("rb")
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._file.close()
+            raise
+        (magic, version, self.doc_count, self._term_count, self.source_sha1, self._terms_offset,
+         self._blob_offset, self._docs_offset, self._weights_offset,
+         self._lengths_offset) = _HEADER.unpack_from(self._mm, 0)
+        if magic != self.MAGIC or version != self.VERSION:
+            self.close()
+            raise ValueError(f"Unsupported full-text index: {self.path}")
+        self._doc_lengths = array('H')
+        self._doc_lengths.frombytes(self._mm[self._lengths_offset:self._lengths_offset + 2 * self.doc_count])
+        self._avg_length = (sum(self._doc_lengths) / self.doc_count) if self.doc_count else 1.0
+
+    def close(self):
+        """Release the memory map and file handle."""
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        self._file.close()
+
+    @classmethod
+    def is_current(cls, index_path: Path, dict_index: DictionaryIndex) -> bool:
+        """Check whether the index was compiled from the same dictionary content."""
+        try:
+            with open(index_path, "rb") as f:
+                header = _HEADER.unpack(f.read(_HEADER.size))
+        except (OSError, struct.error):
+            return False
+        return (header[0] == cls.MAGIC and header[1] == cls.VERSION
+                and header[2] == len(dict_index) and header[4] == dict_index.source_sha1)
+
+    @classmethod
+    def open_or_build(cls, dict_index: DictionaryIndex, index_path: Path) -> "FullTextIndex":
+        """Open the full-text index of a dictionary, compiling it first when missing or stale."""
+        index_path = Path(index_path)
+        if not cls.is_current(index_path, dict_index):
+            print(f"Compiling full-text index: {index_path}")
+            cls.compile(dict_index, index_path)
+        return cls(index_path)
+
+    @classmethod
+    def compile(cls, dict_index: DictionaryIndex, index_path: Path) -> int:
+        """Compile the inverted index of a dictionary.
+
+        Args:
+            dict_index: Compiled dictionary whose rows become the documents
+            index_path: Destination file, replaced atomically
+
+        Returns:
+            Number of distinct terms written
+        """
+        index_path = Path(index_path)
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Rows are visited in order, so every posting list comes out sorted by row
+        postings: Dict[str, Tuple[array, array]] = {}
+        doc_lengths = array('H')
+        for row in range(len(dict_index)):
+            entry = dict_index.entry_at(row)
+            counts: Dict[str, int] = {}
+            for field, weight in FIELD_WEIGHTS:
+                for term in tokenize(entry.get(field, "")):
+                    counts[term] = counts.get(term, 0) + weight
+            doc_lengths.append(min(sum(counts.values()), 0xFFFF))
+            for term, weight in counts.items():
+                lists = postings.get(term)
+                if lists is None:
+                    lists = postings[term] = (array('I'), array('H'))
+                lists[0].append(row)
+                lists[1].append(min(weight, 0xFFFF))
+
+        terms = sorted(postings)
+        term_table = bytearray(_TERM_ROW.size * len(terms))
+        term_blob = bytearray()
+        first = 0
+        for i, term in enumerate(terms):
+            term_bytes = term.encode("utf-8")
+            count = len(postings[term][0])
+            _TERM_ROW.pack_into(term_table, i * _TERM_ROW.size, len(term_blob), len(term_bytes), first, count)
+            term_blob += term_bytes
+            first += count
+
+        terms_offset = _HEADER.size
+        blob_offset = terms_offset + len(term_table)
+        docs_offset = blob_offset + len(term_blob)
+        weights_offset = docs_offset + 4 * first
+        lengths_offset = weights_offset + 2 * first
+        header = _HEADER.pack(cls.MAGIC, cls.VERSION, len(doc_lengths), len(terms), dict_index.source_sha1,
+                              terms_offset, blob_offset, docs_offset, weights_offset, lengths_offset)
+
+        fd, tmp_name = tempfile.mkstemp(dir=str(index_path.parent), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as out:
+                out.write(header)
+                out.write(term_table)
+                out.write(term_blob)
+                for term in terms:
+                    postings[term][0].tofile(out)
+                for term in terms:
+                    postings[term][1].tofile(out)
+                doc_lengths.tofile(out)
+            os.replace(tmp_name, index_path)
+        except Exception:
+            try:
+                os.remove(tmp_name)
+            except OSError:
+                pass
+            raise
+        return len(terms)
+
+    def _term_at(self, i: int) -> bytes:
+        term_offset, term_length, _, _ = _TERM_ROW.unpack_from(self._mm, self._terms_offset + i * _TERM_ROW.size)
+        start = self._blob_offset + term_offset
+        return self._mm[start:start + term_length]
+
+    def _find(self, term: str) -> int:
+        term_bytes = term.encode("utf-8")
+        lo, hi = 0, self._term_count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._term_at(mid) < term_bytes:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self._term_count and self._term_at(lo) == term_bytes:
+            return lo
+        return -1
+
+    def postings(self, term: str) -> Tuple[array, array]:
+        """Return (rows, weights) of a term; both empty if the term is not indexed."""
+        rows, weights = array('I'), array('H')
+        i = self._find(term)
+        if i >= 0:
+            _, _, first, count = _TERM_ROW.unpack_from(self._mm, self._terms_offset + i * _TERM_ROW.size)
+            start = self._docs_offset + 4 * first
+            rows.frombytes(self._mm[start:start + 4 * count])
+            start = self._weights_offset + 2 * first
+            weights.frombytes(self._mm[start:start + 2 * count])
+        return rows, weights
+
+    def search(self, query: str, limit: int = 30) -> List[Tuple[int, float]]:
+        """Rank dictionary rows for a query.
+
+        Returns:
+            Up to limit (row, score) tuples, rows matching more query terms
+            first, then by descending BM25 score
+        """
+        scores: Dict[int, float] = {}
+        matched: Dict[int, int] = {}
+        lengths = self._doc_lengths
+        norm = self.K1 / self._avg_length
+        for term in query_terms(query):
+            rows, weights = self.postings(term)
+            if not rows:
+                continue
+            idf = math.log(1.0 + (self.doc_count - len(rows) + 0.5) / (len(rows) + 0.5))
+            for row, weight in zip(rows, weights):
+                tf_norm = weight * (self.K1 + 1) / (weight + self.K1 * (1 - self.B) + norm * self.B * lengths[row])
+                scores[row] = scores.get(row, 0.0) + idf * tf_norm
+                matched[row] = matched.get(row, 0) + 1
+        best = heapq.nlargest(limit, scores, key=lambda row: (matched[row], scores[row]))
+        return [(row, scores[row]) for row in best]
+
+
+def main(argv=None):
+    """Compile the dictionary and full-text indexes ahead of time."""
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) != 3:
+        print("Usage: python -m Echoscribe.Core.fulltext_index <ecdict.csv> <ecdict.idx> <output.fts>")
+        return 2
+    dict_index = DictionaryIndex.open_or_build(Path(argv[0]), Path(argv[1]))
+    try:
+        count = FullTextIndex.compile(dict_index, Path(argv[2]))
+    finally:
+        dict_index.close()
+    print(f"Wrote {count} terms to {argv[2]}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
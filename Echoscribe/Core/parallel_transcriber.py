@@ -0,0 +1,246 @@
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from typing import Dict, List, Optional, Tuple
+
+from faster_whisper import WhisperModel, decode_audio
+from faster_whisper.vad import VadOptions, get_speech_timestamps
+
+SAMPLE_RATE = 16000
+
+# Model instance owned by each pool worker process
+_worker_model = None
+
+
+def _init_worker(model_path: str, device: str, compute_type: str, cpu_threads: int):
+    """Load one Whisper model per worker process."""
+    global _worker_model
+    _worker_model = WhisperModel(model_path, device=device, compute_type=compute_type,
+                                 cpu_threads=cpu_threads)
+
+
+# (word, start_ms, end_ms, probability, segment index within the chunk)
+ChunkWord = Tuple[str, int, int, Optional[float], int]
+
+
+def _decode_words(model, audio, offset_ms: int, decode_options: Dict) -> List[ChunkWord]:
+    """Transcribe a sample array and return its words with times shifted by a global offset."""
+    segments, _ = model.transcribe(audio, **decode_options)
+    words = []
+    for segment_index, segment in enumerate(segments):
+        for word in segment.words or []:
+            start_sec = getattr(word, 'start', None)
+            if start_sec is None:
+                start_sec = getattr(segment, 'start', 0.0)
+            end_sec = getattr(word, 'end', None)
+            if end_sec is None:
+                end_sec = start_sec
+            start_ms = offset_ms + int(max(0.0, float(start_sec)) * 1000)
+            end_ms = offset_ms + int(max(0.0, float(end_sec)) * 1000)
+            words.append((word.word, start_ms, max(start_ms, end_ms),
+                          getattr(word, 'probability', None), segment_index))
+    return words
+
+
+def _transcribe_chunk(index: int, offset_ms: int, audio, decode_options: Dict):
+    """Pool task: transcribe one chunk with the worker's model."""
+    return index, _decode_words(_worker_model, audio, offset_ms, decode_options)
+
+
+class ParallelTranscriber:
+    """
+    Transcribes long audio by splitting it at silence boundaries and decoding
+    the chunks concurrently in a process pool, one Whisper model per worker.
+    Short files fall back to the shared in-process model of the Transcriber.
+    """
+
+    def __init__(self, transcriber, workers: int = 0, cpu_threads: int = 4,
+                 min_duration_s: float = 600.0, target_chunk_s: float = 120.0,
+                 max_chunk_s: float = 180.0, overlap_s: float = 1.0):
+        """Initialize the engine.
+
+        Args:
+            transcriber: Loaded Transcriber providing model path and decode options
+            workers: Number of worker processes, 0 chooses from the CPU count
+            cpu_threads: CTranslate2 threads per worker model
+            min_duration_s: Audio shorter than this is decoded serially
+            target_chunk_s: Preferred chunk length, cut at the next silence
+            max_chunk_s: Hard chunk limit when no silence is found
+            overlap_s: Overlap added to hard cuts, removed again when stitching
+        """
+        self.transcriber = transcriber
+        self.cpu_threads = max(1, int(cpu_threads))
+        if workers <= 0:
+            workers = max(1, (os.cpu_count() or 1) // self.cpu_threads)
+        self.workers = int(workers)
+        self.min_duration_s = min_duration_s
+        self.target_chunk_s = target_chunk_s
+        self.max_chunk_s = max(max_chunk_s, target_chunk_s)
+        self.overlap_s = overlap_s
+        self.last_stats: Optional[Dict] = None
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def enabled(self) -> bool:
+        """Whether more than one worker is configured."""
+        return self.workers > 1
+
+    def cache_params(self):
+        """Transcriber cache parameters plus the chunking, which changes segmentation and timestamps.
+
+        Returns:
+            Dictionary suitable for building transcript cache keys
+        """
+        params = self.transcriber.cache_params()
+        if self.enabled:
+            params["engine"] = {
+                "name": "parallel",
+                "workers": self.workers,
+                "min_duration_s": self.min_duration_s,
+                "target_chunk_s": self.target_chunk_s,
+                "max_chunk_s": self.max_chunk_s,
+                "overlap_s": self.overlap_s,
+            }
+        return params
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        # Workers stay alive between files so their models are loaded only once
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(str(self.transcriber.model_path), self.transcriber.DEVICE,
+                          self.transcriber.compute_type, self.cpu_threads),
+            )
+        return self._pool
+
+    def shutdown(self):
+        """Stop the worker processes."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
+
+    def split_chunks(self, audio) -> List[Tuple[int, int]]:
+        """Split samples into (start, end) chunks cut inside silent gaps.
+
+        Args:
+            audio: Mono float samples at 16 kHz
+
+        Returns:
+            List of sample ranges covering the whole audio
+        """
+        total = len(audio)
+        target = int(self.target_chunk_s * SAMPLE_RATE)
+        hard_limit = int(self.max_chunk_s * SAMPLE_RATE)
+        overlap = int(self.overlap_s * SAMPLE_RATE)
+        speech = get_speech_timestamps(audio, VadOptions(min_silence_duration_ms=300))
+
+        # Candidate cut points are the middles of the gaps between speech regions
+        cut_points = []
+        for prev, nxt in zip(speech, speech[1:]):
+            cut_points.append((prev['end'] + nxt['start']) // 2)
+
+        chunks = []
+        start = 0
+        cut_iter = iter(cut_points)
+        next_cut = next(cut_iter, None)
+        while total - start > hard_limit:
+            # Skip cut points that would make the chunk too short
+            while next_cut is not None and next_cut - start < target:
+                next_cut = next(cut_iter, None)
+            if next_cut is not None and next_cut - start <= hard_limit:
+                chunks.append((start, next_cut))
+                start = next_cut
+            else:
+                # Continuous speech: force a cut and overlap the next chunk
+                end = start + hard_limit
+                chunks.append((start, end))
+                start = end - overlap
+        chunks.append((start, total))
+        return chunks
+
+    @staticmethod
+    def _stitch(previous: List[ChunkWord], words: List[ChunkWord]):
+        """Drop words at the head of a chunk that repeat the tail of the previous one."""
+        if not previous:
+            return words
+        last_end = previous[-1][2]
+        recent = {w[0].strip().lower() for w in previous[-8:]}
+        kept_from = 0
+        for i, w in enumerate(words):
+            text, start_ms = w[0], w[1]
+            # Words inside the overlap were already emitted by the previous chunk
+            if start_ms < last_end - 100 or (start_ms <= last_end + 200 and text.strip().lower() in recent):
+                kept_from = i + 1
+                continue
+            break
+        return words[kept_from:]
+
+    def iter_word_batches(self, audio_file_path):
+        """Decode audio and yield chunk words in order as chunks complete.
+
+        Args:
+            audio_file_path: Path to the audio file to transcribe
+
+        Yields:
+            Tuple of (words, progress) matching Transcriber.iter_word_batches
+        """
+        started_at = time.perf_counter()
+        audio = decode_audio(str(audio_file_path), sampling_rate=SAMPLE_RATE)
+        duration_s = len(audio) / SAMPLE_RATE
+        decode_options = dict(self.transcriber.decode_options)
+
+        if not self.enabled or duration_s < self.min_duration_s:
+            yield from self.transcriber.iter_word_batches(audio)
+            self._record_stats(duration_s, started_at, 1, 1)
+            return
+
+        chunks = self.split_chunks(audio)
+        pool = self._get_pool()
+        futures = {
+            pool.submit(_transcribe_chunk, i, int(start * 1000 / SAMPLE_RATE), audio[start:end], decode_options)
+            for i, (start, end) in enumerate(chunks)
+        }
+        print(f"[DEBUG] Parallel transcription: {len(chunks)} chunks on {self.workers} workers")
+
+        done_chunks: Dict[int, List[ChunkWord]] = {}
+        next_index = 0
+        previous: List[ChunkWord] = []
+        # Segment ids continue across chunks so they stay unique in the whole file
+        segment_base = 0
+        try:
+            while futures:
+                finished, futures = wait(futures, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    index, words = future.result()
+                    done_chunks[index] = words
+                # Emit the contiguous prefix of finished chunks in timeline order
+                while next_index in done_chunks:
+                    chunk_words = done_chunks.pop(next_index)
+                    words = self._stitch(previous, chunk_words)
+                    if words:
+                        previous = words
+                    next_index += 1
+                    yield ([{'word': w, 'start_ms': s, 'end_ms': e, 'probability': p, 'segment': segment_base + seg}
+                            for w, s, e, p, seg in words], next_index / len(chunks))
+                    if chunk_words:
+                        segment_base += chunk_words[-1][4] + 1
+        finally:
+            for future in futures:
+                future.cancel()
+        self._record_stats(duration_s, started_at, len(chunks), self.workers)
+
+    def _record_stats(self, duration_s: float, started_at: float, chunks: int, workers: int):
+        elapsed = time.perf_counter() - started_at
+        rtf = elapsed / duration_s if duration_s > 0 else 0.0
+        self.last_stats = {
+            "audio_seconds": duration_s,
+            "elapsed_seconds": elapsed,
+            "real_time_factor": rtf,
+            "chunks": chunks,
+            "workers": workers,
+        }
+        print(f"[DEBUG] Transcribed {duration_s:.1f}s of audio in {elapsed:.1f}s "
+              f"(RTF {rtf:.3f}, {chunks} chunks, {workers} workers)")
@@ -0,0 +1,225 @@
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from Echoscribe.Core.transcript_store import TranscriptStore
+
+# magic, version, word count, segment count, history edit count, distinct word count,
+# audio path offset and length, start/end/probability/segment column offsets,
+# segment starts offset, word id column offset, distinct word blob offset and length,
+# history offset and length, journal offset
+_HEADER = struct.Struct("<4sIIIII13Q")
+# word index, old text length, new text length; followed by both UTF-8 texts
+_EDIT = struct.Struct("<III")
+WORD_SEPARATOR = "\0"
+
+Edit = Tuple[int, str, str]
+
+
+def _encode_edit(index: int, old_text: str, new_text: str) -> bytes:
+    old = old_text.encode("utf-8")
+    new = new_text.encode("utf-8")
+    return _EDIT.pack(index, len(old), len(new)) + old + new
+
+
+def _decode_edits(data, start: int, end: int) -> Tuple[List[Edit], int]:
+    """Decode edit records in data[start:end].
+
+    Returns:
+        The edits and the offset after the last complete record
+    """
+    edits = []
+    pos = start
+    while pos + _EDIT.size <= end:
+        index, old_length, new_length = _EDIT.unpack_from(data, pos)
+        text_start = pos + _EDIT.size
+        record_end = text_start + old_length + new_length
+        if record_end > end:
+            break
+        old_text = bytes(data[text_start:text_start + old_length]).decode("utf-8")
+        new_text = bytes(data[text_start + old_length:record_end]).decode("utf-8")
+        edits.append((index, old_text, new_text))
+        pos = record_end
+    return edits, pos
+
+
+def _column(data, typecode: str, offset: int, count: int) -> array:
+    """Copy a little-endian column out of the mapped file."""
+    column = array(typecode)
+    column.frombytes(data[offset:offset + column.itemsize * count])
+    if sys.byteorder == "big":
+        column.byteswap()
+    return column
+
+
+def _column_bytes(column: array) -> bytes:
+    if sys.byteorder == "big":
+        column = array(column.typecode, column)
+        column.byteswap()
+    return column.tobytes()
+
+
+class ProjectFile:
+    """
+    EchoScribe project (.echoscribe): reference to the audio file, the word-level
+    transcript as columns and the history of word edits.
+
+    Layout: header, audio path, start/end times, probabilities, segment ids,
+    segment starts, per-word ids into a NUL-separated blob of distinct words and
+    the history folded into the snapshot, followed by an append-only journal.
+    Opening maps the file and copies every column in one piece, then replays the
+    journal. Word edits are appended to the journal as they are made; compact()
+    folds them into a new snapshot.
+    """
+
+    MAGIC = b"ECPJ"
+    VERSION = 1
+    SUFFIX = ".echoscribe"
+    # Journal length at which saving rewrites the snapshot
+    COMPACT_EDITS = 256
+
+    def __init__(self, path: Path, audio_path: str, history: List[Edit], journal: List[Edit]):
+        self.path = Path(path)
+        self.audio_path = audio_path
+        self._history = history
+        self._journal = journal
+
+    @property
+    def edits(self) -> List[Edit]:
+        """Every word edit as (index, old text, new text), oldest first."""
+        return self._history + self._journal
+
+    @property
+    def needs_compaction(self) -> bool:
+        return len(self._journal) >= self.COMPACT_EDITS
+
+    def resolve_audio(self) -> Optional[Path]:
+        """The audio file, also looked up next to the project if it was moved along with it."""
+        audio = Path(self.audio_path)
+        if audio.exists():
+            return audio
+        sibling = self.path.parent / audio.name
+        return sibling if sibling.exists() else None
+
+    @classmethod
+    def create(cls, path: Path, audio_path: str, transcript: TranscriptStore,
+               history: List[Edit] = ()) -> "ProjectFile":
+        """Write a project snapshot, replacing the file atomically.
+
+        Args:
+            path: Destination, usually with the .echoscribe suffix
+            audio_path: Audio file the transcript belongs to
+            transcript: Current words, including any edits
+            history: Earlier edits, kept for reference but not replayed
+        """
+        path = Path(path)
+        history = list(history)
+        count = len(transcript)
+        segments = array('i', transcript.segments)
+        segment_starts = array('i', transcript.segment_starts)
+        # Each distinct word text is stored once
+        distinct = {}
+        for word in transcript.words:
+            if word not in distinct:
+                distinct[word] = len(distinct)
+        word_ids = array('I', map(distinct.__getitem__, transcript.words))
+        sections = [
+            str(audio_path).encode("utf-8"),
+            _column_bytes(transcript.starts),
+            _column_bytes(transcript.ends),
+            _column_bytes(transcript.probabilities),
+            _column_bytes(segments),
+            _column_bytes(segment_starts),
+            _column_bytes(word_ids),
+            WORD_SEPARATOR.join(distinct).encode("utf-8"),
+            b"".join(_encode_edit(*edit) for edit in history),
+        ]
+        offsets = []
+        offset = _HEADER.size
+        for data in sections:
+            offsets.append(offset)
+            offset += len(data)
+        audio_offset, starts_offset, ends_offset, probs_offset, segments_offset, \
+            segment_starts_offset, word_ids_offset, words_offset, history_offset = offsets
+        header = _HEADER.pack(cls.MAGIC, cls.VERSION, count, len(segment_starts), len(history), len(distinct),
+                              audio_offset, len(sections[0]), starts_offset, ends_offset, probs_offset,
+                              segments_offset, segment_starts_offset, word_ids_offset, words_offset,
+                              len(sections[7]), history_offset, len(sections[8]), offset)
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=str(path.parent), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as out:
+                out.write(header)
+                for data in sections:
+                    out.write(data)
+            os.replace(tmp_name, path)
+        except Exception:
+            try:
+                os.remove(tmp_name)
+            except OSError:
+                pass
+            raise
+        return cls(path, str(audio_path), history, [])
+
+    @classmethod
+    def open(cls, path: Path) -> Tuple["ProjectFile", TranscriptStore]:
+        """Open a project and rebuild its transcript with the journaled edits applied.
+
+        Raises:
+            ValueError: If the file is not a supported project or is corrupt
+        """
+        path = Path(path)
+        with path.open("rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < _HEADER.size:
+                raise ValueError(f"Not an EchoScribe project: {path}")
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                (magic, version, count, segment_count, history_count, distinct_count, audio_offset,
+                 audio_length, starts_offset, ends_offset, probs_offset, segments_offset,
+                 segment_starts_offset, word_ids_offset, words_offset, words_length, history_offset,
+                 history_length, journal_offset) = _HEADER.unpack_from(mm, 0)
+                if magic != cls.MAGIC or version != cls.VERSION or journal_offset > size:
+                    raise ValueError(f"Unsupported project file: {path}")
+                audio_path = mm[audio_offset:audio_offset + audio_length].decode("utf-8")
+                words_blob = mm[words_offset:words_offset + words_length].decode("utf-8")
+                distinct = [sys.intern(w) for w in words_blob.split(WORD_SEPARATOR)] if distinct_count else []
+                word_ids = _column(mm, 'I', word_ids_offset, count)
+                if len(word_ids) != count or (count and max(word_ids) >= len(distinct)):
+                    raise ValueError(f"Corrupt project file: {path}")
+                words = list(map(distinct.__getitem__, word_ids))
+                transcript = TranscriptStore.from_columns(
+                    words,
+                    _column(mm, 'q', starts_offset, count),
+                    _column(mm, 'q', ends_offset, count),
+                    _column(mm, 'f', probs_offset, count),
+                    array('l', _column(mm, 'i', segments_offset, count)),
+                    array('l', _column(mm, 'i', segment_starts_offset, segment_count)))
+                history, _ = _decode_edits(mm, history_offset, history_offset + history_length)
+                journal, journal_end = _decode_edits(mm, journal_offset, size)
+        if journal_end < size:
+            # An edit interrupted while being written; drop it so new edits append cleanly
+            with path.open("r+b") as f:
+                f.truncate(journal_end)
+        for index, _, new_text in journal:
+            # A damaged record may name a word that does not exist; skip it rather than fail to open
+            if 0 <= index < len(transcript):
+                transcript.set_word(index, new_text)
+        return cls(path, audio_path, history, journal), transcript
+
+    def record_edit(self, index: int, old_text: str, new_text: str):
+        """Append a word edit to the journal; only the new record is written."""
+        with self.path.open("ab") as f:
+            f.write(_encode_edit(index, old_text, new_text))
+        self._journal.append((index, old_text, new_text))
+
+    def compact(self, transcript: TranscriptStore):
+        """Rewrite the snapshot from the current transcript, moving journaled edits into the history."""
+        compacted = self.create(self.path, self.audio_path, transcript, self.edits)
+        self._history = compacted._history
+        self._journal = []
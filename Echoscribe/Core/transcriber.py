@@ -8,8 +8,24 @@ class Transcriber:
     Core class that encapsulates Whisper model loading and audio transcription functionality.
     """
 
-    def __init__(self):
-        """Initialize transcriber and load the Whisper model."""
+    MODEL_DIR_NAME = "faster_whisper_base_en"
+    DEVICE = "cpu"
+    COMPUTE_TYPE = "int8"
+    # Decode parameters used for word-level transcription
+    DECODE_OPTIONS = {"beam_size": 5, "word_timestamps": True}
+
+    def __init__(self, num_workers: int = 1, cpu_threads: int = 0):
+        """Initialize transcriber and load the Whisper model.
+
+        Args:
+            num_workers: Number of transcriptions the model may run concurrently
+            cpu_threads: CPU threads per transcription, 0 uses the library default
+        """
+        self.model_path = self._get_application_path() / "Models" / self.MODEL_DIR_NAME
+        self.compute_type = self.COMPUTE_TYPE
+        self.num_workers = max(1, int(num_workers))
+        self.cpu_threads = max(0, int(cpu_threads))
+        self.decode_options = dict(self.DECODE_OPTIONS)
         self.model = self._load_model()
 
     def _get_application_path(self):
@@ -21,9 +37,7 @@ class Transcriber:
 
     def _load_model(self):
         """Load the local Whisper model from the Models directory."""
-        app_root = self._get_application_path()
-
-        model_path = app_root / "Models" / "faster_whisper_base_en"
+        model_path = self.model_path
         print(f"Loading model from local path: {model_path}")
 
         if not model_path.exists():
@@ -32,19 +46,81 @@ class Transcriber:
 
         try:
             # Load model with CPU and int8 for better compatibility
-            loaded_model = WhisperModel(str(model_path), device="cpu", compute_type="int8")
+            loaded_model = WhisperModel(str(model_path), device=self.DEVICE, compute_type=self.compute_type,
+                                        cpu_threads=self.cpu_threads, num_workers=self.num_workers)
             print("[SUCCESS] Model loaded successfully!")
             return loaded_model
         except Exception as e:
             print(f"[CRITICAL ERROR] Unknown error occurred while loading model: {e}")
             return None
 
+    def cache_params(self):
+        """Describe everything that influences the decoded words.
+
+        Returns:
+            Dictionary of model identity and decode parameters, suitable
+            for building transcript cache keys
+        """
+        model_bin = self.model_path / "model.bin"
+        try:
+            model_mtime = int(model_bin.stat().st_mtime)
+        except OSError:
+            model_mtime = 0
+        return {
+            "model_path": str(self.model_path),
+            "model_mtime": model_mtime,
+            "device": self.DEVICE,
+            "compute_type": self.compute_type,
+            "decode_options": self.decode_options,
+        }
+
+    def iter_word_batches(self, audio_file_path):
+        """Decode audio and yield each segment's words as soon as it is decoded.
+
+        Args:
+            audio_file_path: Path to the audio file, or 16 kHz mono samples
+
+        Yields:
+            Tuple of (words, progress) where words is a list of
+            {'word', 'start_ms', 'end_ms', 'probability', 'segment'} dicts and
+            progress is the decoded fraction of the audio in [0, 1], or None
+            when the duration is unknown
+        """
+        if not self.model:
+            raise RuntimeError("Model failed to load successfully.")
+
+        audio = str(audio_file_path) if isinstance(audio_file_path, Path) else audio_file_path
+        segments, info = self.model.transcribe(audio, **self.decode_options)
+        total_duration = getattr(info, 'duration', None)
+
+        for segment_index, segment in enumerate(segments):
+            words = []
+            for word in segment.words or []:
+                start_sec = getattr(word, 'start', None)
+                if start_sec is None:
+                    start_sec = getattr(segment, 'start', 0.0)
+                end_sec = getattr(word, 'end', None)
+                if end_sec is None:
+                    end_sec = start_sec
+                try:
+                    start_ms = int(max(0.0, float(start_sec)) * 1000)
+                    end_ms = max(start_ms, int(max(0.0, float(end_sec)) * 1000))
+                except Exception:
+                    start_ms = end_ms = 0
+                words.append({'word': word.word, 'start_ms': start_ms, 'end_ms': end_ms,
+                              'probability': getattr(word, 'probability', None), 'segment': segment_index})
+
+            progress = None
+            if total_duration and getattr(segment, 'end', None) is not None:
+                progress = min(max(segment.end / total_duration, 0.0), 1.0)
+            yield words, progress
+
     def transcribe_audio(self, audio_file_path):
         """Transcribe audio file to text.
-        
+
         Args:
             audio_file_path: Path to the audio file to transcribe
-            
+
         Returns:
             Transcribed text as string, or error message
         """
@@ -65,4 +141,4 @@ class Transcriber:
             return "\n".join(result_text_list)
         except Exception as e:
             print(f"Error occurred while transcribing audio file: {e}")
-            return f"Error: Transcription failed - {e}"
\ No newline at end of file
+            return f"Error: Transcription failed - {e}"
@@ -0,0 +1,137 @@
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+class TranscriptCache:
+    """
+    Content-addressed on-disk cache of word-level transcripts.
+    Entries are keyed by a hash of the audio bytes plus the decode parameters,
+    and evicted least-recently-used first once the cache exceeds its size budget.
+    """
+
+    # Bump when the stored word format changes so stale entries are never reused
+    FORMAT_VERSION = 2
+    HASH_CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self, cache_dir: Path, max_bytes: int = 256 * 1024 * 1024):
+        """Initialize cache in the given directory with a size budget in bytes."""
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max(0, int(max_bytes))
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def make_key(self, audio_path, params: Dict) -> str:
+        """Build the cache key for an audio file.
+
+        Args:
+            audio_path: Path to the audio file
+            params: Model and decode parameters that affect the result
+
+        Returns:
+            Hex digest identifying the audio content and parameters
+        """
+        digest = hashlib.sha256()
+        with open(audio_path, "rb") as f:
+            for chunk in iter(lambda: f.read(self.HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        digest.update(json.dumps({"format": self.FORMAT_VERSION, "params": params},
+                                 sort_keys=True, default=str).encode("utf-8"))
+        return digest.hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[List[Dict]]:
+        """Return cached words for a key, or None on a miss."""
+        path = self._entry_path(key)
+        try:
+            with path.open("r", encoding="utf-8") as f:
+                words = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            print(f"Warning: Discarding unreadable transcript cache entry {path.name}: {e}")
+            self.invalidate(key)
+            return None
+        try:
+            # Mark as recently used for LRU eviction
+            os.utime(path, None)
+        except OSError:
+            pass
+        return words if isinstance(words, list) else None
+
+    def put(self, key: str, words: List[Dict]):
+        """Store words for a key, then evict old entries if over budget."""
+        path = self._entry_path(key)
+        fd, tmp_name = tempfile.mkstemp(dir=str(self.cache_dir), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(words, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp_name, path)
+        except Exception:
+            try:
+                os.remove(tmp_name)
+            except OSError:
+                pass
+            raise
+        self._evict(keep=path)
+
+    def invalidate(self, key: str):
+        """Remove a single cache entry."""
+        try:
+            self._entry_path(key).unlink()
+        except OSError:
+            pass
+
+    def clear(self) -> int:
+        """Remove every cache entry.
+
+        Returns:
+            Number of entries removed
+        """
+        removed = 0
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                path.unlink()
+                removed += 1
+            except OSError:
+                pass
+        return removed
+
+    def size_bytes(self) -> int:
+        """Total size of all cache entries in bytes."""
+        total = 0
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                total += path.stat().st_size
+            except OSError:
+                pass
+        return total
+
+    def _evict(self, keep: Optional[Path] = None):
+        """Delete least recently used entries until the cache fits its budget."""
+        entries = []
+        total = 0
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+            total += st.st_size
+        if total <= self.max_bytes:
+            return
+        entries.sort(key=lambda e: e[0])
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            if keep is not None and path == keep:
+                continue
+            try:
+                path.unlink()
+                total -= size
+            except OSError:
+                pass
@@ -0,0 +1,156 @@
+import sys
+from array import array
+from bisect import bisect_right
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+class TranscriptStore:
+    """
+    Columnar word-level transcript: interned word strings plus parallel arrays
+    of start/end times, recognition probabilities and segment ids.
+    Start times are kept non-decreasing so they can be binary searched even when
+    the recognizer emits a slightly out-of-order timestamp.
+    """
+
+    def __init__(self, words: Iterable[Dict] = ()):
+        """Initialize from an iterable of word dicts as produced by Transcriber.iter_word_batches."""
+        self.words: List[str] = []
+        self.starts = array('q')
+        self.ends = array('q')
+        self.probabilities = array('f')
+        self.segments = array('l')
+        # First word index of every segment, for slicing by segment
+        self.segment_starts = array('l')
+        self.extend(words)
+
+    @classmethod
+    def from_columns(cls, words: List[str], starts: array, ends: array, probabilities: array,
+                     segments: array, segment_starts: array) -> "TranscriptStore":
+        """Adopt already consistent columns, e.g. as saved in a project file, without per-word appends.
+
+        Repeated word texts should already share one (interned) string.
+
+        Raises:
+            ValueError: If the columns differ in length
+        """
+        count = len(words)
+        if not (len(starts) == len(ends) == len(probabilities) == len(segments) == count):
+            raise ValueError("Transcript columns differ in length")
+        store = cls()
+        store.words = words
+        store.starts = starts
+        store.ends = ends
+        store.probabilities = probabilities
+        store.segments = segments
+        store.segment_starts = segment_starts
+        return store
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def append(self, word: str, start_ms: int, end_ms: Optional[int] = None,
+               probability: Optional[float] = None, segment: Optional[int] = None):
+        """Append one word in playback order.
+
+        Args:
+            word: Word text as recognized, including leading whitespace
+            start_ms: Start time in milliseconds
+            end_ms: End time, or None to end the word when the next one starts
+            probability: Recognition probability, or None if unknown
+            segment: Segment id, or None to continue the current segment
+        """
+        starts = self.starts
+        ends = self.ends
+        start = int(max(0, start_ms))
+        if starts and start < starts[-1]:
+            start = starts[-1]
+        if ends and ends[-1] < 0:
+            # Previous word had no end time: it lasts until this word starts
+            ends[-1] = start
+        if segment is None:
+            segment = self.segments[-1] if self.segments else 0
+        if not self.segment_starts or segment != self.segments[-1]:
+            self.segment_starts.append(len(self.words))
+
+        self.words.append(sys.intern(word))
+        starts.append(start)
+        ends.append(max(start, int(end_ms)) if end_ms is not None else -1)
+        self.probabilities.append(probability if probability is not None else -1.0)
+        self.segments.append(segment)
+
+    def extend(self, words: Iterable[Dict]):
+        """Append word dicts ({'word', 'start_ms'} plus optional 'end_ms', 'probability', 'segment')."""
+        for w in words:
+            self.append(w.get('word', ''), w.get('start_ms', 0), w.get('end_ms'),
+                        w.get('probability'), w.get('segment'))
+
+    def clear(self):
+        del self.words[:]
+        del self.starts[:]
+        del self.ends[:]
+        del self.probabilities[:]
+        del self.segments[:]
+        del self.segment_starts[:]
+
+    def word(self, index: int) -> str:
+        return self.words[index]
+
+    def set_word(self, index: int, text: str):
+        """Replace the text of a word, e.g. after a manual correction."""
+        self.words[index] = sys.intern(text)
+
+    def start_ms(self, index: int) -> int:
+        return self.starts[index]
+
+    def end_ms(self, index: int) -> int:
+        """End time of a word; the last word without an end time ends at its start."""
+        end = self.ends[index]
+        return end if end >= 0 else self.starts[index]
+
+    def probability(self, index: int) -> Optional[float]:
+        """Recognition probability of a word, or None if the recognizer did not report one."""
+        p = self.probabilities[index]
+        return p if p >= 0 else None
+
+    def index_at(self, position_ms: int) -> int:
+        """Index of the last word starting at or before position_ms, or -1."""
+        return bisect_right(self.starts, position_ms) - 1
+
+    def next_boundary_ms(self, index: int) -> Optional[int]:
+        """Start time of the word after index, or None at the end of the transcript."""
+        nxt = index + 1
+        return self.starts[nxt] if nxt < len(self.starts) else None
+
+    @property
+    def segment_count(self) -> int:
+        return len(self.segment_starts)
+
+    def segment_of(self, index: int) -> int:
+        """Position in segment order of the segment containing word index."""
+        return bisect_right(self.segment_starts, index) - 1
+
+    def segment_range(self, segment_pos: int) -> Tuple[int, int]:
+        """Word index range [start, end) of the segment at position segment_pos."""
+        start = self.segment_starts[segment_pos]
+        nxt = segment_pos + 1
+        end = self.segment_starts[nxt] if nxt < len(self.segment_starts) else len(self.words)
+        return start, end
+
+    def segment_time_range(self, segment_pos: int) -> Tuple[int, int]:
+        """Start and end time in milliseconds of the segment at position segment_pos."""
+        start, end = self.segment_range(segment_pos)
+        return self.starts[start], self.end_ms(end - 1)
+
+    def to_dict(self, index: int) -> Dict:
+        """Word as a plain dict, the interchange format of caches and output files."""
+        d = {'word': self.words[index], 'start_ms': self.starts[index], 'end_ms': self.end_ms(index),
+             'segment': self.segments[index]}
+        p = self.probability(index)
+        if p is not None:
+            d['probability'] = round(p, 4)
+        return d
+
+    def iter_dicts(self, start: int = 0, end: Optional[int] = None) -> Iterator[Dict]:
+        """Yield words [start, end) as plain dicts."""
+        for i in range(start, len(self.words) if end is None else end):
+            yield self.to_dict(i)
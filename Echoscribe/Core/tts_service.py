@@ -0,0 +1,289 @@
+import hashlib
+import os
+import queue
+import tempfile
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional
+
+# Queue marker waking the engine thread to work through pre-synthesis
+_WAKE = object()
+
+
+class TtsService:
+    """
+    Long-lived text-to-speech worker. One thread owns a pyttsx3 engine that is
+    initialized once; queued requests superseded by a newer one are dropped before
+    synthesis. Synthesized words are kept as audio files keyed by word, voice and
+    rate, so a repeated word is played from disk without touching the engine; the
+    least recently used files are evicted once the cache exceeds its size budget.
+
+    Words can also be pre-synthesized in a low-priority lane, one at a time and
+    only while no pronunciation request is waiting.
+    """
+
+    def __init__(self, cache_dir: Path, on_ready: Callable[[str, Optional[Path]], None], rate: int = 200,
+                 on_progress: Optional[Callable[[int, int, int], None]] = None,
+                 max_bytes: int = 128 * 1024 * 1024):
+        """Initialize the service; the engine thread starts with the first request.
+
+        Args:
+            cache_dir: Directory for synthesized word audio
+            on_ready: Called as on_ready(word, path) once audio for the latest
+                request is available, from the engine thread unless the word was
+                already cached; path is None if the engine had to speak directly
+            rate: Speech rate in words per minute
+            on_progress: Called from the engine thread as on_progress(done, total,
+                already_cached) while pre-synthesizing
+            max_bytes: Size budget of the audio cache in bytes
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max(0, int(max_bytes))
+        self.rate = rate
+        self.voice_id = None
+        self._on_ready = on_ready
+        self._on_progress = on_progress
+        self._queue = queue.Queue()
+        self._latest = 0
+        self._lock = threading.Lock()
+        self._thread = None
+        # Pre-synthesis job: remaining words (last is next), job id and counters
+        self._pending = []
+        self._job = 0
+        self._job_rate = rate
+        self._job_total = 0
+        self._job_done = 0
+        self._job_hits = 0
+        # Pronunciation requests and how many of them were served from the cache
+        self._requests = 0
+        self._hits = 0
+
+    def cache_path(self, word: str, voice_id: Optional[str], rate: int) -> Path:
+        """Location of the synthesized audio of a word for a voice and rate."""
+        key = f"{word}\0{voice_id or ''}\0{rate}".encode("utf-8")
+        return self.cache_dir / f"{hashlib.sha1(key).hexdigest()}.wav"
+
+    @staticmethod
+    def _touch(path: Path) -> bool:
+        """Mark a cached file as recently used; returns False if it is not cached."""
+        try:
+            os.utime(path, None)
+            return True
+        except OSError:
+            return False
+
+    def clear(self) -> int:
+        """Remove every synthesized word.
+
+        Returns:
+            Number of files removed
+        """
+        removed = 0
+        for path in self.cache_dir.glob("*.wav"):
+            try:
+                path.unlink()
+                removed += 1
+            except OSError:
+                pass
+        return removed
+
+    def size_bytes(self) -> int:
+        """Total size of the synthesized audio in bytes."""
+        total = 0
+        for path in self.cache_dir.glob("*.wav"):
+            try:
+                total += path.stat().st_size
+            except OSError:
+                pass
+        return total
+
+    def _evict(self, keep: Optional[Path] = None):
+        """Delete least recently used audio files until the cache fits its budget."""
+        entries = []
+        total = 0
+        for path in self.cache_dir.glob("*.wav"):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+            total += st.st_size
+        if total <= self.max_bytes:
+            return
+        entries.sort(key=lambda e: e[0])
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            if keep is not None and path == keep:
+                continue
+            try:
+                path.unlink()
+                total -= size
+            except OSError:
+                pass
+
+    def _ensure_thread(self):
+        # Caller holds self._lock
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="tts", daemon=True)
+            self._thread.start()
+
+    def speak(self, word: str):
+        """Request the pronunciation of a word, superseding any request not yet synthesized."""
+        word = word.strip()
+        if not word:
+            return
+        with self._lock:
+            self._latest += 1
+            seq = self._latest
+            self._requests += 1
+            self._ensure_thread()
+        if self.voice_id is not None:
+            path = self.cache_path(word, self.voice_id, self.rate)
+            if self._touch(path):
+                with self._lock:
+                    self._hits += 1
+                self._on_ready(word, path)
+                return
+        self._queue.put((seq, word, self.rate))
+
+    def presynthesize(self, words: Iterable[str]):
+        """Replace the pre-synthesis job with the given words, in priority order.
+
+        Words already cached for the current voice and rate are counted but skipped.
+        """
+        unique = list(dict.fromkeys(w.strip() for w in words if w and w.strip()))
+        with self._lock:
+            self._job += 1
+            self._pending = unique[::-1]
+            self._job_rate = self.rate
+            self._job_total = len(unique)
+            self._job_done = 0
+            self._job_hits = 0
+            if unique:
+                self._ensure_thread()
+        if unique:
+            self._queue.put(_WAKE)
+
+    def cancel_presynthesis(self):
+        """Drop the remaining words of the pre-synthesis job."""
+        with self._lock:
+            self._job += 1
+            self._pending = []
+
+    def stats(self) -> Dict:
+        """Pre-synthesis progress and pronunciation cache hit counters."""
+        with self._lock:
+            return {
+                "presynth_done": self._job_done,
+                "presynth_total": self._job_total,
+                "presynth_cached": self._job_hits,
+                "presynth_running": bool(self._pending),
+                "requests": self._requests,
+                "hits": self._hits,
+                "hit_rate": self._hits / self._requests if self._requests else 0.0,
+            }
+
+    def stop(self):
+        """Stop the engine thread after its current request."""
+        self.cancel_presynthesis()
+        if self._thread is not None:
+            self._queue.put(None)
+
+    def _init_engine(self):
+        import pyttsx3
+        engine = pyttsx3.init()
+        # 设置为英语语音（只在启动时枚举一次）
+        for voice in engine.getProperty('voices'):
+            if 'english' in voice.name.lower() or 'en' in voice.id.lower():
+                engine.setProperty('voice', voice.id)
+                break
+        self.voice_id = engine.getProperty('voice')
+        return engine
+
+    def _run(self):
+        engine = None
+        while True:
+            try:
+                # Pronunciation requests always go first; pre-synthesis only runs when idle
+                item = self._queue.get(block=not self._pending)
+            except queue.Empty:
+                item = _WAKE
+            if item is None:
+                return
+            if item is _WAKE:
+                engine = self._presynthesize_next(engine)
+                continue
+            seq, word, rate = item
+            if seq != self._latest:
+                # A newer request arrived while this one was waiting
+                continue
+            try:
+                if engine is None:
+                    engine = self._init_engine()
+                if self._touch(self.cache_path(word, self.voice_id, rate)):
+                    with self._lock:
+                        self._hits += 1
+                path = self._synthesize(engine, word, rate)
+            except Exception as e:
+                print(f"TTS synthesis failed for '{word}': {e}")
+                # The engine may be left in a bad state; start a fresh one next time
+                engine = None
+                continue
+            if seq == self._latest:
+                self._on_ready(word, path)
+
+    def _presynthesize_next(self, engine):
+        """Render one word of the pre-synthesis job; returns the (possibly new) engine."""
+        with self._lock:
+            if not self._pending:
+                return engine
+            word = self._pending.pop()
+            job = self._job
+            rate = self._job_rate
+        try:
+            if engine is None:
+                engine = self._init_engine()
+            cached = self._touch(self.cache_path(word, self.voice_id, rate))
+            if not cached and self._synthesize(engine, word, rate, speak_fallback=False) is None:
+                print("TTS engine cannot render to files, pre-synthesis stopped")
+                self.cancel_presynthesis()
+                return engine
+        except Exception as e:
+            print(f"TTS pre-synthesis failed for '{word}': {e}")
+            return None
+        with self._lock:
+            if job != self._job:
+                return engine
+            self._job_done += 1
+            self._job_hits += int(cached)
+            progress = (self._job_done, self._job_total, self._job_hits)
+        if self._on_progress is not None:
+            self._on_progress(*progress)
+        return engine
+
+    def _synthesize(self, engine, word: str, rate: int, speak_fallback: bool = True) -> Optional[Path]:
+        path = self.cache_path(word, self.voice_id, rate)
+        if path.exists():
+            return path
+        if engine.getProperty('rate') != rate:
+            engine.setProperty('rate', rate)
+        fd, tmp_name = tempfile.mkstemp(dir=str(self.cache_dir), suffix=".tmp")
+        os.close(fd)
+        try:
+            engine.save_to_file(word, tmp_name)
+            engine.runAndWait()
+            if os.path.getsize(tmp_name) > 0:
+                os.replace(tmp_name, path)
+                self._evict(keep=path)
+                return path
+        finally:
+            if os.path.exists(tmp_name):
+                os.remove(tmp_name)
+        if not speak_fallback:
+            return None
+        # Driver cannot render to a file: speak directly without caching
+        engine.say(word)
+        engine.runAndWait()
+        return None
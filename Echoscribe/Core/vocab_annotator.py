@@ -0,0 +1,110 @@
+from typing import Dict, Iterable, Optional, Tuple
+
+# Punctuation the recognizer attaches to words
+WORD_PUNCTUATION = '.,!?;:，。！？；：'
+
+
+def normalize_word(text: str) -> str:
+    """Dictionary key of a transcript token: trimmed, without attached punctuation, lower case."""
+    return text.strip().strip(WORD_PUNCTUATION).lower()
+
+
+def _to_int(value: Optional[str]) -> int:
+    try:
+        return int(value) if value else 0
+    except ValueError:
+        return 0
+
+
+class WordAnnotation:
+    """Dictionary facts about one normalized word, resolved once per session."""
+
+    __slots__ = ("key", "entry", "lemma_entry", "collins", "oxford", "bnc", "frq", "tags", "brief")
+
+    def __init__(self, key: str, entry: Optional[Dict[str, str]], lemma_entry: Optional[Dict[str, str]]):
+        self.key = key
+        self.entry = entry
+        self.lemma_entry = lemma_entry
+        # Inflected forms usually carry no ranks of their own; those of the lemma apply
+        ranked = entry if entry and (entry.get("frq") or entry.get("bnc") or entry.get("collins")) else None
+        source = ranked or lemma_entry or entry or {}
+        self.collins = _to_int(source.get("collins"))
+        self.oxford = source.get("oxford", "") == "1"
+        self.bnc = _to_int(source.get("bnc"))
+        self.frq = _to_int(source.get("frq"))
+        self.tags = tuple(source.get("tag", "").split())
+        self.brief = self._format_brief(entry or lemma_entry)
+
+    @staticmethod
+    def _format_brief(entry: Optional[Dict[str, str]]) -> str:
+        """One-line summary: /phonetic/  |  pos  |  translation (truncated)."""
+        if not entry:
+            return ""
+        phon = entry.get('phonetic') or ""
+        pos = entry.get('pos') or ""
+        trans = entry.get('translation') or ""
+        if len(trans) > 80:
+            trans = trans[:80] + "…"
+        parts = []
+        if phon:
+            parts.append(f"/{phon}/")
+        if pos:
+            parts.append(pos)
+        if trans:
+            parts.append(trans)
+        return "  |  ".join(parts)
+
+    @property
+    def found(self) -> bool:
+        return self.entry is not None or self.lemma_entry is not None
+
+    def lookup_pair(self) -> Tuple[Optional[Dict[str, str]], Optional[Dict[str, str]]]:
+        """(entry, lemma_entry), as returned by Dictionary.lookup_with_lemma."""
+        return self.entry, self.lemma_entry
+
+
+class VocabularyAnnotator:
+    """
+    Session cache of word annotations. A whole transcript is resolved in one
+    batch over its distinct normalized tokens, after which tooltips, favorite
+    briefs and difficulty coloring read annotations without touching the dictionary.
+    """
+
+    def __init__(self, dictionary):
+        self.dictionary = dictionary
+        self._cache: Dict[str, WordAnnotation] = {}
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def annotate(self, words: Iterable[str]) -> Dict[str, WordAnnotation]:
+        """Resolve all distinct words at once; only words not yet cached hit the dictionary.
+
+        Safe to call from a worker thread: the cache is only ever extended by a
+        single dict.update of complete annotations.
+
+        Returns:
+            {normalized key: annotation} for every distinct non-empty word
+        """
+        keys = {normalize_word(w) for w in words if w}
+        keys.discard("")
+        cache = self._cache
+        missing = [k for k in keys if k not in cache]
+        if missing:
+            resolved = self.dictionary.lookup_many(missing)
+            cache.update({k: WordAnnotation(k, *resolved.get(k, (None, None))) for k in missing})
+        return {k: cache[k] for k in keys}
+
+    def get(self, word: str) -> Optional[WordAnnotation]:
+        """Cached annotation of a word, or None if it was not annotated yet."""
+        return self._cache.get(normalize_word(word))
+
+    def lookup(self, word: str) -> Optional[WordAnnotation]:
+        """Annotation of a word, resolving and caching it if needed; None for an empty word."""
+        key = normalize_word(word)
+        if not key:
+            return None
+        annotation = self._cache.get(key)
+        if annotation is None:
+            annotation = self.annotate([key]).get(key)
+        return annotation
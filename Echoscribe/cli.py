@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+EchoScribe Batch Transcription Command Line
+
+Transcribes audio files found in directories or glob patterns without starting
+the GUI, writing one word-timestamped JSON file per input, or subtitles and
+tables in the formats of Echoscribe.Core.exporters. Progress is recorded in a
+state file so an interrupted run resumes where it stopped.
+
+Example:
+    python -m Echoscribe.cli lectures/ "podcasts/**/*.mp3" -o transcripts -j 2
+    python -m Echoscribe.cli talk.mp3 --format srt,vtt
+"""
+
+import argparse
+import glob
+import json
+import os
+import queue
+import sys
+import threading
+import time
+from pathlib import Path
+
+if not getattr(sys, 'frozen', False):
+    # Allow running this file directly from a source checkout
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from Echoscribe.Core.exporters import FORMATS, export_file
+
+AUDIO_EXTENSIONS = {".mp3", ".wav", ".ogg", ".flac", ".m4a"}
+STATE_FILE_NAME = ".echoscribe-batch-state.jsonl"
+# Word-timestamped JSON document written by default
+JSON_FORMAT = "json"
+_STOP = object()
+
+
+def iter_audio_files(patterns):
+    """Expand directories and glob patterns into unique audio file paths.
+
+    Args:
+        patterns: Iterable of directory paths, file paths or glob patterns
+
+    Yields:
+        Tuple of (resolved path, relative path) per audio file; the relative
+        path keeps the layout below a directory argument for output naming
+    """
+    seen = set()
+    for pattern in patterns:
+        path = Path(pattern)
+        if path.is_dir():
+            candidates = [(p, p.relative_to(path)) for p in sorted(path.rglob("*")) if p.is_file()]
+        elif path.is_file():
+            candidates = [(path, Path(path.name))]
+        else:
+            base = glob_base(pattern)
+            candidates = [(Path(p), Path(p).relative_to(base)) for p in sorted(glob.glob(pattern, recursive=True))]
+        for candidate, relative in candidates:
+            if candidate.suffix.lower() not in AUDIO_EXTENSIONS:
+                continue
+            resolved = candidate.resolve()
+            if resolved in seen:
+                continue
+            seen.add(resolved)
+            yield resolved, relative
+
+
+def glob_base(pattern: str) -> Path:
+    """Leading directories of a glob pattern before the first wildcard, e.g. "podcasts" for "podcasts/**/*.mp3"."""
+    parts = Path(pattern).parts
+    for i, part in enumerate(parts):
+        if any(c in part for c in "*?["):
+            return Path(*parts[:i]) if i else Path(".")
+    return Path(pattern).parent
+
+
+class BatchState:
+    """Append-only record of finished jobs, used to resume interrupted runs."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._done = set()
+        self._lock = threading.Lock()
+        if path.exists():
+            with path.open("r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        self._done.add(json.loads(line)["key"])
+                    except (ValueError, KeyError, TypeError):
+                        # Ignore a partially written last line
+                        continue
+
+    @staticmethod
+    def job_key(audio_path: Path, formats=(JSON_FORMAT,)) -> str:
+        """Identify an input by path, size and modification time, plus the output formats.
+
+        The default JSON-only run keeps the key of earlier versions so existing state stays valid.
+        """
+        st = audio_path.stat()
+        key = f"{audio_path}|{st.st_size}|{st.st_mtime_ns}"
+        formats = sorted(set(formats))
+        return key if formats == [JSON_FORMAT] else f"{key}|{','.join(formats)}"
+
+    def is_done(self, key: str) -> bool:
+        return key in self._done
+
+    def mark_done(self, key: str, output_path: Path):
+        record = json.dumps({"key": key, "output": str(output_path), "time": time.time()}, ensure_ascii=False)
+        with self._lock:
+            with self.path.open("a", encoding="utf-8") as f:
+                f.write(record + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            self._done.add(key)
+
+
+def output_path_for(audio_path: Path, relative: Path, output_dir, fmt: str = JSON_FORMAT) -> Path:
+    """Place an output next to the audio file or at the mirrored path inside output_dir.
+
+    The name keeps the audio suffix (talk.mp3.words.json), so talk.mp3 and talk.wav
+    in one folder do not write the same file.
+    """
+    suffix = ".words.json" if fmt == JSON_FORMAT else FORMATS[fmt][1]
+    if not output_dir:
+        return audio_path.parent / f"{audio_path.name}{suffix}"
+    return Path(output_dir) / relative.parent / f"{relative.name}{suffix}"
+
+
+def write_words_file(output_path: Path, audio_path: Path, words):
+    """Write the transcript atomically so a crash never leaves a truncated file."""
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output_path.with_name(output_path.name + ".tmp")
+    with tmp_path.open("w", encoding="utf-8") as f:
+        json.dump({"audio": str(audio_path), "words": words}, f, ensure_ascii=False)
+    os.replace(tmp_path, output_path)
+
+
+def transcribe_to_files(transcriber, audio_path: Path, outputs) -> int:
+    """Transcribe one file and write it in every requested format.
+
+    A single export format is streamed from the decoder straight into its file;
+    the JSON document or several formats keep the word list in memory.
+
+    Args:
+        transcriber: Loaded Transcriber
+        audio_path: Audio file to transcribe
+        outputs: Dict of format name -> output path
+
+    Returns:
+        Number of words transcribed
+    """
+    batches = (batch for batch, _ in transcriber.iter_word_batches(audio_path))
+    if len(outputs) == 1 and JSON_FORMAT not in outputs:
+        (fmt, path), = outputs.items()
+        count = [0]
+
+        def decoded_words():
+            for batch in batches:
+                count[0] += len(batch)
+                yield from batch
+
+        export_file(decoded_words(), path, fmt)
+        return count[0]
+    words = [w for batch in batches for w in batch]
+    for fmt, path in outputs.items():
+        if fmt == JSON_FORMAT:
+            write_words_file(path, audio_path, words)
+        else:
+            export_file(words, path, fmt)
+    return len(words)
+
+
+def run_batch(transcriber, files, output_dir=None, jobs=1, queue_size=8, state=None, formats=(JSON_FORMAT,)):
+    """Transcribe files with a bounded job queue sharing one loaded model.
+
+    Args:
+        transcriber: Loaded Transcriber shared by all worker threads
+        files: Iterable of (audio path, relative path) tuples
+        output_dir: Directory for outputs, or None to write next to inputs
+        jobs: Number of concurrent worker threads
+        queue_size: Maximum number of pending jobs held in memory
+        state: Optional BatchState used to skip and record finished jobs
+        formats: Output formats written per input ("json" or a name in FORMATS)
+
+    Returns:
+        Tuple of (completed, skipped, failed) counts
+    """
+    jobs_queue = queue.Queue(maxsize=max(1, queue_size))
+    counts = {"completed": 0, "failed": 0}
+    counts_lock = threading.Lock()
+    stop_event = threading.Event()
+
+    def worker():
+        while True:
+            item = jobs_queue.get()
+            try:
+                if item is _STOP:
+                    return
+                if stop_event.is_set():
+                    continue
+                audio_path, relative, key = item
+                started = time.perf_counter()
+                try:
+                    outputs = {fmt: output_path_for(audio_path, relative, output_dir, fmt) for fmt in formats}
+                    word_count = transcribe_to_files(transcriber, audio_path, outputs)
+                    out_paths = list(outputs.values())
+                    if state is not None:
+                        state.mark_done(key, out_paths[0])
+                    with counts_lock:
+                        counts["completed"] += 1
+                    print(f"[DONE] {audio_path} -> {', '.join(map(str, out_paths))} "
+                          f"({word_count} words, {time.perf_counter() - started:.1f}s)")
+                except Exception as e:
+                    with counts_lock:
+                        counts["failed"] += 1
+                    print(f"[FAILED] {audio_path}: {e}")
+            finally:
+                jobs_queue.task_done()
+
+    threads = [threading.Thread(target=worker, daemon=True) for _ in range(max(1, jobs))]
+    for t in threads:
+        t.start()
+
+    skipped = 0
+    # Output path -> input writing it; two inputs must never overwrite each other's results
+    claimed = {}
+    try:
+        for audio_path, relative in files:
+            targets = [output_path_for(audio_path, relative, output_dir, fmt) for fmt in formats]
+            clash = next((claimed[t] for t in targets if claimed.get(t, audio_path) != audio_path), None)
+            if clash is not None:
+                with counts_lock:
+                    counts["failed"] += 1
+                print(f"[FAILED] {audio_path}: output would overwrite the result of {clash}")
+                continue
+            claimed.update((t, audio_path) for t in targets)
+            key = BatchState.job_key(audio_path, formats)
+            # Only skip when every requested output is still there, e.g. not deleted since the last run
+            if state is not None and state.is_done(key) and all(t.exists() for t in targets):
+                skipped += 1
+                continue
+            # Blocks while the queue is full, bounding memory on huge inputs
+            jobs_queue.put((audio_path, relative, key))
+    except KeyboardInterrupt:
+        print("Interrupted, finishing running jobs. Re-run the same command to resume.")
+        stop_event.set()
+    finally:
+        for _ in threads:
+            jobs_queue.put(_STOP)
+        for t in threads:
+            t.join()
+    return counts["completed"], skipped, counts["failed"]
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="echoscribe-batch",
+        description="Transcribe audio files to word-timestamped JSON or subtitles without the GUI.")
+    parser.add_argument("inputs", nargs="+", help="Audio files, directories or glob patterns")
+    parser.add_argument("-o", "--output-dir", help="Directory for output files (default: next to each input)")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="Concurrent transcriptions (default: 1)")
+    parser.add_argument("--queue-size", type=int, default=8, help="Maximum pending jobs (default: 8)")
+    parser.add_argument("--cpu-threads", type=int, default=0, help="CPU threads per transcription (default: auto)")
+    parser.add_argument("--state-file", help=f"Resume state file (default: {STATE_FILE_NAME} in the output directory)")
+    parser.add_argument("--restart", action="store_true", help="Ignore previous progress and transcribe everything")
+    parser.add_argument("-f", "--format", default=JSON_FORMAT,
+                        help=f"Comma-separated output formats: {', '.join((JSON_FORMAT, *FORMATS))} (default: json)")
+    args = parser.parse_args(argv)
+    args.formats = list(dict.fromkeys(f.strip().lower() for f in args.format.split(",") if f.strip()))
+    unknown = [f for f in args.formats if f != JSON_FORMAT and f not in FORMATS]
+    if unknown or not args.formats:
+        parser.error(f"unknown output format: {', '.join(unknown) or '(none)'}")
+    return args
+
+
+def main(argv=None):
+    """Entry point for the batch transcription command."""
+    args = parse_args(argv)
+
+    state_path = Path(args.state_file) if args.state_file else Path(args.output_dir or ".") / STATE_FILE_NAME
+    state_path.parent.mkdir(parents=True, exist_ok=True)
+    if args.restart and state_path.exists():
+        state_path.unlink()
+    state = BatchState(state_path)
+
+    from Echoscribe.Core.transcriber import Transcriber
+    transcriber = Transcriber(num_workers=args.jobs, cpu_threads=args.cpu_threads)
+    if not transcriber.model:
+        print("Model not loaded, cannot perform transcription.")
+        return 1
+
+    started = time.perf_counter()
+    completed, skipped, failed = run_batch(
+        transcriber, iter_audio_files(args.inputs), output_dir=args.output_dir,
+        jobs=args.jobs, queue_size=args.queue_size, state=state, formats=args.formats)
+    print(f"Finished in {time.perf_counter() - started:.1f}s: "
+          f"{completed} transcribed, {skipped} already done, {failed} failed")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,8 +7,18 @@ This module handles application initialization, path setup, and FFmpeg configura
 
 import sys
 import os
+import multiprocessing
+import time
 from pathlib import Path
 
+_STARTUP_T0 = time.perf_counter()
+
+
+def _log_phase(name):
+    """Log elapsed startup time for a phase."""
+    print(f"[STARTUP] {name}: {(time.perf_counter() - _STARTUP_T0) * 1000:.0f} ms")
+
+
 # Determine application root path for both development and packaged environments
 if getattr(sys, 'frozen', False):
     # Running as packaged executable
@@ -24,6 +34,7 @@ print(f"Python search path: {sys.path[0]}")
 # Import required libraries
 from pydub import AudioSegment
 from PySide6.QtWidgets import QApplication
+_log_phase("core imports")
 
 # Configure FFmpeg paths for audio processing
 ffmpeg_exe_path = PROJECT_ROOT / "vendor" / "ffmpeg" / "ffmpeg.exe"
@@ -58,15 +69,20 @@ def main():
             current_dir = os.path.dirname(os.path.abspath(__file__))
             sys.path.insert(0, current_dir)
             from ui.main_window import MainWindow
+    _log_phase("UI imports")
     
     # Initialize Qt application and main window
     app = QApplication(sys.argv)
     window = MainWindow()
+    _log_phase("main window constructed")
     window.show()
+    _log_phase("main window shown (model and dictionary continue loading in background)")
     
     # Start the application event loop
     sys.exit(app.exec())
 
 
 if __name__ == "__main__":
+    # Required for the transcription process pool in packaged builds
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
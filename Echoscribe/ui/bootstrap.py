@@ -0,0 +1,105 @@
+"""
+EchoScribe Startup Orchestration
+
+Loads expensive resources (speech model, dictionary) on background threads so
+the main window can paint immediately. Each resource signals readiness on its
+own, and callers wait only for the resource they actually need.
+"""
+
+import time
+import traceback
+from threading import Event, Thread, Lock
+
+from PySide6.QtCore import QObject, Signal, Slot
+
+
+class ResourceLoader(QObject):
+    resourceReady = Signal(str)
+    resourceFailed = Signal(str, str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._events = {}
+        self._results = {}
+        self._errors = {}
+        self._callbacks = {}
+        self._timings = {}
+        self._lock = Lock()
+        self.resourceReady.connect(self._dispatch_ready)
+        self.resourceFailed.connect(self._dispatch_failed)
+
+    def start(self, name, factory):
+        """Build a resource on a daemon thread.
+
+        Args:
+            name: Resource name used by wait/get/when_ready
+            factory: Callable returning the resource
+        """
+        with self._lock:
+            self._events[name] = Event()
+        thread = Thread(target=self._load, args=(name, factory), name=f"load-{name}", daemon=True)
+        thread.start()
+
+    def _load(self, name, factory):
+        started = time.perf_counter()
+        try:
+            result = factory()
+        except Exception as e:
+            self._errors[name] = str(e)
+            self._results[name] = None
+            self._timings[name] = time.perf_counter() - started
+            print(f"[STARTUP] {name} failed after {self._timings[name]:.2f}s: {e}")
+            traceback.print_exc()
+            self._events[name].set()
+            self.resourceFailed.emit(name, str(e))
+            return
+        self._results[name] = result
+        self._timings[name] = time.perf_counter() - started
+        print(f"[STARTUP] {name} ready in {self._timings[name]:.2f}s")
+        self._events[name].set()
+        self.resourceReady.emit(name)
+
+    def is_ready(self, name):
+        event = self._events.get(name)
+        return event is not None and event.is_set()
+
+    def get(self, name):
+        """Return the resource if it has finished loading, otherwise None."""
+        return self._results.get(name) if self.is_ready(name) else None
+
+    def wait(self, name, timeout=None):
+        """Block until a resource is loaded. Never call from the UI thread.
+
+        Returns:
+            The resource, or None if loading failed or timed out
+        """
+        event = self._events.get(name)
+        if event is None or not event.wait(timeout):
+            return None
+        return self._results.get(name)
+
+    def when_ready(self, name, callback):
+        """Call callback(resource) on the UI thread once the resource is loaded.
+
+        If loading fails the callback still runs, with None, so nobody waits forever.
+        """
+        if self.is_ready(name):
+            callback(self._results.get(name))
+            return
+        self._callbacks.setdefault(name, []).append(callback)
+
+    def timings(self):
+        """Load duration in seconds of every finished resource."""
+        return dict(self._timings)
+
+    @Slot(str)
+    def _dispatch_ready(self, name):
+        for callback in self._callbacks.pop(name, []):
+            try:
+                callback(self._results.get(name))
+            except Exception as e:
+                print(f"[STARTUP] {name} ready callback failed: {e}")
+
+    @Slot(str, str)
+    def _dispatch_failed(self, name, message):
+        self._dispatch_ready(name)
@@ -0,0 +1,131 @@
+"""
+EchoScribe Favorites View
+
+List model and painting delegate of the favorites page. Rows are plain strings
+painted on demand, so no widget exists per favorite; dictionary briefs are
+computed the first time a row is painted, i.e. only for rows that were visible.
+"""
+
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional
+
+from PySide6.QtCore import QAbstractListModel, QModelIndex, QRectF, QSize, Qt
+from PySide6.QtGui import QColor, QFont, QFontMetrics, QPainter, QPen
+from PySide6.QtWidgets import QStyle, QStyledItemDelegate
+
+
+class FavoritesModel(QAbstractListModel):
+    """
+    Sorted favorite words. Adding or removing a word inserts or removes its
+    single row; briefs come from brief_provider and are cached per word until
+    invalidate_briefs() is called (e.g. once the dictionary has loaded).
+    """
+
+    WordRole = Qt.UserRole
+    BriefRole = Qt.UserRole + 1
+
+    def __init__(self, brief_provider: Optional[Callable[[str], str]] = None, parent=None):
+        super().__init__(parent)
+        self._words: List[str] = []
+        self._briefs: Dict[str, str] = {}
+        self._brief_provider = brief_provider
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._words)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._words):
+            return None
+        word = self._words[index.row()]
+        if role in (Qt.DisplayRole, self.WordRole):
+            return word
+        if role in (self.BriefRole, Qt.ToolTipRole):
+            return self.brief(word)
+        return None
+
+    def brief(self, word: str) -> str:
+        brief = self._briefs.get(word)
+        if brief is None:
+            brief = self._brief_provider(word) if self._brief_provider else ""
+            self._briefs[word] = brief or ""
+        return brief or ""
+
+    def word_at(self, row: int) -> Optional[str]:
+        return self._words[row] if 0 <= row < len(self._words) else None
+
+    def set_words(self, words: Iterable[str]):
+        """Replace all rows, e.g. on startup."""
+        self.beginResetModel()
+        self._words = sorted(words)
+        self._briefs.clear()
+        self.endResetModel()
+
+    def add_word(self, word: str) -> bool:
+        """Insert one row at the word's sorted position; returns False if it is already listed."""
+        row = bisect_left(self._words, word)
+        if row < len(self._words) and self._words[row] == word:
+            return False
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._words.insert(row, word)
+        self.endInsertRows()
+        return True
+
+    def remove_word(self, word: str) -> bool:
+        """Remove the word's row; returns False if it is not listed."""
+        row = bisect_left(self._words, word)
+        if row >= len(self._words) or self._words[row] != word:
+            return False
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._words[row]
+        self.endRemoveRows()
+        self._briefs.pop(word, None)
+        return True
+
+    def invalidate_briefs(self):
+        """Drop cached briefs; the view repaints, and so re-queries, only its visible rows."""
+        self._briefs.clear()
+        if self._words:
+            self.dataChanged.emit(self.index(0), self.index(len(self._words) - 1), [self.BriefRole])
+
+
+class FavoriteItemDelegate(QStyledItemDelegate):
+    """Paints a favorite as a rounded card: the word in bold, then its brief elided to one line."""
+
+    ROW_HEIGHT = 48
+    PADDING = 12
+
+    def paint(self, painter, option, index):
+        word = index.data(FavoritesModel.WordRole) or ""
+        brief = index.data(FavoritesModel.BriefRole) or ""
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        rect = QRectF(option.rect).adjusted(0.5, 0.5, -0.5, -0.5)
+        if option.state & QStyle.State_Selected:
+            background, border = QColor("#EFF6FF"), QColor("#93C5FD")
+        elif option.state & QStyle.State_MouseOver:
+            background, border = QColor("#F9FAFB"), QColor("#D1D5DB")
+        else:
+            background, border = QColor("#FFFFFF"), QColor("#E5E7EB")
+        painter.setPen(QPen(border, 1))
+        painter.setBrush(background)
+        painter.drawRoundedRect(rect, 8, 8)
+
+        text_rect = option.rect.adjusted(self.PADDING, 0, -self.PADDING, 0)
+        word_font = QFont(option.font)
+        word_font.setWeight(QFont.DemiBold)
+        painter.setFont(word_font)
+        painter.setPen(QColor("#333333"))
+        word_width = QFontMetrics(word_font).horizontalAdvance(word)
+        painter.drawText(text_rect, Qt.AlignLeft | Qt.AlignVCenter, word)
+
+        brief_rect = text_rect.adjusted(word_width + self.PADDING, 0, 0, 0)
+        if brief and brief_rect.width() > 0:
+            painter.setFont(option.font)
+            painter.setPen(QColor("#4B5563"))
+            elided = QFontMetrics(option.font).elidedText(brief, Qt.ElideRight, brief_rect.width())
+            painter.drawText(brief_rect, Qt.AlignLeft | Qt.AlignVCenter, elided)
+        painter.restore()
+
+    def sizeHint(self, option, index):
+        return QSize(0, self.ROW_HEIGHT)
@@ -1,24 +1,37 @@
 import sys
 from pathlib import Path
-from threading import Thread
+from threading import Lock, Thread
+from bisect import bisect_left, bisect_right
 import time
-import json
-import pyttsx3
+from collections import Counter, OrderedDict
 
 from PySide6.QtCore import (Qt, QPoint, Signal, Slot, QObject, QPropertyAnimation,
                             QEasingCurve, QRect, QSize, Property, QUrl, QTimer)
-from PySide6.QtGui import QColor, QFontMetrics
+from PySide6.QtGui import QColor, QTextCursor
 from PySide6.QtMultimedia import QMediaPlayer, QAudioOutput
 from PySide6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QPushButton,
-                               QLabel, QFileDialog, QHBoxLayout, QApplication,
+                               QLabel, QFileDialog, QHBoxLayout,
                                QSlider, QStyle, QComboBox, QFormLayout,
-                               QProgressBar, QCheckBox, QScrollArea, QLayout,
+                               QProgressBar, QCheckBox, QLayout,
                                QStackedWidget, QGraphicsOpacityEffect, QSizePolicy, QTextBrowser,
-                               QMenu, QInputDialog, QListWidget, QListWidgetItem)
+                               QMenu, QInputDialog, QListView, QAbstractItemView)
 
 from Echoscribe.ui.style import MAIN_STYLE_SHEET
+from Echoscribe.ui.bootstrap import ResourceLoader
+from Echoscribe.ui.transcript_highlight import WordHighlighter
+from Echoscribe.ui.favorites_view import FavoritesModel, FavoriteItemDelegate
+from Echoscribe.ui.settings_service import SettingsService
 from Echoscribe.Core.transcriber import Transcriber
 from Echoscribe.Core.dictionary import Dictionary
+from Echoscribe.Core.transcript_cache import TranscriptCache
+from Echoscribe.Core.parallel_transcriber import ParallelTranscriber
+from Echoscribe.Core.transcript_store import TranscriptStore
+from Echoscribe.Core.tts_service import TtsService
+from Echoscribe.Core.vocab_annotator import VocabularyAnnotator
+from Echoscribe.Core.difficulty import compute_tiers, format_summary, tier_of
+from Echoscribe.Core.project_file import ProjectFile
+from Echoscribe.Core.favorites_store import FavoritesStore
+from Echoscribe.Core.exporters import FORMATS, export_file, format_for_path
 
 
 # Custom widgets: FlowLayout, ClickableWordLabel, HoverTabButton
@@ -144,31 +157,11 @@ class HoverTabButton(QPushButton):
         self.base_size); self.animation.start(); super().mousePressEvent(event)
 
 
-# Favorites list item widget
-class FavoriteItemWidget(QWidget):
-    def __init__(self, word_text: str, brief: str = "", parent=None):
-        super().__init__(parent)
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(12, 10, 12, 10)
-        layout.setSpacing(12)
-        self.word_label = QLabel(word_text)
-        self.word_label.setObjectName("FavoriteWord")
-        self.brief_label = QLabel(brief)
-        self.brief_label.setObjectName("FavoriteBrief")
-        self.brief_label.setWordWrap(True)
-        layout.addWidget(self.word_label, 0, Qt.AlignLeft)
-        layout.addWidget(self.brief_label, 1)
-        self.setObjectName("FavoriteItem")
-
-        self.setStyleSheet(
-            "#FavoriteItem { background: #FFFFFF; border: 1px solid #E5E7EB; border-radius: 8px; }"
-            "#FavoriteWord { font-weight: 600; color: #333333; }"
-            "#FavoriteBrief { color: #4B5563; }"
-        )
-
-
 # Custom tooltip window
 class WordTooltip(QWidget):
+    # Rendered content of recently shown words, reused while the widget lives
+    HTML_CACHE_SIZE = 256
+
     def __init__(self, parent=None, font_size=14, main_window=None):
         super().__init__(parent)
         self.setWindowFlags(Qt.ToolTip | Qt.FramelessWindowHint)
@@ -178,6 +171,8 @@ class WordTooltip(QWidget):
         self.main_window = main_window
         self.current_word = ""
         self.current_word_idx = None
+        self._html_cache = OrderedDict()
+        self._favorite_state = None
         
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -188,20 +183,7 @@ class WordTooltip(QWidget):
         self.content_label.setAlignment(Qt.AlignTop)
         self.content_label.setOpenExternalLinks(False)
         self.content_label.linkActivated.connect(self._on_link_clicked)
-        self.content_label.setStyleSheet(f"""
-            QLabel {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
-                    stop:0 rgba(255, 255, 255, 0.98), 
-                    stop:1 rgba(248, 250, 252, 0.98));
-                border: 2px solid rgba(59, 130, 246, 0.3);
-                border-radius: 12px 12px 0px 0px;
-                padding: 12px;
-                font-size: {self.font_size}px;
-                color: #1f2937;
-                font-weight: 500;
-                box-shadow: 0 4px 20px rgba(0, 0, 0, 0.15);
-            }}
-        """)
+        self._apply_label_style()
         
         # 添加收藏按钮
         self.favorite_button = QPushButton("⭐ 收藏")
@@ -232,6 +214,30 @@ class WordTooltip(QWidget):
         
         layout.addWidget(self.content_label)
         layout.addWidget(self.favorite_button)
+
+    def _apply_label_style(self):
+        self.content_label.setStyleSheet(f"""
+            QLabel {{
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
+                    stop:0 rgba(255, 255, 255, 0.98), 
+                    stop:1 rgba(248, 250, 252, 0.98));
+                border: 2px solid rgba(59, 130, 246, 0.3);
+                border-radius: 12px 12px 0px 0px;
+                padding: 12px;
+                font-size: {self.font_size}px;
+                color: #1f2937;
+                font-weight: 500;
+                box-shadow: 0 4px 20px rgba(0, 0, 0, 0.15);
+            }}
+        """)
+
+    def setFontSize(self, font_size):
+        """Change the content font size; cached content was rendered for the old size."""
+        if font_size == self.font_size:
+            return
+        self.font_size = font_size
+        self._apply_label_style()
+        self._html_cache.clear()
     
     def _on_link_clicked(self, url):
         if (url == "speak_word" or url == "#speak_word") and self.main_window and self.current_word:
@@ -249,6 +255,10 @@ class WordTooltip(QWidget):
         """更新收藏按钮的状态"""
         if self.main_window and self.current_word_idx is not None:
             is_favorite = self.main_window._is_word_index_favorite(self.current_word_idx)
+            # Restyling the button re-parses its style sheet; only do it when the state flips
+            if is_favorite == self._favorite_state:
+                return
+            self._favorite_state = is_favorite
             if is_favorite:
                 self.favorite_button.setText("💖 已收藏")
                 self.favorite_button.setStyleSheet("""
@@ -298,12 +308,45 @@ class WordTooltip(QWidget):
                     }
                 """)
     
-    def setContent(self, word, entry, word_idx=None):
+    def setContent(self, word, entry, word_idx=None, lemma_entry=None):
+        self._show_html(word, word_idx, self._remember(word, self._content_html(word, entry, lemma_entry)))
+
+    def setWord(self, word, word_idx, resolve):
+        """Show a word, looking it up and rendering it only if it is not cached.
+
+        Args:
+            word: Normalized word
+            word_idx: Transcript index of the word, for the favorite button
+            resolve: Called as resolve(word) -> (entry, lemma_entry) on a cache miss
+        """
+        html = self._html_cache.get(word)
+        if html is None:
+            html = self._remember(word, self._content_html(word, *resolve(word)))
+        else:
+            self._html_cache.move_to_end(word)
+        self._show_html(word, word_idx, html)
+
+    def _remember(self, word, html):
+        self._html_cache[word] = html
+        self._html_cache.move_to_end(word)
+        if len(self._html_cache) > self.HTML_CACHE_SIZE:
+            self._html_cache.popitem(last=False)
+        return html
+
+    def _show_html(self, word, word_idx, html):
         self.current_word = word
         self.current_word_idx = word_idx
         
         # 更新收藏按钮状态
         self._update_favorite_button()
+        if html != self.content_label.text():
+            self.content_label.setText(html)
+
+    def _content_html(self, word, entry, lemma_entry=None):
+        # 词形变化：没有单独词条时显示原形词条
+        lemma = lemma_entry.get('word', '') if lemma_entry else ''
+        if not entry and lemma_entry:
+            entry, lemma_entry = lemma_entry, None
         
         if not entry:
             content = f"""
@@ -325,8 +368,12 @@ class WordTooltip(QWidget):
             content = f"""
             <div style='margin-bottom: 8px;'>
                 <span style='font-size: {self.font_size + 2}px; font-weight: 600; color: #1f2937;'>{esc(word)}</span>
-            </div>
             """
+            if lemma:
+                content += f"""
+                <span style='color: #6b7280; font-size: {self.font_size - 1}px;'> → {esc(lemma)}</span>
+                """
+            content += "</div>"
             
             if phonetic:
                 content += f"""
@@ -367,33 +414,89 @@ class WordTooltip(QWidget):
                     <span style='color: #374151; font-size: {self.font_size - 1}px;'>{esc(translation)}</span>
                 </div>
                 """
+            
+            lemma_translation = lemma_entry.get('translation', '') if lemma_entry else ''
+            if lemma_translation:
+                if len(lemma_translation) > 60:
+                    lemma_translation = lemma_translation[:60] + "..."
+                content += f"""
+                <div style='margin-top: 6px; line-height: 1.3;'>
+                    <div style='color: #dc2626; font-size: {self.font_size - 2}px; font-weight: 600; margin-bottom: 3px;'>🔁 {esc(lemma)}</div>
+                    <span style='color: #374151; font-size: {self.font_size - 1}px;'>{esc(lemma_translation)}</span>
+                </div>
+                """
         
-        self.content_label.setText(content)
+        return content
 
 # Main window class
 class TranscriptBrowser(QTextBrowser):
     wordEditRequested = Signal(int)
     wordToggleFavoriteRequested = Signal(int)
 
+    # Paragraphs laid out at once; paragraphs hold a bounded number of words, so
+    # layout and paint cost do not grow with the length of the transcript
+    WINDOW_PARAGRAPHS = 24
+    # Paragraphs the window slides by when scrolling reaches one of its edges
+    WINDOW_STEP = 8
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._favorite_resolver = None
         self._hovered_anchor = None
-        self._original_html = ""
+        self._hover_index = -1
         self._tooltip_timer = QTimer()
         self._tooltip_timer.setSingleShot(True)
         self._tooltip_timer.timeout.connect(self._show_word_tooltip)
         self._current_tooltip = None
+        self._tooltip_visible = False
         self._dictionary = None
+        # Window owning the transcript and its settings, resolved once on first use
+        self._host = None
         self._was_playing_before_tooltip = False
         self.setMouseTracking(True)
+        # Format changes must not pile up on an undo stack in a read-only view
+        self.document().setUndoRedoEnabled(False)
+        self._highlighter = WordHighlighter(self.document(), self._is_favorite)
+        # Only a window of paragraphs [first, last) is laid out in the document
+        self._render_paragraphs = None
+        self._paragraph_count = 0
+        self._window = (0, 0)
+        self._window_timer = QTimer(self)
+        self._window_timer.setSingleShot(True)
+        self._window_timer.timeout.connect(self._check_window_edges)
+        self.verticalScrollBar().valueChanged.connect(lambda _: self._window_timer.start(0))
 
     def setFavoriteResolver(self, resolver_callable):
         self._favorite_resolver = resolver_callable
+
+    def setCurrentWord(self, index):
+        """Highlight the word being played (-1 clears) by restyling only the affected words."""
+        self._highlighter.set_current(index)
+
+    def _reindex_words(self):
+        self._highlighter.reset()
+        self._highlighter.index_from(0)
+        self._highlighter.reapply()
+
+    def clear(self):
+        super().clear()
+        self._hover_index = -1
+        self._highlighter.clear()
+        self._paragraph_count = 0
+        self._window = (0, 0)
     
     def setDictionary(self, dictionary):
         self._dictionary = dictionary
 
+    def _host_window(self):
+        """The main window showing this transcript, or None."""
+        if self._host is None:
+            host = self.parent()
+            while host is not None and not hasattr(host, 'transcript'):
+                host = host.parent()
+            self._host = host
+        return self._host
+
     def _is_favorite(self, idx: int) -> bool:
         try:
             return bool(self._favorite_resolver(idx)) if callable(self._favorite_resolver) else False
@@ -405,8 +508,8 @@ class TranscriptBrowser(QTextBrowser):
         scrollbar = self.verticalScrollBar()
         current_scroll_position = scrollbar.value()
         
-        self._original_html = html
         super().setHtml(html)
+        self._reindex_words()
         
         # Restore scroll position after HTML update (if not the initial load)
         if hasattr(self, '_has_content') and self._has_content:
@@ -414,6 +517,97 @@ class TranscriptBrowser(QTextBrowser):
         else:
             self._has_content = True
 
+    def setParagraphRenderer(self, render):
+        """Set the callable building the markup of paragraphs [first, last)."""
+        self._render_paragraphs = render
+
+    def setParagraphCount(self, count):
+        """Set how many transcript paragraphs exist in total."""
+        self._paragraph_count = count
+        first, last = self._window
+        self._window = (min(first, count), min(last, count))
+
+    def windowRange(self):
+        """Paragraphs (first, last) currently laid out in the document."""
+        return self._window
+
+    def showParagraphs(self, first):
+        """Replace the document with the window of paragraphs starting at first."""
+        count = self._paragraph_count
+        first = max(0, min(first, count - self.WINDOW_PARAGRAPHS))
+        last = min(count, first + self.WINDOW_PARAGRAPHS)
+        self._window = (first, last)
+        if self._render_paragraphs is None or last <= first:
+            return
+        self.setHtml("<html><body>" + self._render_paragraphs(first, last) + "</body></html>")
+
+    def ensureParagraphLoaded(self, paragraph):
+        """Re-center the window on a paragraph that is outside it or close to its edges.
+
+        Returns:
+            True if the document was replaced
+        """
+        first, last = self._window
+        margin = self.WINDOW_STEP // 2
+        if (first <= paragraph < last
+                and (first == 0 or paragraph >= first + margin)
+                and (last == self._paragraph_count or paragraph < last - margin)):
+            return False
+        self.showParagraphs(paragraph - self.WINDOW_PARAGRAPHS // 2)
+        return True
+
+    def growTranscript(self, paragraph_count, render_tail, new_paragraph=False):
+        """Account for words appended to the transcript while it is being streamed.
+
+        Words continuing the last paragraph are appended in place whenever the window
+        ends at the transcript tail; a new paragraph only if the window still has
+        room for it. Anything else is laid out once scrolled to.
+
+        Args:
+            paragraph_count: Total number of paragraphs after the append
+            render_tail: Callable returning the markup of the appended words
+            new_paragraph: Whether the appended words start a new paragraph instead
+                of continuing the last one
+        """
+        first, last = self._window
+        tail_laid_out = last > first and last == self._paragraph_count
+        self._paragraph_count = paragraph_count
+        if not tail_laid_out or (new_paragraph and paragraph_count - first > self.WINDOW_PARAGRAPHS):
+            self._window_timer.start(0)
+            return
+        cursor = QTextCursor(self.document())
+        cursor.movePosition(QTextCursor.End)
+        if new_paragraph:
+            cursor.insertBlock()
+        start = cursor.position()
+        cursor.insertHtml(render_tail())
+        self._highlighter.index_from(start)
+        self._window = (first, paragraph_count)
+
+    def _check_window_edges(self):
+        """Slide the window when scrolling gets within half a screen of its top or bottom."""
+        first, last = self._window
+        bar = self.verticalScrollBar()
+        if self._render_paragraphs is None or last <= first or bar.maximum() <= 0:
+            return
+        edge = self.viewport().height() // 2
+        if bar.value() >= bar.maximum() - edge and last < self._paragraph_count:
+            self._shift_window(first + self.WINDOW_STEP)
+        elif bar.value() <= edge and first > 0:
+            self._shift_window(first - self.WINDOW_STEP)
+
+    def _shift_window(self, first):
+        """Move the window while keeping the paragraph at the top of the viewport in place."""
+        bar = self.verticalScrollBar()
+        layout = self.document().documentLayout()
+        top_block = self.cursorForPosition(QPoint(0, 0)).block()
+        top_paragraph = self._window[0] + top_block.blockNumber()
+        offset = bar.value() - layout.blockBoundingRect(top_block).top()
+        self.showParagraphs(first)
+        block = self.document().findBlockByNumber(top_paragraph - self._window[0])
+        if block.isValid():
+            bar.setValue(int(layout.blockBoundingRect(block).top() + offset))
+
     def mouseMoveEvent(self, event):
 
         anchor = self.anchorAt(event.pos())
@@ -424,13 +618,13 @@ class TranscriptBrowser(QTextBrowser):
             self._current_mouse_pos = event.globalPos()
             self._apply_hover_effect(anchor)
 
-            parent_window = self.parent()
-            while parent_window and not hasattr(parent_window, 'hover_delay_ms'):
-                parent_window = parent_window.parent()
-            
-            delay = parent_window.hover_delay_ms if parent_window else 1000
-            if delay > 0:
+            host = self._host_window()
+            delay = host.hover_delay_ms if host else 1000
+            if delay >= 0:
                 self._tooltip_timer.start(delay)
+                # Resolve the word and its neighbours while the hover delay runs
+                if host is not None and delay > 0 and hasattr(host, '_prefetch_tooltip_entries'):
+                    host._prefetch_tooltip_entries(self._hover_index)
         elif not anchor and self._hovered_anchor:
 
             self._hovered_anchor = None
@@ -444,42 +638,21 @@ class TranscriptBrowser(QTextBrowser):
         super().mouseMoveEvent(event)
 
     def _apply_hover_effect(self, anchor):
-
-        is_fav = 'class="fav"' in self._original_html and f'<a href="{anchor}" class="fav"' in self._original_html
-        
-
-        hover_style = "background: #87ceeb !important; color: #1f2937 !important;"
-        
-
-        # Save current scroll position before modifying HTML
-        scrollbar = self.verticalScrollBar()
-        current_scroll_position = scrollbar.value()
-        
-        if is_fav:
-            modified_html = self._original_html.replace(
-                f'<a href="{anchor}" class="fav"',
-                f'<a href="{anchor}" style="{hover_style}"'
-            )
-        else:
-            modified_html = self._original_html.replace(
-                f'<a href="{anchor}"',
-                f'<a href="{anchor}" style="{hover_style}"'
-            )
-        super().setHtml(modified_html)
-        
-        # Restore scroll position after HTML update
-        scrollbar.setValue(current_scroll_position)
+        """Style the hovered word through its char format; cost depends only on the word."""
+        try:
+            idx = int(anchor.split(':', 2)[1])
+        except (IndexError, ValueError):
+            return
+        if idx == self._hover_index:
+            return
+        self._remove_hover_effect()
+        self._hover_index = idx
+        self._highlighter.set_layer(idx, 'hover', True)
 
     def _remove_hover_effect(self):
-
-        # Save current scroll position before modifying HTML
-        scrollbar = self.verticalScrollBar()
-        current_scroll_position = scrollbar.value()
-        
-        super().setHtml(self._original_html)
-        
-        # Restore scroll position after HTML update
-        scrollbar.setValue(current_scroll_position)
+        if self._hover_index >= 0:
+            self._highlighter.set_layer(self._hover_index, 'hover', False)
+            self._hover_index = -1
     
     def _show_word_tooltip(self):
         if not self._hovered_anchor or not self._dictionary:
@@ -490,70 +663,61 @@ class TranscriptBrowser(QTextBrowser):
             parts = self._hovered_anchor.split(':', 2)
             idx = int(parts[1])
             
-
-            parent_window = self.parent()
-            while parent_window and not hasattr(parent_window, 'words_data'):
-                parent_window = parent_window.parent()
-            
-            if not parent_window or not hasattr(parent_window, 'words_data'):
-                return
-                
-            if idx >= len(parent_window.words_data):
+            host = self._host_window()
+            if host is None or idx >= len(host.transcript):
                 return
                 
-            word = parent_window.words_data[idx].get('word', '').strip()
+            word = host.transcript.word(idx).strip()
 
             clean_word = word.strip('.,!?;:，。！？；：').lower()
             
 
-            entry = self._dictionary.lookup(clean_word)
-            
-
-            if hasattr(parent_window, 'pause_on_tooltip') and parent_window.pause_on_tooltip:
-                if hasattr(parent_window, 'player') and parent_window.player.playbackState() == QMediaPlayer.PlayingState:
+            if getattr(host, 'pause_on_tooltip', False) and not self._tooltip_visible:
+                if host.player.playbackState() == QMediaPlayer.PlayingState:
                     self._was_playing_before_tooltip = True
-                    parent_window.player.pause()
+                    host.player.pause()
                 else:
                     self._was_playing_before_tooltip = False
             
 
-            if self._current_tooltip:
-                self._current_tooltip.hide()
-                self._current_tooltip.deleteLater()
-            
-
-            parent_window = self.parent()
-            while parent_window and not hasattr(parent_window, 'tooltip_font_size'):
-                parent_window = parent_window.parent()
-            
-            font_size = parent_window.tooltip_font_size if parent_window else 14
-            self._current_tooltip = WordTooltip(font_size=font_size, main_window=parent_window)
-            self._current_tooltip.setContent(clean_word, entry, idx)
+            # One tooltip widget is reused; its content is cached per word
+            font_size = getattr(host, 'tooltip_font_size', 14)
+            if self._current_tooltip is None:
+                self._current_tooltip = WordTooltip(font_size=font_size, main_window=host)
+            else:
+                self._current_tooltip.setFontSize(font_size)
+            self._current_tooltip.setWord(clean_word, idx, self._resolve_word)
             
             pos = self._current_mouse_pos
             tooltip_pos = QPoint(pos.x() - 190, pos.y() - 180)
             
             self._current_tooltip.move(tooltip_pos)
             self._current_tooltip.show()
+            self._tooltip_visible = True
             
         except Exception as e:
             print(f"Tooltip display error: {e}")
+
+    def _resolve_word(self, word):
+        """(entry, lemma_entry) of a normalized word, from the session vocabulary cache when available."""
+        # Inflected forms ("went", "studies") also resolve to their lemma in one lookup
+        host = self._host_window()
+        vocab = getattr(host, 'vocab', None)
+        annotation = vocab.lookup(word) if vocab is not None else None
+        if annotation is not None:
+            return annotation.lookup_pair()
+        return self._dictionary.lookup_with_lemma(word)
     
     def _hide_tooltip(self):
         if self._current_tooltip:
             self._current_tooltip.hide()
-            self._current_tooltip.deleteLater()
-            self._current_tooltip = None
+        self._tooltip_visible = False
         
 
         if self._was_playing_before_tooltip:
-            parent_window = self.parent()
-            while parent_window and not hasattr(parent_window, 'player'):
-                parent_window = parent_window.parent()
-            
-            if parent_window and hasattr(parent_window, 'player'):
-                if parent_window.player.playbackState() == QMediaPlayer.PausedState:
-                    parent_window.player.play()
+            host = self._host_window()
+            if host is not None and host.player.playbackState() == QMediaPlayer.PausedState:
+                host.player.play()
             
             self._was_playing_before_tooltip = False
 
@@ -617,10 +781,53 @@ class TranscriptBrowser(QTextBrowser):
             super().contextMenuEvent(event)
 
 class MainWindow(QMainWindow):
+    # Emitted from the TTS thread with the audio file of a word ('' if it was spoken directly)
+    pronunciationReady = Signal(str, str)
+    # Pre-synthesis progress from the TTS thread: done, total, already cached
+    pronunciationProgress = Signal(int, int, int)
+    # Live search results from a worker thread: generation, (query, entry, completions, suggestions)
+    searchResultsReady = Signal(int, object)
+    # Full-text search results from a worker thread: generation, (query, [(entry, score)])
+    fullTextResultsReady = Signal(int, object)
+    # Transcript vocabulary annotated in a worker thread:
+    # generation, ({normalized word: WordAnnotation}, difficulty tier of every word)
+    vocabularyAnnotated = Signal(int, object)
+    # Export finished in a worker thread: output path, error message ('' on success)
+    exportFinished = Signal(str, str)
+
     class WorkerSignals(QObject):
         finished = Signal(list);
         error = Signal(str);
         progress = Signal(int)
+        words_batch = Signal(list)
+
+    # settings.json key -> (attribute, program default)
+    SETTING_ATTRIBUTES = {
+        "font_size_px": ("text_font_size_px", 18),
+        "line_height": ("text_line_height", 2.0),
+        "auto_play_after_transcription": ("auto_play_after_transcription", True),
+        "auto_scroll_enabled": ("auto_scroll_enabled", False),
+        "hover_delay_ms": ("hover_delay_ms", 1000),
+        "tooltip_font_size": ("tooltip_font_size", 14),
+        "speech_rate": ("speech_rate", 200),
+        "pause_on_tooltip": ("pause_on_tooltip", False),
+        "transcript_cache_max_mb": ("transcript_cache_max_mb", 256),
+        "tts_cache_max_mb": ("tts_cache_max_mb", 128),
+        "stream_transcription": ("stream_transcription", True),
+        "parallel_workers": ("parallel_workers", 0),
+        "parallel_cpu_threads": ("parallel_cpu_threads", 4),
+        "parallel_min_duration_s": ("parallel_min_duration_s", 600),
+        "difficulty_coloring": ("difficulty_coloring", False),
+        "presynthesize_all_words": ("presynthesize_all_words", False),
+    }
+    # Most frequent transcript words pre-rendered besides favorites and the words on screen
+    PRESYNTH_FREQUENT_WORDS = 200
+    # Settings that change how the transcript document is rendered
+    TRANSCRIPT_SETTINGS = ("font_size_px", "line_height", "difficulty_coloring")
+    # Settings restored by "Reset to defaults"
+    RESETTABLE_SETTINGS = ("font_size_px", "line_height", "auto_play_after_transcription", "auto_scroll_enabled",
+                           "hover_delay_ms", "tooltip_font_size", "speech_rate", "pause_on_tooltip",
+                           "difficulty_coloring", "presynthesize_all_words")
 
     def __init__(self):
         super().__init__()
@@ -630,13 +837,34 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("EchoScribe");
         self.resize(850, 600)
         self.setAcceptDrops(True);
-        self.transcriber = Transcriber();
-        self.dictionary = Dictionary()
+        # Model and dictionary are loaded in the background after the window is set up
+        self.transcriber = None
+        self.dictionary = None
+        # 词汇注释的会话缓存：整篇转录一次批量查词，之后悬浮提示与收藏摘要直接读取
+        self.vocab = None
+        self.transcript_vocabulary = {}
+        self._vocab_generation = 0
+        self.word_tiers = bytearray()  # 每个单词的难度等级，着色时作为样式类名
+        self._prefetched_range = (0, 0)  # 已预取词条的单词范围 [start, end)
+        # 后台预取：只保留最新的待查单词，同一时刻最多一个线程
+        self._prefetch_lock = Lock()
+        self._prefetch_words = None
+        self._prefetch_running = False
+        self.audio_path = None
+        self.project = None  # 已保存的工程文件，单词修改会追加写入其日志
+        self.difficulty_coloring = False
+        self.presynthesize_all_words = False
+        self.parallel_transcriber = None
+        self.resources = ResourceLoader(self)
         self._drag_pos = QPoint();
         self.duration = 0
         self.player = QMediaPlayer();
         self.audio_output = QAudioOutput()
         self.player.setAudioOutput(self.audio_output)
+        # 单词发音使用独立的播放器，不打断音频播放状态
+        self.pronunciation_player = QMediaPlayer(self)
+        self.pronunciation_output = QAudioOutput(self)
+        self.pronunciation_player.setAudioOutput(self.pronunciation_output)
         self._pending_seek_ms = None
         self.favorites = set()
         self.text_font_size_px = 18
@@ -646,18 +874,45 @@ class MainWindow(QMainWindow):
         self.auto_scroll_enabled = False  # 新增自动滚动设置
         self._current_word_index = -1  # 当前播放单词的索引
         self._current_highlight_index = -1  # 当前高亮单词的索引
+        self._paragraph_starts = []  # 每个段落首个单词的索引
+        self.transcript = TranscriptStore()  # 单词文本、起止时间、置信度与分段的列式存储
+        # Fires exactly when playback reaches the next word's start time
+        self._word_boundary_timer = QTimer(self)
+        self._word_boundary_timer.setSingleShot(True)
+        self._word_boundary_timer.setTimerType(Qt.PreciseTimer)
+        self._word_boundary_timer.timeout.connect(self._on_word_boundary_timer)
+        # Several setting changes in one event loop pass (e.g. a reset) re-render the transcript once
+        self._settings_render_timer = QTimer(self)
+        self._settings_render_timer.setSingleShot(True)
+        self._settings_render_timer.setInterval(0)
+        self._settings_render_timer.timeout.connect(self._render_transcript)
+        self._next_boundary_ms = 0
         # 🎵 歌词式显示模式 - 类似网易云音乐
         self._lyrics_mode_active = False  # 是否处于歌词模式（禁用手动滚动）
         self.hover_delay_ms = 1000
         self.tooltip_font_size = 14
         self.speech_rate = 200
         self.pause_on_tooltip = False
-        
-        self.tts_engine = None
+        self.transcript_cache_max_mb = 256
+        self.tts_cache_max_mb = 128
+        self.stream_transcription = True
+        self.parallel_workers = 0  # 0 = auto, 1 = off
+        self.parallel_cpu_threads = 4
+        self.parallel_min_duration_s = 600
+        self._streaming_started = False
+        self.last_time_to_first_word_ms = None
 
 
         self._load_settings()
         self._load_favorites()
+        self.transcript_cache = TranscriptCache(self._get_user_data_path() / "transcript_cache",
+                                                max_bytes=self.transcript_cache_max_mb * 1024 * 1024)
+        self.pronunciationReady.connect(self._on_pronunciation_ready)
+        self.tts_service = TtsService(self._get_user_data_path() / "tts_cache",
+                                      on_ready=lambda word, path: self.pronunciationReady.emit(word, str(path or '')),
+                                      rate=self.speech_rate,
+                                      on_progress=self.pronunciationProgress.emit,
+                                      max_bytes=self.tts_cache_max_mb * 1024 * 1024)
 
         self._setup_ui()
         self._connect_signals()
@@ -666,6 +921,7 @@ class MainWindow(QMainWindow):
         self._refresh_favorites_page()
         
         self._switch_tab(0, initial=True)
+        self._start_background_loading()
         
         # 调试信息：显示自动滚动状态
         print(f"[DEBUG] EchoScribe started. Auto-scroll enabled: {self.auto_scroll_enabled}")
@@ -677,6 +933,51 @@ class MainWindow(QMainWindow):
         else:
             print(f"[DEBUG] 🎵 歌词模式待命：可在设置中启用自动滚动功能")
 
+    def _start_background_loading(self):
+        """Load the speech model and dictionary without blocking the first paint."""
+        # The compiled dictionary index lives in the user data directory, which is always writable
+        index_path = self._get_user_data_path() / "dict" / "ecdict.idx"
+        self.resources.start("dictionary", lambda: Dictionary(index_path=index_path))
+        self.resources.start("transcriber", Transcriber)
+        self.resources.when_ready("dictionary", self._on_dictionary_ready)
+        self.resources.when_ready("transcriber", self._on_transcriber_ready)
+
+    def _show_dictionary_unavailable(self):
+        """Explain a search made without a dictionary; it is repeated once the dictionary has loaded."""
+        if self.resources.is_ready("dictionary"):
+            # 词典加载失败，不会再有结果
+            self._search_pending = False
+            self.search_result.setHtml("<span style='color:#999'>Dictionary failed to load</span>")
+            return
+        self._search_pending = True
+        self.search_result.setHtml("<span style='color:#999'>Dictionary is loading...</span>")
+
+    def _on_dictionary_ready(self, dictionary):
+        if dictionary is None:
+            if getattr(self, '_search_pending', False):
+                self._show_dictionary_unavailable()
+            return
+        self.dictionary = dictionary
+        self.vocab = VocabularyAnnotator(dictionary)
+        self.transcript_browser.setDictionary(dictionary)
+        # Briefs painted before the dictionary was ready are empty
+        self.favorites_model.invalidate_briefs()
+        # Run a search that was typed while the dictionary was still loading
+        if getattr(self, '_search_pending', False):
+            self._search_pending = False
+            self._perform_search()
+
+    def _on_transcriber_ready(self, transcriber):
+        if transcriber is None:
+            if self.load_button.isEnabled():
+                self.status_label.setText("Speech model failed to load, transcription is unavailable")
+            return
+        self.transcriber = transcriber
+        self._create_parallel_transcriber()
+        # Favorites are pre-rendered once the model no longer needs the CPU, unless a file is already queued
+        if self.load_button.isEnabled():
+            self._start_pronunciation_presynthesis()
+
     def _get_application_path(self) -> Path:
         """Get application root directory path for reading resource files."""
         if getattr(sys, 'frozen', False):
@@ -695,102 +996,47 @@ class MainWindow(QMainWindow):
         return user_data_dir
 
     def _load_settings(self):
-        user_settings_path = self._get_user_data_path() / "settings.json"
-        default_settings_path = self._get_application_path() / "Assets" / "config" / "settings.json"
-        
-        try:
-            if user_settings_path.exists():
-                with user_settings_path.open("r", encoding="utf-8") as f:
-                    data = json.load(f)
-                print(f"[DEBUG] 从用户设置加载: {user_settings_path}")
-            elif default_settings_path.exists():
-                with default_settings_path.open("r", encoding="utf-8") as f:
-                    data = json.load(f)
-                self._save_settings_data(data)
-                print(f"[DEBUG] 从默认设置加载: {default_settings_path}")
-            else:
-                data = {}
-                print(f"[DEBUG] 使用程序默认设置")
-            
-            self.text_font_size_px = data.get("font_size_px", 18)
-            self.text_line_height = data.get("line_height", 2.0)
-            self.auto_play_after_transcription = data.get("auto_play_after_transcription", True)
-            self.auto_scroll_enabled = data.get("auto_scroll_enabled", False)
-            self.hover_delay_ms = data.get("hover_delay_ms", 1000)
-            self.tooltip_font_size = data.get("tooltip_font_size", 14)
-            self.speech_rate = data.get("speech_rate", 200)
-            self.pause_on_tooltip = data.get("pause_on_tooltip", False)
-            
-            # 🎵 确保歌词模式状态与设置一致
-            self._lyrics_mode_active = self.auto_scroll_enabled
-            print(f"[DEBUG] 设置加载完成 - 自动滚动: {self.auto_scroll_enabled}")
-            
-        except Exception as e:
-            print(f"[DEBUG] Failed to load settings: {e}")
-            pass
-
-    def _save_settings(self):
-        data = {
-            "font_size_px": self.text_font_size_px,
-            "line_height": self.text_line_height,
-            "volume": self.volume_slider.value(),
-            "playback_rate": self.rate_combo.currentText(),
-            "show_progress": self.show_progress_checkbox.isChecked(),
-            "auto_play_after_transcription": self.auto_play_after_transcription,
-            "auto_scroll_enabled": self.auto_scroll_enabled,
-            "hover_delay_ms": self.hover_delay_ms,
-            "tooltip_font_size": self.tooltip_font_size,
-            "speech_rate": self.speech_rate,
-            "pause_on_tooltip": self.pause_on_tooltip
-        }
-        self._save_settings_data(data)
-    
-    def _save_settings_data(self, data):
-        """Save settings data to user directory."""
-        settings_path = self._get_user_data_path() / "settings.json"
-        try:
-            with settings_path.open("w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            print(f"[DEBUG] Settings saved to: {settings_path}")
-        except Exception as e:
-            print(f"[DEBUG] Failed to save settings: {e}")
-            pass
+        self.settings = SettingsService(self._get_user_data_path() / "settings.json",
+                                        self._get_application_path() / "Assets" / "config" / "settings.json",
+                                        parent=self)
+        self._apply_settings({key: self.settings.get(key, default)
+                              for key, (_, default) in self.SETTING_ATTRIBUTES.items()})
+        # 订阅者按注册顺序调用：先同步属性，再只刷新受影响的视图
+        self.settings.subscribe(self.SETTING_ATTRIBUTES, self._apply_settings)
+        self.settings.subscribe(self.TRANSCRIPT_SETTINGS, lambda _: self._settings_render_timer.start())
+        self.settings.subscribe(("speech_rate",), lambda changed: setattr(self.tts_service, "rate",
+                                                                          changed["speech_rate"]))
+
+        # 🎵 确保歌词模式状态与设置一致
+        self._lyrics_mode_active = self.auto_scroll_enabled
+        print(f"[DEBUG] 设置加载完成 - 自动滚动: {self.auto_scroll_enabled}")
+
+    def _apply_settings(self, changed):
+        """Mirror changed settings into the attributes the rest of the window reads."""
+        for key, value in changed.items():
+            setattr(self, self.SETTING_ATTRIBUTES[key][0], value)
 
     def _load_favorites(self):
-
+        db_path = self._get_user_data_path() / "favorites.db"
         user_favorites_path = self._get_user_data_path() / "favorites.json"
         default_favorites_path = self._get_application_path() / "Assets" / "config" / "favorites.json"
-        
-        try:
-            if user_favorites_path.exists():
-
-                with user_favorites_path.open("r", encoding="utf-8") as f:
-                    data = json.load(f)
-            elif default_favorites_path.exists():
-
-                with default_favorites_path.open("r", encoding="utf-8") as f:
-                    data = json.load(f)
+        first_run = not db_path.exists()
 
-                self._save_favorites()
-            else:
-
-                data = []
-            
-            self.favorites = set(data) if isinstance(data, list) else set()
+        try:
+            self.favorites = FavoritesStore(db_path)
+            if first_run:
+                # 从旧版 favorites.json 迁移，迁移后保留为 .bak 备份
+                if user_favorites_path.exists():
+                    count = self.favorites.migrate_json(user_favorites_path)
+                    user_favorites_path.replace(user_favorites_path.with_suffix(".json.bak"))
+                    print(f"[DEBUG] Migrated {count} favorites from {user_favorites_path}")
+                elif default_favorites_path.exists():
+                    self.favorites.migrate_json(default_favorites_path)
             print(f"[DEBUG] Favorites loaded: {len(self.favorites)} words")
         except Exception as e:
             print(f"[DEBUG] Failed to load favorites: {e}")
-            self.favorites = set()
-
-    def _save_favorites(self):
-        favorites_path = self._get_user_data_path() / "favorites.json"
-        try:
-            with favorites_path.open("w", encoding="utf-8") as f:
-                json.dump(sorted(list(self.favorites)), f, indent=2, ensure_ascii=False)
-            print(f"[DEBUG] Favorites saved to: {favorites_path}")
-        except Exception as e:
-            print(f"[DEBUG] Failed to save favorites: {e}")
-            pass
+            # Keep working for this session without persisting
+            self.favorites = FavoritesStore(":memory:")
 
     def _setup_ui(self):
         root_widget = QWidget();
@@ -851,6 +1097,10 @@ class MainWindow(QMainWindow):
         layout = QVBoxLayout(page);
         layout.setContentsMargins(20, 20, 20, 20)
         self.load_button = QPushButton("Import audio file or drag and drop here");
+        self.save_project_button = QPushButton("Save Project")
+        self.save_project_button.setEnabled(False)
+        self.export_button = QPushButton("Export...")
+        self.export_button.setEnabled(False)
         self.status_label = QLabel("Welcome to EchoScribe")
 
         self.transcription_progress = QProgressBar()
@@ -878,7 +1128,11 @@ class MainWindow(QMainWindow):
         # 暂时禁用用户滚动检测，确保自动滚动正常工作
         # self.transcript_browser.verticalScrollBar().valueChanged.connect(self._on_scroll_value_changed)
         self.playback_controls = self._create_playback_controls()
-        layout.addWidget(self.load_button);
+        load_row = QHBoxLayout()
+        load_row.addWidget(self.load_button, 1)
+        load_row.addWidget(self.save_project_button)
+        load_row.addWidget(self.export_button)
+        layout.addLayout(load_row)
         layout.addWidget(self.status_label);
         layout.addWidget(self.transcription_progress)
         layout.addWidget(self.transcript_browser, 1);
@@ -916,6 +1170,12 @@ class MainWindow(QMainWindow):
         
         self.pause_on_tooltip_checkbox = QCheckBox("Pause when tooltip appears")
         self.pause_on_tooltip_checkbox.setChecked(self.pause_on_tooltip)
+
+        self.difficulty_checkbox = QCheckBox("Color words by difficulty")
+        self.difficulty_checkbox.setChecked(self.difficulty_coloring)
+
+        self.presynth_all_checkbox = QCheckBox("Prepare pronunciations of every transcript word")
+        self.presynth_all_checkbox.setChecked(self.presynthesize_all_words)
         
         self.hover_delay_combo = QComboBox()
         self.hover_delay_combo.addItems(["Off", "0s", "0.5s", "1s (default)", "2s", "3s"])
@@ -934,32 +1194,60 @@ class MainWindow(QMainWindow):
         rate_map = {150: "Slow (150)", 200: "Normal (200) (default)", 250: "Fast (250)", 300: "Very Fast (300)"}
         self.speech_rate_combo.setCurrentText(rate_map.get(self.speech_rate, "Normal (200) (default)"))
         
+        self.workers_combo = QComboBox()
+        self.workers_combo.addItems(["Off", "Auto (default)", "2", "4", "8", "16"])
+        workers_map = {1: "Off", 0: "Auto (default)"}
+        self.workers_combo.setCurrentText(workers_map.get(self.parallel_workers, str(self.parallel_workers)))
+        
         self.show_progress_checkbox.setChecked(True)
         self.btn_reset_settings = QPushButton("Reset to defaults")
         self.btn_reset_settings.clicked.connect(self._reset_settings)
+        self.btn_clear_transcript_cache = QPushButton("Clear transcript cache")
+        self.btn_clear_transcript_cache.clicked.connect(self._clear_transcript_cache)
+        self.btn_clear_tts_cache = QPushButton("Clear pronunciation cache")
+        self.btn_clear_tts_cache.clicked.connect(self._clear_tts_cache)
         layout.addRow("Volume", self.volume_slider);
         layout.addRow("Speed", self.rate_combo);
         layout.addRow("", self.show_progress_checkbox)
         layout.addRow("", self.auto_play_checkbox)
         layout.addRow("", self.auto_scroll_checkbox)
         layout.addRow("", self.pause_on_tooltip_checkbox)
+        layout.addRow("", self.difficulty_checkbox)
+        layout.addRow("", self.presynth_all_checkbox)
         layout.addRow("Font Size(px)", self.font_size_combo)
         layout.addRow("Line Height", self.line_height_combo)
         layout.addRow("Hover Delay", self.hover_delay_combo)
         layout.addRow("Tooltip Font", self.tooltip_font_combo)
         layout.addRow("Speech Rate", self.speech_rate_combo)
+        layout.addRow("Transcription Workers", self.workers_combo)
+        self.pronunciation_status_label = QLabel("")
+        self.pronunciation_status_label.setWordWrap(True)
+        self.pronunciationProgress.connect(self._update_pronunciation_status)
+        self._update_pronunciation_status()
         layout.addRow("", self.btn_reset_settings)
+        layout.addRow("", self.btn_clear_transcript_cache)
+        layout.addRow("", self.btn_clear_tts_cache)
+        layout.addRow("Pronunciations", self.pronunciation_status_label)
+        self.difficulty_summary_label = QLabel("No transcript analyzed yet")
+        self.difficulty_summary_label.setWordWrap(True)
+        layout.addRow("Vocabulary", self.difficulty_summary_label)
         return page
 
     def _create_favorites_page(self):
         page = QWidget();
         layout = QVBoxLayout(page);
         layout.setContentsMargins(20, 20, 20, 20)
-        self.favorites_list = QListWidget()
+        # Rows are painted by the delegate; briefs are looked up only for rows that get painted
+        self.favorites_model = FavoritesModel(self._format_brief_for_word, self)
+        self.favorites_list = QListView()
+        self.favorites_list.setModel(self.favorites_model)
+        self.favorites_list.setItemDelegate(FavoriteItemDelegate(self.favorites_list))
+        self.favorites_list.setUniformItemSizes(True)
         self.favorites_list.setSpacing(8)
-        self.favorites_list.setAlternatingRowColors(False)
-        self.favorites_list.setStyleSheet("QListWidget { background: transparent; border: none; }")
-        self.favorites_list.itemClicked.connect(self._open_favorite_detail)
+        self.favorites_list.setMouseTracking(True)
+        self.favorites_list.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.favorites_list.setStyleSheet("QListView { background: transparent; border: none; }")
+        self.favorites_list.clicked.connect(self._open_favorite_detail)
         btns = QHBoxLayout()
         self.btn_remove_favorite = QPushButton("Remove Selected")
         self.btn_remove_favorite.clicked.connect(self._remove_selected_favorite)
@@ -983,10 +1271,26 @@ class MainWindow(QMainWindow):
         self.search_result.anchorClicked.connect(self._on_search_anchor_clicked)
         self.btn_add_to_fav = QPushButton("Add to Favorites")
         self.btn_add_to_fav.clicked.connect(self._add_search_to_favorites)
+        # 反查：在中文释义和英文解释中搜索（首次使用时在后台建立全文索引）
+        self.fulltext_checkbox = QCheckBox("Search meanings (Chinese translation / English definition)")
+        self.fulltext_checkbox.toggled.connect(self._on_fulltext_toggled)
+        self.resources.resourceFailed.connect(self._on_resource_failed)
+        self.fullTextResultsReady.connect(self._on_fulltext_results)
+        self.vocabularyAnnotated.connect(self._on_vocabulary_annotated)
+        self.exportFinished.connect(self._on_export_finished)
         layout.addWidget(self.search_input)
+        layout.addWidget(self.fulltext_checkbox)
         layout.addWidget(self.search_result, 1)
         layout.addWidget(self.btn_add_to_fav)
         self.search_input.returnPressed.connect(self._perform_search)
+        # 边输入边搜索：防抖后在后台线程计算前缀补全与拼写纠错，过期结果按代数丢弃
+        self._search_generation = 0
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+        self._search_timer.timeout.connect(self._start_live_search)
+        self.search_input.textEdited.connect(lambda _: self._search_timer.start())
+        self.searchResultsReady.connect(self._on_live_search_results)
         return page
 
     def _create_playback_controls(self):
@@ -1010,6 +1314,8 @@ class MainWindow(QMainWindow):
         self.favorites_tab_button.clicked.connect(lambda: self._switch_tab(2))
         self.search_tab_button.clicked.connect(lambda: self._switch_tab(3))
         self.load_button.clicked.connect(self._handle_load_file_dialog)
+        self.save_project_button.clicked.connect(self._save_project)
+        self.export_button.clicked.connect(self._export_transcript)
         self.play_pause_button.clicked.connect(self._toggle_playback)
         self.player.playbackStateChanged.connect(self._update_play_pause_button_icon)
         self.volume_slider.valueChanged.connect(self._set_volume);
@@ -1019,9 +1325,13 @@ class MainWindow(QMainWindow):
         self.auto_play_checkbox.stateChanged.connect(self._on_auto_play_changed)
         self.auto_scroll_checkbox.stateChanged.connect(self._on_auto_scroll_changed)
         self.pause_on_tooltip_checkbox.stateChanged.connect(self._on_pause_on_tooltip_changed)
+        self.difficulty_checkbox.stateChanged.connect(self._on_difficulty_coloring_changed)
+        self.presynth_all_checkbox.stateChanged.connect(self._on_presynthesize_all_changed)
         self.hover_delay_combo.currentTextChanged.connect(self._on_hover_delay_changed)
         self.tooltip_font_combo.currentTextChanged.connect(self._on_tooltip_font_changed)
         self.speech_rate_combo.currentTextChanged.connect(self._on_speech_rate_changed)
+        self.workers_combo.currentTextChanged.connect(self._on_workers_changed)
+        self.show_progress_checkbox.toggled.connect(lambda checked: self.settings.set("show_progress", checked))
         self.progress_slider.sliderReleased.connect(lambda: self.player.setPosition(self.progress_slider.value()))
         self.player.positionChanged.connect(self._update_progress);
         self.player.durationChanged.connect(self._set_progress_range)
@@ -1066,71 +1376,286 @@ class MainWindow(QMainWindow):
         self.anim_fade_in.start()
 
     def _process_file(self, file_path_str):
-        self.player.stop();
-        self.progress_slider.setValue(0);
-        self.time_label.setText("00:00 / 00:00")
-        self._pending_seek_ms = None
-        self._current_word_index = -1  # 重置当前单词索引
-        self._current_highlight_index = -1  # 重置当前高亮索引
-        # 如果之前启用了歌词模式，需要重新设置
-        if self.auto_scroll_enabled:
-            self._set_lyrics_mode(True)
-
-
+        if Path(file_path_str).suffix.lower() == ProjectFile.SUFFIX:
+            self._open_project(file_path_str)
+            return
+        self._reset_transcript_state()
+        self.audio_path = file_path_str
         self.transcription_progress.setVisible(self.show_progress_checkbox.isChecked())
         self.transcription_progress.setValue(0)
 
         self.transcript_browser.clear()
-        self.status_label.setText(f"Processing audio: {Path(file_path_str).name} ...")
+        if self.resources.is_ready("transcriber"):
+            self.status_label.setText(f"Processing audio: {Path(file_path_str).name} ...")
+        else:
+            self.status_label.setText(f"Waiting for speech model to load: {Path(file_path_str).name} ...")
         self.player.setSource(QUrl.fromLocalFile(file_path_str));
         self.load_button.setEnabled(False)
+        self.save_project_button.setEnabled(False)
+        self.export_button.setEnabled(False)
         self.signals = self.WorkerSignals();
         self.signals.finished.connect(self._on_transcription_finished)
         self.signals.error.connect(self._on_transcription_error);
         self.signals.progress.connect(self.transcription_progress.setValue)
+        self.signals.words_batch.connect(self._on_transcription_words_batch)
         thread = Thread(target=self._run_transcription_in_worker, args=(file_path_str,));
         thread.daemon = True;
         thread.start()
 
+    def _reset_transcript_state(self):
+        """Stop playback and forget the current transcript before another one is loaded."""
+        self.player.stop();
+        self.progress_slider.setValue(0);
+        self.time_label.setText("00:00 / 00:00")
+        self._pending_seek_ms = None
+        self._current_word_index = -1  # 重置当前单词索引
+        self._current_highlight_index = -1  # 重置当前高亮索引
+        self._streaming_started = False
+        self.transcript = TranscriptStore()
+        self._vocab_generation += 1
+        self.transcript_vocabulary = {}
+        self.word_tiers = bytearray()
+        self._prefetched_range = (0, 0)
+        self._word_boundary_timer.stop()
+        # 新的转录开始时停止预合成，避免与模型争抢CPU
+        self.tts_service.cancel_presynthesis()
+        self._update_pronunciation_status()
+        self.last_time_to_first_word_ms = None
+        # 新的转录或工程尚未保存
+        self.project = None
+        # 如果之前启用了歌词模式，需要重新设置
+        if self.auto_scroll_enabled:
+            self._set_lyrics_mode(True)
+
+    def _open_project(self, path):
+        """Show a saved project right away: its words come from the file, no transcription is needed."""
+        try:
+            started_at = time.perf_counter()
+            project, transcript = ProjectFile.open(Path(path))
+        except (OSError, ValueError) as e:
+            self.status_label.setText(f"Failed to open project: {e}")
+            return
+        self._reset_transcript_state()
+        self.project = project
+        self.transcript = transcript
+        self.transcript_browser.clear()
+        self.transcript_browser.setFavoriteResolver(self._is_word_index_favorite)
+        self.transcript_browser.setDictionary(self.dictionary)
+        self._render_transcript()
+        audio = project.resolve_audio()
+        self.audio_path = str(audio) if audio else project.audio_path
+        if audio is not None:
+            self.player.setSource(QUrl.fromLocalFile(str(audio)))
+            self.status_label.setText(f"Opened project {Path(path).name} ({len(transcript)} words, "
+                                      f"{(time.perf_counter() - started_at) * 1000:.0f} ms)")
+        else:
+            self.status_label.setText(f"Opened project {Path(path).name}, "
+                                      f"but its audio file was not found: {project.audio_path}")
+        self.save_project_button.setEnabled(True)
+        self.export_button.setEnabled(True)
+        self._start_pronunciation_presynthesis()
+        self.resources.when_ready("dictionary", lambda _: self._start_vocabulary_annotation())
+
+    def _save_project(self):
+        if not len(self.transcript):
+            return
+        if self.project is None:
+            default = Path(self.audio_path).with_suffix(ProjectFile.SUFFIX) if self.audio_path else ""
+            path, _ = QFileDialog.getSaveFileName(self, "Save Project", str(default),
+                                                  f"EchoScribe Projects (*{ProjectFile.SUFFIX})")
+            if not path:
+                return
+            if not path.lower().endswith(ProjectFile.SUFFIX):
+                path += ProjectFile.SUFFIX
+            try:
+                self.project = ProjectFile.create(Path(path), self.audio_path or "", self.transcript)
+            except OSError as e:
+                self.status_label.setText(f"Failed to save project: {e}")
+                return
+        elif self.project.needs_compaction:
+            # Edits are already journaled; saving only folds a long journal into the snapshot
+            self._compact_project()
+        self.status_label.setText(f"Project saved: {self.project.path.name}")
+
+    def _export_transcript(self):
+        if not len(self.transcript):
+            return
+        filters = [f"{description} (*{suffix})" for _, suffix, description in FORMATS.values()]
+        default = Path(self.audio_path).with_suffix(".srt") if self.audio_path else ""
+        path, selected = QFileDialog.getSaveFileName(self, "Export Transcript", str(default),
+                                                     ";;".join(filters))
+        if not path:
+            return
+        fmt = format_for_path(path)
+        if fmt is None:
+            # No known suffix typed: use the format of the selected filter
+            fmt = list(FORMATS)[filters.index(selected)] if selected in filters else "srt"
+            path += FORMATS[fmt][1]
+        self.export_button.setEnabled(False)
+        self.status_label.setText(f"Exporting {Path(path).name} ...")
+        transcript = self.transcript
+
+        def work():
+            # Words are streamed from the columns into the file; no copy of the document is built
+            try:
+                export_file(transcript.iter_dicts(), Path(path), fmt)
+                self.exportFinished.emit(path, "")
+            except Exception as e:
+                self.exportFinished.emit(path, str(e))
+
+        Thread(target=work, name="export", daemon=True).start()
+
+    @Slot(str, str)
+    def _on_export_finished(self, path, error):
+        # Stays disabled while a new transcription is running
+        self.export_button.setEnabled(self.load_button.isEnabled() and bool(len(self.transcript)))
+        if error:
+            self.status_label.setText(f"Failed to export {Path(path).name}: {error}")
+        else:
+            self.status_label.setText(f"Exported {Path(path).name}")
+
+    def _compact_project(self):
+        try:
+            self.project.compact(self.transcript)
+        except OSError as e:
+            print(f"[DEBUG] Failed to compact project: {e}")
+
+    @Slot(list)
+    def _on_transcription_words_batch(self, words):
+        """Show freshly decoded words while the rest of the file is still transcribing."""
+        if not words:
+            return
+        if not self._streaming_started:
+            self._streaming_started = True
+            self.transcript = TranscriptStore(words)
+            self.transcript_browser.setFavoriteResolver(self._is_word_index_favorite)
+            self.transcript_browser.setDictionary(self.dictionary)
+            self._render_transcript()
+            if self.last_time_to_first_word_ms is not None:
+                self.status_label.setText(
+                    f"Transcribing... first words after {self.last_time_to_first_word_ms / 1000:.1f}s")
+            return
+        start = len(self.transcript)
+        self.transcript.extend(words)
+        self._layout_paragraphs(start)
+        end = len(self.transcript)
+        self.transcript_browser.growTranscript(
+            len(self._paragraph_starts), lambda: self._words_html(start, end),
+            new_paragraph=self._starts_paragraph(start))
+
     @Slot(list)
     def _on_transcription_finished(self, words_data):
-        self.status_label.setText("Processing completed!");
+        stats = None
+        if self.parallel_transcriber is not None and self.parallel_transcriber.enabled:
+            stats = self.parallel_transcriber.last_stats
+            self.parallel_transcriber.last_stats = None
+        if stats:
+            self.status_label.setText(f"Processing completed! (RTF {stats['real_time_factor']:.2f}, "
+                                      f"{stats['workers']} workers)")
+        else:
+            self.status_label.setText("Processing completed!");
         self.load_button.setEnabled(True)
+        self.save_project_button.setEnabled(True)
+        self.export_button.setEnabled(True)
         self.transcription_progress.setVisible(False)
-        self.words_data = words_data
+        already_shown = self._streaming_started and len(self.transcript) == len(words_data)
+        self._streaming_started = False
+        if not already_shown:
+            self.transcript = TranscriptStore(words_data)
         self.transcript_browser.setFavoriteResolver(self._is_word_index_favorite)
         self.transcript_browser.setDictionary(self.dictionary)
-        self._render_transcript()
+        if not already_shown:
+            self._render_transcript()
         if self.auto_play_after_transcription and self.player.source().isValid(): 
             self.player.play()
-        self._refresh_favorites_page()
+        self._start_pronunciation_presynthesis()
+        self.resources.when_ready("dictionary", lambda _: self._start_vocabulary_annotation())
+
+    def _start_vocabulary_annotation(self):
+        """Annotate every distinct word of the transcript in one background batch."""
+        if self.vocab is None or not len(self.transcript):
+            return
+        self._vocab_generation += 1
+        generation = self._vocab_generation
+        vocab = self.vocab
+        words = list(self.transcript.words)
+
+        def worker():
+            try:
+                started_at = time.perf_counter()
+                annotations = vocab.annotate(words)
+                tiers = compute_tiers(words, annotations)
+                print(f"[DEBUG] Annotated {len(annotations)} distinct words "
+                      f"in {(time.perf_counter() - started_at) * 1000:.0f} ms")
+            except Exception as e:
+                print(f"Vocabulary annotation failed: {e}")
+                return
+            self.vocabularyAnnotated.emit(generation, (annotations, tiers))
+
+        Thread(target=worker, daemon=True).start()
+
+    def _on_vocabulary_annotated(self, generation, result):
+        if generation != self._vocab_generation:
+            return
+        self.transcript_vocabulary, self.word_tiers = result
+        self.difficulty_summary_label.setText(format_summary(self.word_tiers))
+        if self.difficulty_coloring:
+            self._render_transcript()
 
     def _run_transcription_in_worker(self, file_path):
+        started_at = time.perf_counter()
         try:
-            segments, info = self.transcriber.model.transcribe(file_path, beam_size=5, word_timestamps=True)
-            total_duration = getattr(info, 'duration', None)
+            # Only this action needs the model, so wait for it here rather than at startup
+            transcriber = self.resources.wait("transcriber")
+            if transcriber is None:
+                raise RuntimeError("Model failed to load successfully.")
+
+            # Long files go through the chunked process pool when it is enabled
+            parallel = self.parallel_transcriber
+            engine = parallel if parallel is not None and parallel.enabled else transcriber
+
+            # Reuse a previous transcript of identical audio decoded with identical settings;
+            # the engine's parameters include the chunking when the parallel engine runs
+            cache_key = None
+            try:
+                cache_key = self.transcript_cache.make_key(file_path, engine.cache_params())
+                cached_words = self.transcript_cache.get(cache_key)
+            except Exception as e:
+                print(f"[DEBUG] Transcript cache unavailable: {e}")
+                cached_words = None
+            if cached_words is not None:
+                print(f"[DEBUG] Transcript cache hit: {len(cached_words)} words")
+                self.signals.progress.emit(100)
+                self.signals.finished.emit(cached_words)
+                return
+
             all_words = []
             last_progress = -1
-
-            # Accumulate words and update progress based on processed duration
-            for segment in segments:
-                for word in segment.words:
-                    start_sec = getattr(word, 'start', None)
-                    if start_sec is None:
-                        start_sec = getattr(segment, 'start', 0.0)
-                    try:
-                        start_ms = int(max(0.0, float(start_sec)) * 1000)
-                    except Exception:
-                        start_ms = 0
-                    all_words.append({'word': word.word, 'start_ms': start_ms})
-
-                if total_duration and getattr(segment, 'end', None) is not None:
-                    ratio = min(max(segment.end / total_duration, 0.0), 0.999)
-                    pct = int(ratio * 100)
+            first_word_ms = None
+
+            # Deliver each segment's words as soon as it is decoded
+            for words, ratio in engine.iter_word_batches(file_path):
+                if words:
+                    if first_word_ms is None:
+                        first_word_ms = (time.perf_counter() - started_at) * 1000
+                        self.last_time_to_first_word_ms = first_word_ms
+                        print(f"[DEBUG] Time to first word: {first_word_ms:.0f} ms")
+                    all_words.extend(words)
+                    if self.stream_transcription:
+                        self.signals.words_batch.emit(words)
+
+                if ratio is not None:
+                    pct = int(min(ratio, 0.999) * 100)
                     if pct > last_progress:
                         last_progress = pct
                         self.signals.progress.emit(pct)
 
+            if cache_key is not None:
+                try:
+                    self.transcript_cache.put(cache_key, all_words)
+                except Exception as e:
+                    print(f"[DEBUG] Failed to write transcript cache: {e}")
+
             self.signals.progress.emit(100);
             self.signals.finished.emit(all_words)
         except Exception as e:
@@ -1163,35 +1688,87 @@ class MainWindow(QMainWindow):
                 ms = 0
             self._on_word_clicked(ms)
 
-    def _render_transcript(self):
-        # Check if transcription data exists, skip rendering if none
-        if not hasattr(self, 'words_data') or not self.words_data:
-            return
-        
+    # Paragraph sizing: short blocks keep per-word restyling and relayout cheap
+    PARAGRAPH_MIN_WORDS = 40
+    PARAGRAPH_MAX_WORDS = 120
+
+    def _layout_paragraphs(self, start_index):
+        """Split words from start_index on into paragraphs, recording their first word in _paragraph_starts.
+
+        A paragraph ends at a sentence boundary once PARAGRAPH_MIN_WORDS is
+        reached, or unconditionally at PARAGRAPH_MAX_WORDS.
+        """
+        starts = self._paragraph_starts
+        if start_index == 0:
+            del starts[:]
+        paragraph_start = starts[-1] if starts else None
+        words = self.transcript.words
+        prev_text = words[start_index - 1] if start_index > 0 else ''
+        for i in range(start_index, len(words)):
+            count = i - paragraph_start if paragraph_start is not None else 0
+            if (paragraph_start is None or count >= self.PARAGRAPH_MAX_WORDS
+                    or (count >= self.PARAGRAPH_MIN_WORDS and prev_text.rstrip().endswith(('.', '?', '!')))):
+                paragraph_start = i
+                starts.append(i)
+            prev_text = words[i]
+
+    def _words_html(self, start_index, end_index):
+        """Build the anchor markup for words [start_index, end_index), opening a <p> at each paragraph start."""
         def esc(t: str) -> str:
             return t.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
         def normalize_for_key(t: str) -> str:
             return t.strip().strip('.,!?;:，。！？；：').lower()
+        starts = self._paragraph_starts
+        pos = bisect_left(starts, start_index)
+        words = self.transcript.words
+        word_starts = self.transcript.starts
+        # 难度等级在批量注释时已算好，这里只按下标读取
+        tiers = self.word_tiers if self.difficulty_coloring else b''
         html_words = []
-        for i, w in enumerate(self.words_data):
-            word_text = esc(w['word'])
-            start_ms = int(max(0, w['start_ms']))
+        in_paragraph = False
+        for i in range(start_index, end_index):
+            if pos < len(starts) and starts[pos] == i:
+                if in_paragraph:
+                    html_words.append('</p>')
+                html_words.append('<p>')
+                in_paragraph = True
+                pos += 1
+            word = words[i]
+            word_text = esc(word)
+            start_ms = word_starts[i]
             
-            # 构建CSS类
+            # 构建CSS类（当前播放单词由 WordHighlighter 直接修改格式）
             classes = []
-            if normalize_for_key(w['word']) in self.favorites:
+            if normalize_for_key(word) in self.favorites:
                 classes.append('fav')
-            if i == self._current_highlight_index:
-                classes.append('current-word')
-            
+            if i < len(tiers) and tiers[i]:
+                classes.append(f'tier-{tiers[i]}')
             cls = f' class="{" ".join(classes)}"' if classes else ''
             
             # 添加id属性以支持scrollToAnchor功能
             html_words.append(f'<a href="word:{i}:{start_ms}" id="word{i}"{cls}>{word_text}</a>')
-            # 移除基于标点符号的强制换行，让文本自然换行
             html_words.append('&nbsp;')
-        styled_html = (
-            "<html><head><style>"
+        if in_paragraph:
+            html_words.append('</p>')
+        return ''.join(html_words)
+
+    def _paragraphs_html(self, first, last):
+        """Markup of paragraphs [first, last); used by the transcript view for its window."""
+        starts = self._paragraph_starts
+        end = starts[last] if last < len(starts) else len(self.transcript)
+        return self._words_html(starts[first], end)
+
+    def _paragraph_of(self, index):
+        """Paragraph containing word index."""
+        return max(0, bisect_right(self._paragraph_starts, index) - 1)
+
+    def _starts_paragraph(self, index):
+        starts = self._paragraph_starts
+        pos = bisect_left(starts, index)
+        return pos < len(starts) and starts[pos] == index
+
+    def _transcript_css(self):
+        return (
             f"body {{ background: transparent; color: #333333; font-size: {self.text_font_size_px}px; line-height: {self.text_line_height}; }}"
             "a { "
             "text-decoration: none; color: #333333; padding: 3px 6px; border-radius: 8px; background: transparent; "
@@ -1199,147 +1776,89 @@ class MainWindow(QMainWindow):
             "display: inline-block; "
             "}"
             "a.fav { background: rgba(255,193,7,0.35); border-radius: 8px; }"
-            "a.current-word { "
-            "background: rgba(34, 197, 94, 0.4) !important; "  # 绿色荧光笔效果
-            "border-radius: 8px; "
-            "color: #1f2937 !important; "
-            "font-weight: 600; "
-            "box-shadow: 0 0 8px rgba(34, 197, 94, 0.3); "  # 添加绿色光晕
-            "animation: pulse-green 2s infinite; "
-            "}"
-            "@keyframes pulse-green { "
-            "0% { box-shadow: 0 0 8px rgba(34, 197, 94, 0.3); } "
-            "50% { box-shadow: 0 0 12px rgba(34, 197, 94, 0.5); } "
-            "100% { box-shadow: 0 0 8px rgba(34, 197, 94, 0.3); } "
-            "}"
-            "a.current-word.fav { "  # 当前单词同时是收藏时的样式
-            "background: linear-gradient(45deg, rgba(34, 197, 94, 0.5), rgba(255,193,7,0.3)) !important; "
-            "}"
-            "</style></head><body>" + ''.join(html_words) + "</body></html>"
+            # 难度着色：基础词保持默认颜色
+            "a.tier-2 { color: #2563eb; }"
+            "a.tier-3 { color: #d97706; }"
+            "a.tier-4 { color: #dc2626; font-weight: 600; }"
+            "p { margin-top: 0px; margin-bottom: 8px; }"
         )
-        self.transcript_browser.setHtml(styled_html)
+
+    def _render_transcript(self):
+        # Check if transcription data exists, skip rendering if none
+        if not self.transcript:
+            return
+
+        browser = self.transcript_browser
+        # Default stylesheet applies to every window of paragraphs and to appended words
+        browser.document().setDefaultStyleSheet(self._transcript_css())
+        self._layout_paragraphs(0)
+        browser.setParagraphRenderer(self._paragraphs_html)
+        browser.setParagraphCount(len(self._paragraph_starts))
+        # Keep the paragraphs already on screen; a fresh view starts at the playing word
+        first, last = browser.windowRange()
+        if last <= first:
+            first = self._paragraph_of(max(0, self._current_word_index)) - browser.WINDOW_PARAGRAPHS // 2
+        browser.showParagraphs(first)
 
     @Slot(int)
     def _on_word_edit_requested(self, idx):
-        if not (0 <= idx < len(self.words_data)):
+        if not (0 <= idx < len(self.transcript)):
             return
-        current_text = self.words_data[idx].get('word', '')
+        current_text = self.transcript.word(idx)
         new_text, ok = QInputDialog.getText(self, "Edit Word", "Enter new text:", text=current_text)
-        if ok:
-            self.words_data[idx]['word'] = new_text
+        if ok and new_text != current_text:
+            self.transcript.set_word(idx, new_text)
+            if self.project is not None:
+                try:
+                    self.project.record_edit(idx, current_text, new_text)
+                except OSError as e:
+                    self.status_label.setText(f"Failed to save edit to project: {e}")
+                if self.project.needs_compaction:
+                    self._compact_project()
+            if idx < len(self.word_tiers) and self.vocab is not None:
+                self.word_tiers[idx] = tier_of(self.vocab.lookup(new_text))
             self._render_transcript()
-            self._refresh_favorites_page()
 
-    def _is_word_index_favorite(self, idx: int) -> bool:
-        if not (0 <= idx < len(self.words_data)):
-            return False
-        key = self.words_data[idx].get('word', '')
-        key = key.strip().strip('.,!?;:，。！？；：').lower()
-        return key in self.favorites
+    def _update_progress(self, position):
+        if not self.progress_slider.isSliderDown(): self.progress_slider.setValue(position)
+        self._update_time_label(position)
+        # 播放器的位置回调只用于校正（例如跳转后），单词切换由边界定时器精确触发
+        self._sync_current_word(position)
 
-    @Slot(int)
-    def _on_toggle_favorite_idx(self, idx: int):
-        if not (0 <= idx < len(self.words_data)):
+    def _sync_current_word(self, position):
+        """Update highlight and lyrics scrolling for a playback position, then schedule the next word change."""
+        if not self.transcript:
             return
-        raw = self.words_data[idx].get('word', '')
-        word = raw.strip().strip('.,!?;:，。！？；：').lower()
-        if not word:
-            return
-        if word in self.favorites:
-            self.favorites.remove(word)
-        else:
-            self.favorites.add(word)
-        self._render_transcript()
-        self._refresh_favorites_page()
-
-    # Compatible with old connection name
-    @Slot(int)
-    def _on_word_toggle_favorite_requested(self, idx: int):
-        self._on_toggle_favorite_idx(idx)
-
-    def _refresh_favorites_page(self):
-        self.favorites_list.clear()
-        for w in sorted(self.favorites):
-            brief = self._format_brief_for_word(w)
-            item = QListWidgetItem()
-            item.setSizeHint(QSize(0, 48))
-            item.setData(Qt.UserRole, w)
-            self.favorites_list.addItem(item)
-            widget = FavoriteItemWidget(w, brief)
-            self.favorites_list.setItemWidget(item, widget)
-
-    def _remove_selected_favorite(self):
-        items = self.favorites_list.selectedItems()
-        if not items:
+        current_word_index = self._find_current_word_index(position)
+        if current_word_index >= 0 and current_word_index != self._current_word_index:
+            self._current_word_index = current_word_index
+            
+            # 更新高亮显示
+            if current_word_index != self._current_highlight_index:
+                old_highlight = self._current_highlight_index
+                self._current_highlight_index = current_word_index
+                self._update_word_highlight(old_highlight, current_word_index)
+            
+            # 🎵 歌词式自动滚动 - 当前单词始终保持在屏幕中央
+            if self.auto_scroll_enabled:
+                self._center_current_word_lyrics_mode(current_word_index)
+                self._last_auto_scroll_time = time.time()
+        self._schedule_next_word_boundary(position, current_word_index)
+
+    def _schedule_next_word_boundary(self, position, word_index):
+        self._word_boundary_timer.stop()
+        if self.player.playbackState() != QMediaPlayer.PlayingState:
             return
-        for it in items:
-            text = it.data(Qt.UserRole)
-            if text and text in self.favorites:
-                self.favorites.remove(text)
-        self._refresh_favorites_page()
-        self._render_transcript()
-
-    def _format_brief_for_word(self, w: str) -> str:
-        entry = self.dictionary.lookup(w.strip().strip('.,!?;:，。！？；：'))
-        if not entry:
-            return ""
-        phon = entry.get('phonetic') or ""
-        pos = entry.get('pos') or ""
-        trans = entry.get('translation') or ""
-        if len(trans) > 80:
-            trans = trans[:80] + "…"
-        parts = []
-        if phon:
-            parts.append(f"/{phon}/")
-        if pos:
-            parts.append(pos)
-        if trans:
-            parts.append(trans)
-        return "  |  ".join(parts)
-
-
-
-
-
-    def _add_search_to_favorites(self):
-        q = self.search_input.text().strip().strip('.,!?;:，。！？；：').lower()
-        if not q:
+        next_ms = self.transcript.next_boundary_ms(word_index)
+        if next_ms is None:
             return
-        self.favorites.add(q)
-        self._refresh_favorites_page()
-        self._render_transcript()
+        rate = self.player.playbackRate() or 1.0
+        self._next_boundary_ms = next_ms
+        self._word_boundary_timer.start(max(0, int((next_ms - position) / rate)))
 
-    def _update_progress(self, position):
-        if not self.progress_slider.isSliderDown(): self.progress_slider.setValue(position)
-        self._update_time_label(position)
-        
-        # 自动滚动和高亮功能
-        if hasattr(self, 'words_data') and self.words_data:
-            current_word_index = self._find_current_word_index(position)
-            if current_word_index >= 0 and current_word_index != self._current_word_index:
-                print(f"[DEBUG] Position: {position}ms, Word index: {current_word_index}")
-                self._current_word_index = current_word_index
-                
-                # 更新高亮显示
-                if current_word_index != self._current_highlight_index:
-                    old_highlight = self._current_highlight_index
-                    self._current_highlight_index = current_word_index
-                    self._update_word_highlight(old_highlight, current_word_index)
-                
-                # 🎵 歌词式自动滚动 - 当前单词始终保持在屏幕中央
-                if self.auto_scroll_enabled:
-                    # 每次单词变化都立即居中显示（歌词模式）
-                    word_text = self.words_data[current_word_index].get('word', '')
-                    print(f"[DEBUG] 歌词模式: 正在居中显示单词 '{word_text}' (索引 {current_word_index})")
-                    
-                    # 立即将当前单词居中
-                    self._center_current_word_lyrics_mode(current_word_index)
-                    
-                    # 记录自动滚动时间
-                    import time
-                    self._last_auto_scroll_time = time.time()
-        elif self.auto_scroll_enabled:
-            print(f"[DEBUG] Auto-scroll enabled but no words_data available")
+    def _on_word_boundary_timer(self):
+        # The player may report a slightly stale position; the boundary has been reached by now
+        self._sync_current_word(max(self.player.position(), self._next_boundary_ms))
 
     def _set_progress_range(self, duration):
         self.progress_slider.setRange(0, duration);
@@ -1354,17 +1873,23 @@ class MainWindow(QMainWindow):
 
     def _set_volume(self, value):
         self.audio_output.setVolume(float(value) / 100.0)
+        self.settings.set("volume", value)
 
     def _update_play_pause_button_icon(self, state):
         icon = QStyle.SP_MediaPause if state == QMediaPlayer.PlayingState else QStyle.SP_MediaPlay
         self.play_pause_button.setIcon(self.style().standardIcon(icon))
         
+        if state == QMediaPlayer.PlayingState:
+            self._sync_current_word(self.player.position())
+        else:
+            self._word_boundary_timer.stop()
+        
         # 当播放停止时，清除高亮
         if state == QMediaPlayer.StoppedState:
             if self._current_highlight_index != -1:
                 old_highlight = self._current_highlight_index
                 self._current_highlight_index = -1
-                if hasattr(self, 'words_data') and self.words_data:
+                if self.transcript:
                     self._update_word_highlight(old_highlight, -1)
             # 🎵 歌词模式下播放停止不影响滚动锁定状态（界面依然不可滚动）
 
@@ -1386,29 +1911,10 @@ class MainWindow(QMainWindow):
         return f"{h:d}:{m:02d}:{s:02d}" if h > 0 else f"{m:02d}:{s:02d}"
     
     def _find_current_word_index(self, position_ms):
-        """根据当前播放位置找到对应的单词索引"""
-        if not hasattr(self, 'words_data') or not self.words_data:
+        """根据当前播放位置找到对应的单词索引（二分查找）"""
+        if not self.transcript:
             return -1
-        
-        # 找到当前时间点应该正在播放的单词
-        # 策略：找到开始时间小于等于当前时间的最后一个单词
-        best_index = -1
-        
-        for i, word_data in enumerate(self.words_data):
-            word_start_ms = word_data.get('start_ms', 0)
-            if word_start_ms <= position_ms:
-                best_index = i
-            else:
-                # 如果当前单词的开始时间大于播放位置，就停止搜索
-                break
-        
-        # 添加调试信息
-        if best_index >= 0:
-            word_text = self.words_data[best_index].get('word', '')
-            word_start = self.words_data[best_index].get('start_ms', 0)
-            print(f"[DEBUG] Found word '{word_text}' at index {best_index}, start: {word_start}ms, current: {position_ms}ms")
-        
-        return best_index
+        return self.transcript.index_at(position_ms)
     
     def _scroll_to_word(self, word_index):
         """🎵 歌词模式中直接调用居中方法"""
@@ -1419,20 +1925,57 @@ class MainWindow(QMainWindow):
             print(f"[DEBUG] 非歌词模式，跳过滚动: {word_index}")
     
     def _update_word_highlight(self, old_index, new_index):
-        """高效地更新单词高亮，不重新渲染整个HTML"""
+        """只修改新旧两个单词的字符格式，不重新渲染整个HTML"""
         try:
-            # 为了保持简单性和稳定性，我们还是使用重新渲染的方式
-            # 在未来可以考虑更复杂的DOM操作来提高性能
-            self._render_transcript()
-            print(f"[DEBUG] Updated highlight: {old_index} -> {new_index}")
-            
+            self.transcript_browser.setCurrentWord(new_index)
         except Exception as e:
             print(f"[DEBUG] Failed to update word highlight: {e}")
+        self._prefetch_tooltip_entries(new_index)
+
+    # Words resolved ahead of the playing or hovered word, and how close to the end
+    # of the prefetched range the next batch is fetched
+    TOOLTIP_PREFETCH_WORDS = 32
+    TOOLTIP_PREFETCH_MARGIN = 8
+
+    def _prefetch_tooltip_entries(self, index):
+        """Resolve the dictionary entries of words around index into the session vocabulary cache.
+
+        The lookups run on a background thread, so a cold dictionary page never delays
+        the highlight; a request made while one is running replaces any still waiting.
+        """
+        # Nothing to do once the whole transcript has been annotated
+        if self.vocab is None or index < 0 or self.transcript_vocabulary:
+            return
+        start, end = self._prefetched_range
+        if start <= index and index + self.TOOLTIP_PREFETCH_MARGIN <= end:
+            return
+        start = max(0, index - self.TOOLTIP_PREFETCH_MARGIN)
+        end = min(len(self.transcript), index + self.TOOLTIP_PREFETCH_WORDS)
+        self._prefetched_range = (start, end)
+        with self._prefetch_lock:
+            self._prefetch_words = self.transcript.words[start:end]
+            if self._prefetch_running:
+                return
+            self._prefetch_running = True
+        Thread(target=self._run_tooltip_prefetch, args=(self.vocab,), daemon=True).start()
+
+    def _run_tooltip_prefetch(self, vocab):
+        # annotate() may run on a worker thread; tooltips read its cache from the UI thread
+        while True:
+            with self._prefetch_lock:
+                words, self._prefetch_words = self._prefetch_words, None
+                if words is None:
+                    self._prefetch_running = False
+                    return
+            try:
+                vocab.annotate(words)
+            except Exception as e:
+                print(f"[DEBUG] Tooltip prefetch failed: {e}")
     
     def _center_current_word_lyrics_mode(self, word_index):
         """🎵 歌词模式：将当前单词精确居中到屏幕中央"""
         try:
-            if word_index < 0 or not hasattr(self, 'words_data') or word_index >= len(self.words_data):
+            if word_index < 0 or word_index >= len(self.transcript):
                 return
                 
             # 获取视口信息
@@ -1440,6 +1983,10 @@ class MainWindow(QMainWindow):
             viewport_height = self.transcript_browser.viewport().height()
             max_scroll = scrollbar.maximum()
             
+            # 单词所在段落可能不在已排版的窗口内
+            self.transcript_browser.ensureParagraphLoaded(self._paragraph_of(word_index))
+            max_scroll = scrollbar.maximum()
+
             # 首先尝试滚动到锚点
             anchor_id = f"word{word_index}"
             scroll_success = self.transcript_browser.scrollToAnchor(anchor_id)
@@ -1468,7 +2015,7 @@ class MainWindow(QMainWindow):
     def _center_word_proportional(self, word_index):
         """备用的比例居中方法"""
         try:
-            if not hasattr(self, 'words_data') or not self.words_data:
+            if not self.transcript:
                 return
                 
             # 基于单词在文档中的位置进行比例居中
@@ -1477,8 +2024,13 @@ class MainWindow(QMainWindow):
             total_content_height = self.transcript_browser.document().size().height()
             max_scroll = scrollbar.maximum()
             
-            # 计算单词的相对位置
-            word_progress = word_index / max(1, len(self.words_data) - 1)
+            # 计算单词在已排版窗口内的相对位置
+            first, last = self.transcript_browser.windowRange()
+            if last <= first:
+                return
+            first_word = self._paragraph_starts[first]
+            end_word = self._paragraph_starts[last] if last < len(self._paragraph_starts) else len(self.transcript)
+            word_progress = (word_index - first_word) / max(1, end_word - first_word - 1)
             
             # 估算单词位置并计算居中滚动位置
             estimated_word_pos = word_progress * total_content_height
@@ -1526,11 +2078,17 @@ class MainWindow(QMainWindow):
         if event.mimeData().hasUrls(): event.acceptProposedAction()
 
     def dropEvent(self, event):
+        # 转录进行中时忽略拖放（与禁用的导入按钮一致），否则会重置仍在接收单词的转录状态
+        if not self.load_button.isEnabled():
+            self.status_label.setText("Please wait for the current transcription to finish")
+            event.ignore()
+            return
         if event.mimeData().hasUrls(): self._process_file(event.mimeData().urls()[0].toLocalFile())
 
     def _handle_load_file_dialog(self):
         file_path, _ = QFileDialog.getOpenFileName(self, "Select Audio File", "",
-                                                   "Audio Files (*.mp3 *.wav *.ogg *.flac *.m4a)");
+                                                   "Audio Files (*.mp3 *.wav *.ogg *.flac *.m4a);;"
+                                                   f"EchoScribe Projects (*{ProjectFile.SUFFIX})");
         if file_path: self._process_file(file_path)
 
     def mousePressEvent(self, event):
@@ -1561,15 +2119,8 @@ class MainWindow(QMainWindow):
     def _reset_settings(self):
         print(f"[DEBUG] 🔄 正在重置所有设置到默认值...")
         
-        # Reset to default values
-        self.text_font_size_px = 18
-        self.text_line_height = 2.0
-        self.auto_play_after_transcription = True
-        self.auto_scroll_enabled = False
-        self.hover_delay_ms = 1000
-        self.tooltip_font_size = 14
-        self.speech_rate = 200
-        self.pause_on_tooltip = False
+        # Reset to default values; subscribers re-render the transcript once
+        self.settings.update({key: self.SETTING_ATTRIBUTES[key][1] for key in self.RESETTABLE_SETTINGS})
         
         # 🎵 重置歌词模式相关状态
         self._lyrics_mode_active = False
@@ -1584,24 +2135,64 @@ class MainWindow(QMainWindow):
         self.auto_play_checkbox.setChecked(True)
         self.auto_scroll_checkbox.setChecked(False)  # 这会触发_on_auto_scroll_changed
         self.pause_on_tooltip_checkbox.setChecked(False)
+        self.difficulty_checkbox.setChecked(False)
+        self.presynth_all_checkbox.setChecked(False)
         self.font_size_combo.setCurrentText("18 (default)")
         self.line_height_combo.setCurrentText("Standard (2.0) (default)")
         self.hover_delay_combo.setCurrentText("1s (default)")
         self.tooltip_font_combo.setCurrentText("14 (default)")
         self.speech_rate_combo.setCurrentText("Normal (200) (default)")
+        self.workers_combo.setCurrentText("Auto (default)")
         print(f"[DEBUG] 界面控件重置完成")
         
         # 🎵 确保歌词模式被正确禁用（恢复手动滚动）
         self._set_lyrics_mode(False)
         
-        # 立即保存并应用
-        self._save_settings()
-        self._render_transcript()
         self._set_volume(100)
         self.player.setPlaybackRate(1.0)
         
         print(f"[DEBUG] ✅ 设置重置完成，歌词模式已禁用，界面滚动已恢复")
 
+    def _create_parallel_transcriber(self):
+        self.parallel_transcriber = ParallelTranscriber(
+            self.transcriber,
+            workers=self.parallel_workers,
+            cpu_threads=self.parallel_cpu_threads,
+            min_duration_s=self.parallel_min_duration_s,
+        )
+        print(f"[DEBUG] Parallel transcription workers: {self.parallel_transcriber.workers}")
+
+    @Slot(str)
+    def _on_workers_changed(self, text):
+        workers_map = {"Off": 1, "Auto (default)": 0}
+        try:
+            workers = workers_map[text] if text in workers_map else int(text)
+        except ValueError:
+            workers = 0
+        self.settings.set("parallel_workers", workers)
+        if self.parallel_transcriber is not None:
+            self.parallel_transcriber.shutdown()
+        if self.transcriber is not None:
+            self._create_parallel_transcriber()
+
+    def closeEvent(self, event):
+        if self.parallel_transcriber is not None:
+            self.parallel_transcriber.shutdown()
+        self.tts_service.stop()
+        self.favorites.close()
+        self.settings.flush()
+        super().closeEvent(event)
+
+    def _clear_transcript_cache(self):
+        removed = self.transcript_cache.clear()
+        print(f"[DEBUG] Transcript cache cleared: {removed} entries removed")
+        self.status_label.setText(f"Transcript cache cleared ({removed} entries)")
+
+    def _clear_tts_cache(self):
+        removed = self.tts_service.clear()
+        print(f"[DEBUG] Pronunciation cache cleared: {removed} files removed")
+        self.status_label.setText(f"Pronunciation cache cleared ({removed} words)")
+
     @Slot(str)
     def _on_rate_changed(self, text):
         try:
@@ -1609,80 +2200,103 @@ class MainWindow(QMainWindow):
         except Exception:
             value = 1.0
         self.player.setPlaybackRate(value)
-        self._save_settings()
+        self.settings.set("playback_rate", text)
 
     @Slot(str)
     def _on_font_size_changed(self, text):
         try:
-            self.text_font_size_px = int(text)
+            font_size = int(text)
         except Exception:
-            self.text_font_size_px = 18
+            font_size = 18
+        self.settings.set("font_size_px", font_size)
         
         # 字体大小变化影响歌词居中效果
         if self.auto_scroll_enabled:
             print(f"[DEBUG] 字体大小已改为 {self.text_font_size_px}px (歌词模式生效)")
-            
-        self._render_transcript()
-        self._save_settings()
 
     @Slot(str)
     def _on_line_height_changed(self, text):
         if "1.6" in text:
-            self.text_line_height = 1.6
+            line_height = 1.6
         elif "2.4" in text:
-            self.text_line_height = 2.4
+            line_height = 2.4
         else:
-            self.text_line_height = 2.0
+            line_height = 2.0
+        self.settings.set("line_height", line_height)
             
         # 行间距变化影响歌词显示效果
         if self.auto_scroll_enabled:
             print(f"[DEBUG] 行间距已改为 {self.text_line_height} (歌词模式生效)")
-            
-        self._render_transcript()
-        self._save_settings()
 
     def _speak_word(self, word):
-        """使用TTS引擎播放单词发音"""
+        """使用常驻TTS服务播放单词发音（已合成的单词直接从磁盘缓存播放）"""
         if not word:
             return
-        
-        try:
-            # 在新线程中播放，避免阻塞UI
-            def speak_in_thread():
-                try:
-                    # 每次都重新初始化TTS引擎，避免状态冲突
-                    tts = pyttsx3.init()
-                    tts.setProperty('rate', self.speech_rate)
-                    
-                    # 设置为英语语音
-                    voices = tts.getProperty('voices')
-                    for voice in voices:
-                        if 'english' in voice.name.lower() or 'en' in voice.id.lower():
-                            tts.setProperty('voice', voice.id)
-                            break
-                    
-                    tts.say(word)
-                    tts.runAndWait()
-                    
-                    # 播放完成后停止引擎
-                    tts.stop()
-                    del tts
-                except Exception as e:
-                    print(f"TTS线程播放失败: {e}")
-            
-            thread = Thread(target=speak_in_thread, daemon=True)
-            thread.start()
-        except Exception as e:
-            print(f"语音播放失败: {e}")
+        self.tts_service.speak(word)
+
+    def _start_pronunciation_presynthesis(self):
+        """Pre-render pronunciations of favorites, the words on screen and the transcript's most frequent words.
+
+        Every distinct transcript word is queued only with the presynthesize_all_words setting.
+        """
+        def clean(t: str) -> str:
+            return t.strip().strip('.,!?;:，。！？；：').lower()
+        words = sorted(self.favorites)
+        transcript_words = self.transcript.words
+        first, last = self.transcript_browser.windowRange()
+        starts = self._paragraph_starts
+        if first < last <= len(starts):
+            end = starts[last] if last < len(starts) else len(transcript_words)
+            words.extend(clean(w) for w in dict.fromkeys(transcript_words[starts[first]:end]))
+        if self.presynthesize_all_words:
+            # 转录文本中的单词按首次出现顺序排列（interned 字符串去重后再清洗）
+            words.extend(clean(w) for w in dict.fromkeys(transcript_words))
+        else:
+            frequency = Counter()
+            for w, n in Counter(transcript_words).items():
+                frequency[clean(w)] += n
+            words.extend(w for w, _ in frequency.most_common(self.PRESYNTH_FREQUENT_WORDS))
+        self.tts_service.presynthesize(words)
+        self._update_pronunciation_status()
+
+    @Slot(int, int, int)
+    def _update_pronunciation_status(self, *_):
+        stats = self.tts_service.stats()
+        parts = []
+        if stats["presynth_total"]:
+            parts.append(f"Prepared {stats['presynth_done']}/{stats['presynth_total']} words "
+                         f"({stats['presynth_cached']} already cached)"
+                         + ("" if stats["presynth_running"] else ", idle"))
+        if stats["requests"]:
+            parts.append(f"cache hit rate {stats['hit_rate'] * 100:.0f}% "
+                         f"of {stats['requests']} pronunciations")
+        self.pronunciation_status_label.setText("; ".join(parts) or "No pronunciations prepared yet")
+
+    @Slot(str, str)
+    def _on_pronunciation_ready(self, word, path):
+        self._update_pronunciation_status()
+        if not path:
+            return
+        self.pronunciation_player.stop()
+        self.pronunciation_player.setSource(QUrl.fromLocalFile(path))
+        self.pronunciation_player.play()
+
+    @Slot(int)
+    def _on_difficulty_coloring_changed(self, state):
+        self.settings.set("difficulty_coloring", state == 2)  # Qt.Checked
+
+    @Slot(int)
+    def _on_presynthesize_all_changed(self, state):
+        if self.settings.set("presynthesize_all_words", state == 2) and len(self.transcript):  # Qt.Checked
+            self._start_pronunciation_presynthesis()
 
     @Slot(int)
     def _on_auto_play_changed(self, state):
-        self.auto_play_after_transcription = state == 2  # Qt.Checked
-        self._save_settings()
+        self.settings.set("auto_play_after_transcription", state == 2)  # Qt.Checked
 
     @Slot(int)
     def _on_auto_scroll_changed(self, state):
-        self.auto_scroll_enabled = state == 2  # Qt.Checked
+        self.settings.set("auto_scroll_enabled", state == 2)  # Qt.Checked
         print(f"[DEBUG] Auto-scroll setting changed to: {self.auto_scroll_enabled}")
         
         if self.auto_scroll_enabled:
@@ -1693,59 +2307,54 @@ class MainWindow(QMainWindow):
             # 禁用歌词模式：恢复手动滚动
             print(f"[DEBUG] 🎵 歌词模式已禁用: 恢复手动滚动")
             self._set_lyrics_mode(False)
-            
-        self._save_settings()
 
     @Slot(int)
     def _on_pause_on_tooltip_changed(self, state):
-        self.pause_on_tooltip = state == 2  # Qt.Checked
-        self._save_settings()
+        self.settings.set("pause_on_tooltip", state == 2)  # Qt.Checked
 
     @Slot(str)
     def _on_hover_delay_changed(self, text):
         delay_map = {"Off": -1, "0s": 0, "0.5s": 500, "1s (default)": 1000, "2s": 2000, "3s": 3000}
-        self.hover_delay_ms = delay_map.get(text, 1000)
-        self._save_settings()
+        self.settings.set("hover_delay_ms", delay_map.get(text, 1000))
 
     @Slot(str)
     def _on_tooltip_font_changed(self, text):
         try:
             # 提取数字部分
             font_size = int(text.split()[0])
-            self.tooltip_font_size = font_size
         except Exception:
-            self.tooltip_font_size = 14
-        self._save_settings()
+            font_size = 14
+        # 悬浮提示在下次显示时读取新字号
+        self.settings.set("tooltip_font_size", font_size)
 
     @Slot(str)
     def _on_speech_rate_changed(self, text):
-        rate_map = {"慢速 (150)": 150, "标准 (200) (默认)": 200, "快速 (250)": 250, "极快 (300)": 300}
-        self.speech_rate = rate_map.get(text, 200)
-        # 语速设置会在下次播放时生效
-        self._save_settings()
+        rate_map = {"Slow (150)": 150, "Normal (200) (default)": 200, "Fast (250)": 250, "Very Fast (300)": 300}
+        # 语速设置会在下次播放时生效（订阅者更新 TTS 服务）
+        self.settings.set("speech_rate", rate_map.get(text, 200))
 
     def _is_word_index_favorite(self, idx: int) -> bool:
-        if not hasattr(self, 'words_data') or not (0 <= idx < len(self.words_data)):
+        if not (0 <= idx < len(self.transcript)):
             return False
-        key = self.words_data[idx].get('word', '')
+        key = self.transcript.word(idx)
         key = key.strip().strip('.,!?;:，。！？；：').lower()
         return key in self.favorites
 
     @Slot(int)
     def _on_toggle_favorite_idx(self, idx: int):
-        if not hasattr(self, 'words_data') or not (0 <= idx < len(self.words_data)):
+        if not (0 <= idx < len(self.transcript)):
             return
-        raw = self.words_data[idx].get('word', '')
+        raw = self.transcript.word(idx)
         word = raw.strip().strip('.,!?;:，。！？；：').lower()
         if not word:
             return
         if word in self.favorites:
             self.favorites.remove(word)
+            self._on_favorite_removed(word)
         else:
-            self.favorites.add(word)
+            self.favorites.add(word, source_file=self.audio_path, position_ms=self.transcript.start_ms(idx))
+            self._on_favorite_added(word)
         self._render_transcript()
-        self._refresh_favorites_page()
-        self._save_favorites()
 
     # Compatible with old connection name
     @Slot(int)
@@ -1753,54 +2362,45 @@ class MainWindow(QMainWindow):
         self._on_toggle_favorite_idx(idx)
 
     def _refresh_favorites_page(self):
-        if not hasattr(self, 'favorites_list'):
+        if not hasattr(self, 'favorites_model'):
             return
-        self.favorites_list.clear()
-        for w in sorted(self.favorites):
-            brief = self._format_brief_for_word(w)
-            item = QListWidgetItem()
-            item.setSizeHint(QSize(0, 48))
-            item.setData(Qt.UserRole, w)
-            self.favorites_list.addItem(item)
-            widget = FavoriteItemWidget(w, brief)
-            self.favorites_list.setItemWidget(item, widget)
+        self.favorites_model.set_words(self.favorites.words())
+
+    def _on_favorite_added(self, w):
+        """Insert one row into the favorites page instead of rebuilding it."""
+        if hasattr(self, 'favorites_model'):
+            self.favorites_model.add_word(w)
+
+    def _on_favorite_removed(self, w):
+        if hasattr(self, 'favorites_model'):
+            self.favorites_model.remove_word(w)
 
     def _remove_selected_favorite(self):
         if not hasattr(self, 'favorites_list'):
             return
-        items = self.favorites_list.selectedItems()
-        if not items:
+        rows = self.favorites_list.selectionModel().selectedRows()
+        words = [index.data(FavoritesModel.WordRole) for index in rows]
+        if not words:
             return
-        for it in items:
-            text = it.data(Qt.UserRole)
-            if text and text in self.favorites:
-                self.favorites.remove(text)
-        self._refresh_favorites_page()
+        for text in words:
+            if text and self.favorites.remove(text):
+                self._on_favorite_removed(text)
         self._render_transcript()
-        self._save_favorites()
 
     def _format_brief_for_word(self, w: str) -> str:
-        entry = self.dictionary.lookup(w.strip().strip('.,!?;:，。！？；：'))
-        if not entry:
+        if self.vocab is None:
             return ""
-        phon = entry.get('phonetic') or ""
-        pos = entry.get('pos') or ""
-        trans = entry.get('translation') or ""
-        if len(trans) > 80:
-            trans = trans[:80] + "…"
-        parts = []
-        if phon:
-            parts.append(f"/{phon}/")
-        if pos:
-            parts.append(pos)
-        if trans:
-            parts.append(trans)
-        return "  |  ".join(parts)
-
-    def _open_favorite_detail(self, item):
-        word = item.data(Qt.UserRole) if item else None
+        annotation = self.vocab.lookup(w)
+        return annotation.brief if annotation else ""
+
+    def _open_favorite_detail(self, index):
+        word = index.data(FavoritesModel.WordRole) if index.isValid() else None
         if not word:
             return
+        self.favorites.record_review(word)
+        if self.dictionary is None:
+            self.status_label.setText("Dictionary is still loading...")
+            return
         entry = self.dictionary.lookup(word)
         if not entry:
             detail_html = f"<b>{word}</b><br/><span style='color:#999'>无词典记录</span>"
@@ -1858,16 +2458,30 @@ class MainWindow(QMainWindow):
         if not q:
             print("[DEBUG] 搜索框为空，保持当前内容不变")
             return
+        if self.fulltext_checkbox.isChecked():
+            self._search_timer.stop()
+            self._start_live_search()
+            return
             
         # 只有当用户输入新内容并回车时，才进行搜索和更新页面
         print(f"[DEBUG] 开始搜索新内容: '{q}'")
         # 清除详情显示模式，进入正常搜索模式
         self._showing_detail = False
+        # 回车搜索优先，丢弃尚未返回的实时搜索结果
+        self._search_timer.stop()
+        self._search_generation += 1
+
+        if self.dictionary is None:
+            self._show_dictionary_unavailable()
+            return
             
         entry = self.dictionary.lookup(q.strip().strip('.,!?;:，。！？；：'))
         if not entry:
             self.search_result.setHtml(f"<b>{q}</b><br/><span style='color:#999'>无词典记录</span>")
             return
+        self.search_result.setHtml(self._search_entry_html(entry))
+
+    def _search_entry_html(self, entry):
         def esc(t: str) -> str:
             return t.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
         
@@ -1902,12 +2516,138 @@ class MainWindow(QMainWindow):
             </div>
             """
         
+        return html_content
+
+    def _start_live_search(self):
+        """Look up the typed text on a worker thread; only the newest query's results are shown."""
+        q = self.search_input.text().strip().strip('.,!?;:，。！？；：')
+        self._search_generation += 1
+        generation = self._search_generation
+        if not q:
+            return
+        dictionary = self.dictionary
+        if dictionary is None:
+            self._show_dictionary_unavailable()
+            return
+        if self.fulltext_checkbox.isChecked():
+            self._start_fulltext_search(dictionary, q, generation)
+            return
+
+        def search_in_thread():
+            try:
+                results = (q, dictionary.lookup(q), dictionary.complete(q, 12), dictionary.suggest(q, 8))
+            except Exception as e:
+                print(f"[DEBUG] Live search failed: {e}")
+                return
+            self.searchResultsReady.emit(generation, results)
+
+        Thread(target=search_in_thread, daemon=True).start()
+
+    def _start_fulltext_search(self, dictionary, q, generation):
+        if self.resources.get("fulltext") is None:
+            # Re-run by _on_fulltext_ready once the index is open
+            self.search_result.setHtml("<span style='color:#999'>Building full-text index (first use only)...</span>")
+            return
+
+        def search_in_thread():
+            try:
+                hits = dictionary.search_text(q, 30)
+            except Exception as e:
+                print(f"[DEBUG] Full-text search failed: {e}")
+                return
+            self.fullTextResultsReady.emit(generation, (q, hits))
+
+        Thread(target=search_in_thread, daemon=True).start()
+
+    @Slot(bool)
+    def _on_fulltext_toggled(self, checked):
+        if checked and not getattr(self, '_fulltext_requested', False):
+            self._fulltext_requested = True
+            self.resources.when_ready("dictionary", self._start_fulltext_loading)
+        self._search_timer.start()
+
+    def _start_fulltext_loading(self, dictionary):
+        if dictionary is None:
+            return
+        index_path = self._get_user_data_path() / "dict" / "ecdict.fts"
+        self.resources.start("fulltext", lambda: dictionary.open_fulltext(index_path))
+        self.resources.when_ready("fulltext", self._on_fulltext_ready)
+
+    def _on_fulltext_ready(self, fulltext):
+        # A failure is reported by _on_resource_failed
+        if fulltext is not None and self.fulltext_checkbox.isChecked():
+            self._start_live_search()
+
+    @Slot(str, str)
+    def _on_resource_failed(self, name, message):
+        if name == "fulltext":
+            self._fulltext_requested = False
+            self.fulltext_checkbox.setChecked(False)
+            self.search_result.setHtml(f"<span style='color:#999'>Full-text search unavailable: {message}</span>")
+
+    @Slot(int, object)
+    def _on_fulltext_results(self, generation, results):
+        if generation != self._search_generation:
+            return
+        def esc(t: str) -> str:
+            return t.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+        q, hits = results
+        self._showing_detail = False
+        if not hits:
+            self.search_result.setHtml(f"<b>{esc(q)}</b><br/><span style='color:#999'>No matching meanings</span>")
+            return
+        html_content = f"<div style='color:#6b7280; font-size:13px; margin-bottom:8px;'>Words whose meaning matches <b>{esc(q)}</b>:</div>"
+        for entry, _ in hits:
+            word = entry.get('word', '')
+            brief = (entry.get('translation', '') or entry.get('definition', '')).replace('\\n', ' ')
+            if len(brief) > 80:
+                brief = brief[:80] + "..."
+            html_content += (f"<div style='margin:6px 0;'>"
+                             f"<a href='search:{esc(word)}' style='color:#2563eb; text-decoration:none; font-weight:600;'>{esc(word)}</a>"
+                             f" <span style='color:#374151;'>{esc(brief)}</span></div>")
+        self.search_result.setHtml(html_content)
+
+    @Slot(int, object)
+    def _on_live_search_results(self, generation, results):
+        if generation != self._search_generation:
+            return
+        def esc(t: str) -> str:
+            return t.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+        q, entry, completions, suggestions = results
+        self._showing_detail = False
+        if entry:
+            html_content = self._search_entry_html(entry)
+        else:
+            html_content = f"<b>{esc(q)}</b><br/><span style='color:#999'>无词典记录</span>"
+
+        def word_links(title, words):
+            links = " · ".join(
+                f"<a href='search:{esc(w)}' style='color:#2563eb; text-decoration:none;'>{esc(w)}</a>"
+                for w in words)
+            return (f"<div style='margin:10px 0; font-size:14px;'>"
+                    f"<span style='color:#6b7280;'>{title}</span> {links}</div>")
+
+        completions = [w for w in completions if w != q.lower()]
+        if suggestions and not entry:
+            html_content += word_links("Did you mean:", suggestions)
+        if completions:
+            html_content += word_links("Words starting with this:", completions)
         self.search_result.setHtml(html_content)
 
     def _on_search_anchor_clicked(self, url):
         """处理搜索页面的链接点击事件"""
         print(f"[DEBUG] 点击链接: {url.toString()}")
         url_str = url.toString()
+        if url.scheme() == "search":
+            # 直接显示词条，不受反查模式影响
+            word = url.path()
+            self.search_input.setText(word)
+            self._search_generation += 1
+            entry = self.dictionary.lookup(word) if self.dictionary is not None else None
+            if entry:
+                self._showing_detail = False
+                self.search_result.setHtml(self._search_entry_html(entry))
+            return
         if url_str == "speak_word" or url_str == "#speak_word":
             # 获取当前搜索的单词并播放
             word = self.search_input.text().strip()
@@ -1924,7 +2664,6 @@ class MainWindow(QMainWindow):
         q = self.search_input.text().strip().strip('.,!?;:，。！？；：').lower()
         if not q:
             return
-        self.favorites.add(q)
-        self._refresh_favorites_page()
-        self._render_transcript()
-        self._save_favorites()
\ No newline at end of file
+        if self.favorites.add(q):
+            self._on_favorite_added(q)
+            self._render_transcript()
\ No newline at end of file
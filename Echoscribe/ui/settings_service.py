@@ -0,0 +1,111 @@
+"""
+EchoScribe Settings Service
+
+Keeps the user settings in memory and persists them off the hot path: changes
+are coalesced by a single-shot timer into one atomic rewrite of settings.json,
+and each subscriber is notified only about the keys it registered for.
+"""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from PySide6.QtCore import QObject, QTimer
+
+_MISSING = object()
+
+
+class SettingsService(QObject):
+    # Quiet period after the last change before the file is written
+    SAVE_DELAY_MS = 500
+
+    def __init__(self, path: Path, default_path: Optional[Path] = None, parent=None):
+        """Load settings from path, or on first run from the bundled defaults at default_path."""
+        super().__init__(parent)
+        self.path = Path(path)
+        self._values: Dict[str, Any] = {}
+        self._subscribers: List[Tuple[frozenset, Callable[[Dict[str, Any]], None]]] = []
+        self._dirty = False
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(self.SAVE_DELAY_MS)
+        self._save_timer.timeout.connect(self.flush)
+        self._load(default_path)
+
+    def _load(self, default_path: Optional[Path]):
+        for candidate in (self.path, default_path):
+            if candidate is None or not Path(candidate).exists():
+                continue
+            try:
+                with Path(candidate).open("r", encoding="utf-8") as f:
+                    data = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"[DEBUG] Failed to load settings from {candidate}: {e}")
+                continue
+            if isinstance(data, dict):
+                self._values = data
+            print(f"[DEBUG] 设置已加载: {candidate}")
+            if candidate != self.path:
+                # 首次运行：把默认设置复制到用户目录
+                self._schedule_save()
+            return
+        print("[DEBUG] 使用程序默认设置")
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._values.get(key, default)
+
+    def set(self, key: str, value: Any) -> bool:
+        """Change one setting; returns False if it already had this value."""
+        return bool(self.update({key: value}))
+
+    def update(self, values: Dict[str, Any]) -> Dict[str, Any]:
+        """Change several settings at once; subscribers get one notification with all changed keys.
+
+        Returns:
+            The settings that actually changed
+        """
+        changed = {key: value for key, value in values.items() if self._values.get(key, _MISSING) != value}
+        if not changed:
+            return changed
+        self._values.update(changed)
+        self._schedule_save()
+        for keys, callback in self._subscribers:
+            relevant = {key: value for key, value in changed.items() if key in keys}
+            if relevant:
+                callback(relevant)
+        return changed
+
+    def subscribe(self, keys: Iterable[str], callback: Callable[[Dict[str, Any]], None]):
+        """Call callback({key: new value}) whenever any of keys changes, in subscription order."""
+        self._subscribers.append((frozenset(keys), callback))
+
+    def _schedule_save(self):
+        self._dirty = True
+        # Restarting the timer coalesces a burst of changes into one write
+        self._save_timer.start()
+
+    def flush(self):
+        """Write pending changes now, e.g. on exit; replaces the file atomically."""
+        self._save_timer.stop()
+        if not self._dirty:
+            return
+        self._dirty = False
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=str(self.path.parent), suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(self._values, f, indent=2, ensure_ascii=False)
+                os.replace(tmp_name, self.path)
+            except Exception:
+                try:
+                    os.remove(tmp_name)
+                except OSError:
+                    pass
+                raise
+            print(f"[DEBUG] Settings saved to: {self.path}")
+        except Exception as e:
+            print(f"[DEBUG] Failed to save settings: {e}")
+
@@ -0,0 +1,181 @@
+"""
+EchoScribe Transcript Highlighting
+
+Restyles individual words of an already rendered transcript document through
+character formats, so highlight changes never rebuild or re-parse the HTML.
+"""
+
+from array import array
+
+from PySide6.QtGui import QColor, QFont, QTextCharFormat, QTextCursor
+
+
+def _make_format(background, foreground="#1f2937", weight=None):
+    fmt = QTextCharFormat()
+    fmt.setBackground(background)
+    fmt.setForeground(QColor(foreground))
+    if weight is not None:
+        fmt.setFontWeight(weight)
+    return fmt
+
+
+# 绿色荧光笔效果（当前播放单词）
+CURRENT_FORMAT = _make_format(QColor(34, 197, 94, 102), weight=QFont.DemiBold)
+# 当前单词同时是收藏时的样式
+CURRENT_FAVORITE_FORMAT = _make_format(QColor(145, 196, 52, 140), weight=QFont.DemiBold)
+# 鼠标悬停
+HOVER_FORMAT = _make_format(QColor("#87ceeb"))
+
+
+class WordHighlighter:
+    """
+    Applies layered styles (current playing word, hover) to single words of a
+    transcript document. Word character ranges are indexed from the 'word:<i>:<ms>'
+    anchors once per render; the original formats of a styled word are captured
+    on first use and restored when its last layer is removed.
+    """
+
+    def __init__(self, document, favorite_resolver=None):
+        self._doc = document
+        self._starts = array('l')
+        self._ends = array('l')
+        self._base_formats = {}
+        self._layers = {}
+        self.favorite_resolver = favorite_resolver
+        self.current_index = -1
+
+    def reset(self):
+        """Forget all word ranges, e.g. after the document was replaced."""
+        self._starts = array('l')
+        self._ends = array('l')
+        self._base_formats.clear()
+
+    def clear(self):
+        """Forget word ranges and all style layers, e.g. when a new file is loaded."""
+        self.reset()
+        self._layers.clear()
+        self.current_index = -1
+
+    def index_from(self, position=0):
+        """Record word ranges of every block from the one containing position to the end."""
+        block = self._doc.findBlock(position)
+        while block.isValid():
+            it = block.begin()
+            while not it.atEnd():
+                fragment = it.fragment()
+                if fragment.isValid():
+                    fmt = fragment.charFormat()
+                    if fmt.isAnchor():
+                        href = fmt.anchorHref()
+                        if href.startswith('word:'):
+                            try:
+                                idx = int(href.split(':', 2)[1])
+                            except ValueError:
+                                idx = -1
+                            if idx >= 0:
+                                self._add_range(idx, fragment.position(),
+                                                fragment.position() + fragment.length())
+                it += 1
+            block = block.next()
+
+    def _add_range(self, idx, start, end):
+        missing = idx + 1 - len(self._starts)
+        if missing > 0:
+            self._starts.extend([-1] * missing)
+            self._ends.extend([-1] * missing)
+        if self._starts[idx] < 0 or start < self._starts[idx]:
+            self._starts[idx] = start
+        if end > self._ends[idx]:
+            self._ends[idx] = end
+
+    def range_of(self, idx):
+        """Character range (start, end) of a word, or None if it is not in the document."""
+        if 0 <= idx < len(self._starts) and self._starts[idx] >= 0:
+            return self._starts[idx], self._ends[idx]
+        return None
+
+    def set_current(self, index):
+        """Move the current-word style from the previous word to index (-1 clears it)."""
+        old = self.current_index
+        self.current_index = index
+        if old != index:
+            self.set_layer(old, 'current', False)
+        self.set_layer(index, 'current', index >= 0)
+
+    def set_layer(self, idx, layer, enabled):
+        """Add or remove a named style layer on one word and restyle it."""
+        if idx < 0:
+            return
+        layers = self._layers.get(idx)
+        if enabled:
+            if layers is None:
+                layers = self._layers[idx] = set()
+            if layer in layers:
+                return
+            layers.add(layer)
+        else:
+            if not layers or layer not in layers:
+                return
+            layers.discard(layer)
+            if not layers:
+                del self._layers[idx]
+        self._restyle(idx)
+
+    def reapply(self):
+        """Re-apply all active layers after the document was re-rendered and re-indexed."""
+        self._base_formats.clear()
+        for idx in list(self._layers):
+            self._restyle(idx)
+
+    def _layer_formats(self, idx, layers):
+        formats = []
+        if 'current' in layers:
+            is_fav = False
+            if callable(self.favorite_resolver):
+                try:
+                    is_fav = bool(self.favorite_resolver(idx))
+                except Exception:
+                    is_fav = False
+            formats.append(CURRENT_FAVORITE_FORMAT if is_fav else CURRENT_FORMAT)
+        if 'hover' in layers:
+            # Merged last so the hover background wins over the current-word highlight
+            formats.append(HOVER_FORMAT)
+        return formats
+
+    def _capture(self, idx, start, end):
+        """Remember the original character formats of a word as (position, length, format) runs."""
+        cursor = QTextCursor(self._doc)
+        runs = []
+        for pos in range(start, end):
+            # charFormat() reports the format of the character before the cursor
+            cursor.setPosition(pos + 1)
+            fmt = cursor.charFormat()
+            if runs and runs[-1][2] == fmt:
+                runs[-1][1] += 1
+            else:
+                runs.append([pos, 1, fmt])
+        self._base_formats[idx] = runs
+
+    def _restyle(self, idx):
+        word_range = self.range_of(idx)
+        if word_range is None:
+            return
+        start, end = word_range
+        layers = self._layers.get(idx)
+        if layers and idx not in self._base_formats:
+            self._capture(idx, start, end)
+
+        cursor = QTextCursor(self._doc)
+        cursor.beginEditBlock()
+        for pos, length, fmt in self._base_formats.get(idx, ()):
+            cursor.setPosition(pos)
+            cursor.setPosition(pos + length, QTextCursor.KeepAnchor)
+            cursor.setCharFormat(fmt)
+        if layers:
+            cursor.setPosition(start)
+            cursor.setPosition(end, QTextCursor.KeepAnchor)
+            for fmt in self._layer_formats(idx, layers):
+                cursor.mergeCharFormat(fmt)
+        else:
+            self._base_formats.pop(idx, None)
+        cursor.endEditBlock()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Load time and memory of the in-memory dictionary (no compiled index).
+
+Compares one dict per entry, as the loader used to build, with the compact
+DictEntry rows. Each variant is loaded in a fresh interpreter so the resident
+set sizes do not mix.
+
+    python benchmarks/dict_memory.py [path/to/ecdict.csv]
+"""
+
+import csv
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+
+def rss_kb() -> int:
+    """Current resident set size in KiB (Linux), or peak RSS where /proc is unavailable."""
+    try:
+        with open("/proc/self/status", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Reported in bytes on macOS, KiB elsewhere
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def load_dicts(path: Path) -> dict:
+    """The previous loader: a fresh 13-key dict per CSV row."""
+    from Echoscribe.Core.dict_index import FIELDS, LemmaMap
+    entries = {}
+    lemma_map = LemmaMap()
+    with path.open("r", encoding="utf-8-sig") as f:
+        for row in csv.DictReader(f):
+            word = (row.get("word") or "").strip()
+            if not word:
+                continue
+            entry = {name: (row.get(name) or "").strip() for name in FIELDS}
+            entry["word"] = word
+            entries[word.lower()] = entry
+            lemma_map.add(word, entry["exchange"], entry["frq"])
+    lemma_map.resolve(entries)
+    return entries
+
+
+def load_compact(path: Path) -> dict:
+    from Echoscribe.Core.dictionary import Dictionary
+    return Dictionary(csv_path=path, use_index=False)._entries
+
+
+def run_variant(variant: str, path: Path):
+    # Import before measuring so module code is not counted
+    import Echoscribe.Core.dictionary  # noqa: F401
+    before = rss_kb()
+    started = time.perf_counter()
+    entries = (load_dicts if variant == "dict" else load_compact)(path)
+    elapsed = time.perf_counter() - started
+    after = rss_kb()
+    print(json.dumps({"entries": len(entries), "seconds": elapsed, "rss_kb": after - before}))
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) >= 2 and argv[0] == "--variant":
+        run_variant(argv[1], Path(argv[2]))
+        return 0
+    path = Path(argv[0]) if argv else ROOT / "Assets" / "dict" / "ecdict.csv"
+    if not path.exists():
+        print(f"Dictionary file not found - {path}")
+        return 2
+
+    results = {}
+    for variant in ("dict", "compact"):
+        out = subprocess.run([sys.executable, __file__, "--variant", variant, str(path)],
+                             check=True, capture_output=True, text=True).stdout
+        results[variant] = json.loads(out.strip().splitlines()[-1])
+
+    print(f"{'entries':<10}{results['dict']['entries']}")
+    print(f"{'variant':<10}{'load (s)':>10}{'RSS (MiB)':>12}")
+    for variant, r in results.items():
+        print(f"{variant:<10}{r['seconds']:>10.2f}{r['rss_kb'] / 1024:>12.1f}")
+    old, new = results["dict"], results["compact"]
+    print(f"compact entries: {1 - new['rss_kb'] / old['rss_kb']:.0%} less memory, "
+          f"{1 - new['seconds'] / old['seconds']:.0%} faster load")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Throughput of the transcript exporters on a synthetic transcript.
+
+Streams every format from TranscriptStore.iter_dicts into a file, and once
+more under tracemalloc to show that peak memory does not grow with the
+document size.
+
+    python benchmarks/export_throughput.py [word count]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from Echoscribe.Core.exporters import FORMATS, export_file, write_export  # noqa: E402
+from Echoscribe.Core.transcript_store import TranscriptStore  # noqa: E402
+
+VOCABULARY = ("the", "of", "and", "lecture", "transcript", "subtitle", "pronunciation", "vocabulary",
+              "whisper", "segment", "throughput", "generator", "streaming", "a", "is", "to")
+
+
+def synthetic_transcript(count: int, seed: int = 1) -> TranscriptStore:
+    """Words of 150-450 ms with short gaps, about 20 words per segment."""
+    rng = random.Random(seed)
+    store = TranscriptStore()
+    position = 0
+    segment = 0
+    for i in range(count):
+        if i and rng.random() < 0.05:
+            segment += 1
+            position += rng.randint(200, 800)
+        duration = rng.randint(150, 450)
+        store.append(" " + rng.choice(VOCABULARY), position, position + duration, rng.random(), segment)
+        position += duration + rng.randint(0, 60)
+    return store
+
+
+def peak_memory_kb(store: TranscriptStore, fmt: str) -> float:
+    tracemalloc.start()
+    with open(os.devnull, "w", encoding="utf-8") as out:
+        write_export(store.iter_dicts(), out, fmt)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1024
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    count = int(argv[0]) if argv else 100_000
+    store = synthetic_transcript(count)
+    print(f"{count} words in {store.segment_count} segments")
+    print(f"{'format':<8}{'seconds':>10}{'words/s':>12}{'MiB':>8}{'MiB/s':>8}{'peak KiB':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for fmt, (_, suffix, _) in FORMATS.items():
+            path = Path(tmp) / f"export{suffix}"
+            started = time.perf_counter()
+            export_file(store.iter_dicts(), path, fmt)
+            elapsed = time.perf_counter() - started
+            size_mb = path.stat().st_size / (1024 * 1024)
+            print(f"{fmt:<8}{elapsed:>10.3f}{count / elapsed:>12,.0f}{size_mb:>8.1f}{size_mb / elapsed:>8.1f}"
+                  f"{peak_memory_kb(store, fmt):>10.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -51,6 +51,7 @@ setup(
     entry_points={
         "console_scripts": [
             "echoscribe=Echoscribe.main:main",
+            "echoscribe-batch=Echoscribe.cli:main",
         ],
     },
     include_package_data=True,
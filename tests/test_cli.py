@@ -0,0 +1,75 @@
+from pathlib import Path
+
+from Echoscribe.cli import BatchState, iter_audio_files, run_batch
+
+WORDS = [{"word": " Hi", "start_ms": 0, "end_ms": 300, "segment": 0}]
+
+
+class FakeTranscriber:
+    def __init__(self):
+        self.calls = 0
+
+    def iter_word_batches(self, audio_path):
+        self.calls += 1
+        yield WORDS, 1.0
+
+
+def test_resume_writes_newly_requested_formats(tmp_path):
+    audio = tmp_path / "talk.mp3"
+    audio.write_bytes(b"ID3")
+    files = [(audio, Path(audio.name))]
+    transcriber = FakeTranscriber()
+
+    state = BatchState(tmp_path / "state.jsonl")
+    assert run_batch(transcriber, files, output_dir=tmp_path / "out", state=state) == (1, 0, 0)
+    assert run_batch(transcriber, files, output_dir=tmp_path / "out", state=state) == (0, 1, 0)
+
+    state = BatchState(tmp_path / "state.jsonl")
+    assert run_batch(transcriber, files, output_dir=tmp_path / "out", state=state,
+                     formats=["srt", "vtt"]) == (1, 0, 0)
+    assert (tmp_path / "out" / "talk.mp3.srt").read_text(encoding="utf-8").startswith("1\n00:00:00,000")
+    assert (tmp_path / "out" / "talk.mp3.vtt").exists()
+    assert run_batch(transcriber, files, output_dir=tmp_path / "out", state=state,
+                     formats=["vtt", "srt"]) == (0, 1, 0)
+    assert transcriber.calls == 2
+
+
+def test_missing_output_is_redone(tmp_path):
+    audio = tmp_path / "talk.mp3"
+    audio.write_bytes(b"ID3")
+    files = [(audio, Path(audio.name))]
+    state = BatchState(tmp_path / "state.jsonl")
+    run_batch(FakeTranscriber(), files, state=state)
+    (tmp_path / "talk.mp3.words.json").unlink()
+    assert run_batch(FakeTranscriber(), files, state=state) == (1, 0, 0)
+    assert (tmp_path / "talk.mp3.words.json").exists()
+
+
+def test_inputs_with_the_same_stem_get_separate_outputs(tmp_path):
+    for name in ("a.mp3", "a.wav"):
+        (tmp_path / name).write_bytes(b"RIFF")
+    files = list(iter_audio_files([str(tmp_path)]))
+    state = BatchState(tmp_path / "state.jsonl")
+    assert run_batch(FakeTranscriber(), files, output_dir=tmp_path / "out", state=state) == (2, 0, 0)
+    assert (tmp_path / "out" / "a.mp3.words.json").exists()
+    assert (tmp_path / "out" / "a.wav.words.json").exists()
+
+
+def test_glob_matches_keep_their_folders(tmp_path):
+    for folder in ("x", "y"):
+        (tmp_path / "in" / folder).mkdir(parents=True)
+        (tmp_path / "in" / folder / "talk.mp3").write_bytes(b"ID3")
+    files = list(iter_audio_files([str(tmp_path / "in" / "**" / "*.mp3")]))
+    assert run_batch(FakeTranscriber(), files, output_dir=tmp_path / "out") == (2, 0, 0)
+    assert (tmp_path / "out" / "x" / "talk.mp3.words.json").exists()
+    assert (tmp_path / "out" / "y" / "talk.mp3.words.json").exists()
+
+
+def test_colliding_outputs_are_rejected(tmp_path):
+    for folder in ("x", "y"):
+        (tmp_path / folder).mkdir()
+        (tmp_path / folder / "talk.mp3").write_bytes(b"ID3")
+    files = list(iter_audio_files([str(tmp_path / "x"), str(tmp_path / "y")]))
+    state = BatchState(tmp_path / "state.jsonl")
+    assert run_batch(FakeTranscriber(), files, output_dir=tmp_path / "out", state=state) == (1, 0, 1)
+    assert not state.is_done(BatchState.job_key(tmp_path / "y" / "talk.mp3"))
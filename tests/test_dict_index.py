@@ -0,0 +1,100 @@
+import csv
+import os
+
+import pytest
+
+from Echoscribe.Core.dict_index import FIELDS, DictionaryIndex
+
+ROWS = [
+    {"word": "run", "phonetic": "rʌn", "translation": "v. 跑", "exchange": "p:ran/d:run/i:running/3:runs",
+     "frq": "300"},
+    {"word": "Apple", "translation": "n. 苹果", "frq": "2000"},
+    {"word": "apply", "translation": "v. 申请", "frq": "1500"},
+    {"word": "zebra", "translation": "n. 斑马"},
+]
+
+
+def write_csv(path, rows):
+    with path.open("w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+
+
+@pytest.fixture
+def index(tmp_path):
+    csv_path = tmp_path / "ecdict.csv"
+    write_csv(csv_path, ROWS)
+    idx = DictionaryIndex.open_or_build(csv_path, tmp_path / "ecdict.idx")
+    yield idx
+    idx.close()
+
+
+def test_compile_and_lookup(index):
+    assert len(index) == 4
+    entry = index.lookup("apple")
+    assert entry["word"] == "Apple"
+    assert entry["translation"] == "n. 苹果"
+    assert set(entry) == set(FIELDS)
+    assert index.lookup("run")["phonetic"] == "rʌn"
+    assert index.lookup("missing") is None
+
+
+def test_prefix_keys(index):
+    assert index.prefix_keys("app", 10) == ["apple", "apply"]
+    assert index.prefix_keys("app", 1) == ["apple"]
+    assert index.prefix_keys("q", 10) == []
+
+
+def test_stale_index_is_rebuilt(tmp_path):
+    csv_path = tmp_path / "ecdict.csv"
+    index_path = tmp_path / "ecdict.idx"
+    write_csv(csv_path, ROWS)
+    DictionaryIndex.compile(csv_path, index_path)
+    assert DictionaryIndex.is_current(index_path, csv_path)
+
+    # Touching the CSV without changing it keeps the index
+    os.utime(csv_path, (1, 1))
+    assert DictionaryIndex.is_current(index_path, csv_path)
+
+    write_csv(csv_path, ROWS + [{"word": "yak"}])
+    assert not DictionaryIndex.is_current(index_path, csv_path)
+    index = DictionaryIndex.open_or_build(csv_path, index_path)
+    try:
+        assert index.lookup("yak")["word"] == "yak"
+    finally:
+        index.close()
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "bogus.idx"
+    path.write_bytes(b"NOPE" + bytes(200))
+    assert DictionaryIndex.read_header(path) is None
+    with pytest.raises(ValueError):
+        DictionaryIndex(path)
+
+
+def test_inflected_forms_resolve_to_lemma(tmp_path):
+    csv_path = tmp_path / "ecdict.csv"
+    write_csv(csv_path, ROWS + [
+        # "left" is listed by two lemmas; the more frequent one (lower rank) wins
+        {"word": "leave", "exchange": "p:left/d:left", "frq": "500"},
+        {"word": "lefe", "exchange": "p:left", "frq": "90000"},
+        # A form's own "0:" declaration beats the candidates
+        {"word": "studies", "exchange": "0:study"},
+        {"word": "study", "exchange": "3:studies", "frq": "700"},
+        {"word": "unknowns", "exchange": "0:notaword"},
+    ])
+    index = DictionaryIndex.open_or_build(csv_path, tmp_path / "ecdict.idx")
+    try:
+        assert index.lookup_lemma("running")["word"] == "run"
+        assert index.lookup_lemma("ran")["word"] == "run"
+        assert index.lookup_lemma("left")["word"] == "leave"
+        assert index.lookup_lemma("studies")["word"] == "study"
+        # Lemmas missing from the dictionary are not linked; the form itself is not its own lemma
+        assert index.lookup_lemma("unknowns") is None
+        assert index.lemma_row("run") == -1
+        assert index.lookup_lemma("zzz") is None
+    finally:
+        index.close()
@@ -0,0 +1,59 @@
+import io
+import json
+
+import pytest
+
+from Echoscribe.Core.exporters import export_file, format_for_path, format_timestamp, iter_cues, write_export
+
+WORDS = [
+    {"word": " Hello", "start_ms": 0, "end_ms": 400, "probability": 0.9, "segment": 0},
+    {"word": " world.", "start_ms": 400, "end_ms": 900, "segment": 0},
+    {"word": " Tab\tthere", "start_ms": 3_725_001, "end_ms": 3_726_000, "segment": 1},
+]
+
+
+def export(fmt, words=WORDS):
+    out = io.StringIO()
+    write_export(iter(words), out, fmt)
+    return out.getvalue()
+
+
+def test_srt():
+    assert export("srt") == ("1\n00:00:00,000 --> 00:00:00,900\nHello world.\n\n"
+                             "2\n01:02:05,001 --> 01:02:06,000\nTab\tthere\n\n")
+
+
+def test_vtt():
+    assert export("vtt") == ("WEBVTT\n\n00:00:00.000 --> 00:00:00.900\nHello world.\n\n"
+                             "01:02:05.001 --> 01:02:06.000\nTab\tthere\n\n")
+
+
+def test_jsonl_and_tsv():
+    assert [json.loads(line) for line in export("jsonl").splitlines()] == WORDS
+    lines = export("tsv").splitlines()
+    assert lines[0] == "start_ms\tend_ms\tsegment\tprobability\tword"
+    assert lines[1] == "0\t400\t0\t0.9\tHello"
+    assert lines[3] == "3725001\t3726000\t1\t\tTab\\tthere"
+
+
+def test_long_segments_are_split():
+    words = [{"word": f" w{i}", "start_ms": i * 300, "end_ms": i * 300 + 250, "segment": 0} for i in range(60)]
+    cues = list(iter_cues(words))
+    assert len(cues) > 1
+    assert all(end - start <= 7000 and len(text) <= 84 for start, end, text in cues)
+    assert " ".join(text for _, _, text in cues) == " ".join(w["word"].strip() for w in words)
+
+
+def test_export_file(tmp_path):
+    path = export_file(iter(WORDS), tmp_path / "out.srt")
+    assert path.read_text(encoding="utf-8") == export("srt")
+    assert format_for_path("x.VTT") == "vtt"
+    with pytest.raises(ValueError):
+        export_file(iter(WORDS), tmp_path / "out.txt")
+    # A failed export leaves neither the target nor a temporary file behind
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["out.srt"]
+
+
+def test_format_timestamp():
+    assert format_timestamp(3_723_004) == "01:02:03,004"
+    assert format_timestamp(-5, ".") == "00:00:00.000"
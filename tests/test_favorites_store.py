@@ -0,0 +1,36 @@
+import json
+
+from Echoscribe.Core.favorites_store import FavoritesStore
+
+
+def test_add_remove_persist(tmp_path):
+    store = FavoritesStore(tmp_path / "favorites.db")
+    assert store.add("apple", source_file="talk.mp3", position_ms=1200)
+    assert not store.add("apple")
+    assert store.add("banana")
+    assert "apple" in store and len(store) == 2
+    assert store.remove("banana")
+    assert not store.remove("banana")
+    store.record_review("apple")
+    store.close()
+
+    reopened = FavoritesStore(tmp_path / "favorites.db")
+    assert reopened.words() == ["apple"]
+    info = reopened.info("apple")
+    assert info["source_file"] == "talk.mp3"
+    assert info["position_ms"] == 1200
+    assert info["review_count"] == 1
+    assert reopened.info("banana") is None
+    reopened.close()
+
+
+def test_migrate_json(tmp_path):
+    legacy = tmp_path / "favorites.json"
+    legacy.write_text(json.dumps(["word", "other", "", 3]), encoding="utf-8")
+    store = FavoritesStore(tmp_path / "favorites.db")
+    assert store.migrate_json(legacy) == 2
+    assert store.words() == ["other", "word"]
+    # Importing again does not duplicate rows
+    store.migrate_json(legacy)
+    assert len(store) == 2
+    store.close()
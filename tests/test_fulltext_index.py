@@ -0,0 +1,57 @@
+import csv
+
+import pytest
+
+from Echoscribe.Core.dict_index import FIELDS, DictionaryIndex
+from Echoscribe.Core.fulltext_index import FullTextIndex, query_terms, tokenize
+
+ROWS = [
+    {"word": "apple", "translation": "n. 苹果", "definition": "fruit with red or green skin"},
+    {"word": "banana", "translation": "n. 香蕉", "definition": "long curved fruit"},
+    {"word": "pineapple", "translation": "n. 菠萝, 凤梨", "definition": "large tropical fruit"},
+    {"word": "run", "translation": "v. 跑, 奔跑", "definition": "move fast on foot"},
+]
+
+
+@pytest.fixture
+def indexes(tmp_path):
+    csv_path = tmp_path / "ecdict.csv"
+    with csv_path.open("w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerows(ROWS)
+    dict_index = DictionaryIndex.open_or_build(csv_path, tmp_path / "ecdict.idx")
+    fulltext = FullTextIndex.open_or_build(dict_index, tmp_path / "ecdict.ft")
+    yield dict_index, fulltext
+    fulltext.close()
+    dict_index.close()
+
+
+def words_for(dict_index, results):
+    return [dict_index.entry_at(row)["word"] for row, _ in results]
+
+
+def test_tokenize():
+    assert tokenize("A long curved fruit") == ["long", "curved", "fruit"]
+    assert tokenize("n. 苹果") == ["苹", "果", "苹果"]
+    assert query_terms("奔跑 fast fast") == ["奔跑", "fast"]
+
+
+def test_search_round_trip(indexes):
+    dict_index, fulltext = indexes
+    assert fulltext.doc_count == len(dict_index)
+    assert words_for(dict_index, fulltext.search("香蕉")) == ["banana"]
+    assert words_for(dict_index, fulltext.search("跑")) == ["run"]
+    # Rows matching more query terms come first
+    assert words_for(dict_index, fulltext.search("tropical fruit"))[0] == "pineapple"
+    assert set(words_for(dict_index, fulltext.search("fruit"))) == {"apple", "banana", "pineapple"}
+    assert fulltext.search("nothingmatches") == []
+    assert len(fulltext.search("fruit", limit=2)) == 2
+
+
+def test_rebuilt_for_other_dictionary(indexes, tmp_path):
+    dict_index, _ = indexes
+    assert FullTextIndex.is_current(tmp_path / "ecdict.ft", dict_index)
+    assert not FullTextIndex.is_current(tmp_path / "missing.ft", dict_index)
+    (tmp_path / "bogus.ft").write_bytes(b"NOPE" + bytes(100))
+    assert not FullTextIndex.is_current(tmp_path / "bogus.ft", dict_index)
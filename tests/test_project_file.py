@@ -0,0 +1,111 @@
+import struct
+
+import pytest
+
+from Echoscribe.Core.project_file import _HEADER, ProjectFile
+from Echoscribe.Core.transcript_store import TranscriptStore
+
+WORDS = [
+    {"word": " The", "start_ms": 0, "end_ms": 200, "probability": 0.5, "segment": 0},
+    {"word": " cat", "start_ms": 200, "end_ms": 500, "segment": 0},
+    {"word": " the", "start_ms": 900, "end_ms": 1100, "segment": 1},
+    {"word": " 猫", "start_ms": 1100, "segment": 1},
+]
+
+
+@pytest.fixture
+def project(tmp_path):
+    audio = tmp_path / "talk.mp3"
+    audio.write_bytes(b"ID3")
+    transcript = TranscriptStore(WORDS)
+    return ProjectFile.create(tmp_path / "talk.echoscribe", str(audio), transcript), transcript
+
+
+def test_create_and_open_round_trip(project):
+    created, transcript = project
+    opened, restored = ProjectFile.open(created.path)
+    assert opened.audio_path == created.audio_path
+    assert opened.edits == []
+    assert list(restored.iter_dicts()) == list(transcript.iter_dicts())
+    assert list(restored.segment_starts) == list(transcript.segment_starts)
+    assert restored.end_ms(3) == transcript.end_ms(3)
+
+
+def test_from_columns_rejects_mismatched_lengths():
+    store = TranscriptStore(WORDS)
+    with pytest.raises(ValueError):
+        TranscriptStore.from_columns(list(store.words)[:-1], store.starts, store.ends, store.probabilities,
+                                     store.segments, store.segment_starts)
+
+
+def test_journaled_edits_are_replayed(project):
+    created, _ = project
+    created.record_edit(1, " cat", " hat")
+    created.record_edit(3, " 猫", " 狗")
+    opened, restored = ProjectFile.open(created.path)
+    assert opened.edits == [(1, " cat", " hat"), (3, " 猫", " 狗")]
+    assert [restored.word(i) for i in range(4)] == [" The", " hat", " the", " 狗"]
+
+
+def test_truncated_journal_tail_is_dropped(project):
+    created, _ = project
+    created.record_edit(1, " cat", " hat")
+    size = created.path.stat().st_size
+    created.record_edit(2, " the", " a")
+    with created.path.open("r+b") as f:
+        f.truncate(created.path.stat().st_size - 2)
+
+    opened, restored = ProjectFile.open(created.path)
+    assert opened.edits == [(1, " cat", " hat")]
+    assert restored.word(2) == " the"
+    # The torn record is cut off so the next edit appends cleanly
+    assert created.path.stat().st_size == size
+    opened.record_edit(0, " The", " A")
+    assert ProjectFile.open(created.path)[0].edits == [(1, " cat", " hat"), (0, " The", " A")]
+
+
+def test_compact_folds_journal_into_snapshot(project):
+    created, _ = project
+    created.record_edit(1, " cat", " hat")
+    _, restored = ProjectFile.open(created.path)
+    created.compact(restored)
+    assert not created.needs_compaction
+    opened, compacted = ProjectFile.open(created.path)
+    assert opened.edits == [(1, " cat", " hat")]
+    assert compacted.word(1) == " hat"
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "bogus.echoscribe"
+    path.write_bytes(b"NOPE" + bytes(200))
+    with pytest.raises(ValueError):
+        ProjectFile.open(path)
+    path.write_bytes(b"EC")
+    with pytest.raises(ValueError):
+        ProjectFile.open(path)
+
+
+def test_resolve_audio_next_to_moved_project(project, tmp_path):
+    created, _ = project
+    assert created.resolve_audio() == tmp_path / "talk.mp3"
+    moved = ProjectFile(created.path, "/elsewhere/talk.mp3", [], [])
+    assert moved.resolve_audio() == tmp_path / "talk.mp3"
+    missing = ProjectFile(created.path, "/elsewhere/other.mp3", [], [])
+    assert missing.resolve_audio() is None
+
+
+def test_out_of_range_word_id_is_rejected(project):
+    created, _ = project
+    with created.path.open("r+b") as f:
+        word_ids_offset = _HEADER.unpack(f.read(_HEADER.size))[13]
+        f.seek(word_ids_offset)
+        f.write(struct.pack("<I", 1000))
+    with pytest.raises(ValueError):
+        ProjectFile.open(created.path)
+
+
+def test_journal_edit_of_missing_word_is_skipped(project):
+    created, transcript = project
+    created.record_edit(99, "", " dog")
+    _, restored = ProjectFile.open(created.path)
+    assert list(restored.iter_dicts()) == list(transcript.iter_dicts())
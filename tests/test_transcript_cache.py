@@ -0,0 +1,48 @@
+import os
+
+from Echoscribe.Core.transcript_cache import TranscriptCache
+
+WORDS = [{"word": " Hello", "start_ms": 0, "end_ms": 400, "segment": 0},
+         {"word": " 世界", "start_ms": 400, "end_ms": 900, "segment": 0}]
+
+
+def test_put_get_round_trip(tmp_path):
+    cache = TranscriptCache(tmp_path / "cache")
+    cache.put("abc", WORDS)
+    assert cache.get("abc") == WORDS
+    assert cache.get("missing") is None
+
+
+def test_key_depends_on_audio_and_params(tmp_path):
+    cache = TranscriptCache(tmp_path / "cache")
+    audio = tmp_path / "a.wav"
+    audio.write_bytes(b"RIFF" + bytes(100))
+    key = cache.make_key(audio, {"beam_size": 5})
+    assert key == cache.make_key(audio, {"beam_size": 5})
+    assert key != cache.make_key(audio, {"beam_size": 1})
+    audio.write_bytes(b"RIFF" + bytes(101))
+    assert key != cache.make_key(audio, {"beam_size": 5})
+
+
+def test_unreadable_entry_is_discarded(tmp_path):
+    cache = TranscriptCache(tmp_path / "cache")
+    (tmp_path / "cache" / "bad.json").write_text("{not json", encoding="utf-8")
+    assert cache.get("bad") is None
+    assert not (tmp_path / "cache" / "bad.json").exists()
+
+
+def test_evicts_least_recently_used(tmp_path):
+    cache = TranscriptCache(tmp_path / "cache")
+    for i, key in enumerate(("old", "used", "other")):
+        cache.put(key, WORDS)
+        os.utime(cache._entry_path(key), (1000 + i, 1000 + i))
+    # Reading "used" makes it the most recently used entry
+    assert cache.get("used") == WORDS
+    cache.max_bytes = cache._entry_path("used").stat().st_size * 2
+    cache.put("new", WORDS)
+    assert cache.get("old") is None
+    assert cache.get("other") is None
+    assert cache.get("used") == WORDS
+    assert cache.get("new") == WORDS
+    assert cache.size_bytes() <= cache.max_bytes
+    assert cache.clear() == 2
@@ -0,0 +1,46 @@
+import pytest
+
+from Echoscribe.Core.transcript_store import TranscriptStore
+
+WORDS = [
+    {"word": " Hello", "start_ms": 0, "end_ms": 400, "probability": 0.9, "segment": 0},
+    {"word": " world.", "start_ms": 400, "segment": 0},
+    {"word": " Next", "start_ms": 1500, "end_ms": 1800, "segment": 1},
+    # Out-of-order start times are clamped so the starts stay searchable
+    {"word": " one", "start_ms": 1400, "end_ms": 2000, "segment": 1},
+]
+
+
+def test_columns_and_dict_round_trip():
+    store = TranscriptStore(WORDS)
+    assert len(store) == 4
+    assert list(store.starts) == [0, 400, 1500, 1500]
+    # A word without an end time lasts until the next word starts
+    assert store.end_ms(1) == 1500
+    # Probabilities are stored as 32-bit floats
+    assert store.probability(0) == pytest.approx(0.9)
+    assert store.probability(1) is None
+    assert store.to_dict(0) == {"word": " Hello", "start_ms": 0, "end_ms": 400, "segment": 0,
+                                "probability": 0.9}
+    assert TranscriptStore(store.iter_dicts()).to_dict(3) == store.to_dict(3)
+
+
+def test_time_and_segment_queries():
+    store = TranscriptStore(WORDS)
+    assert store.index_at(-1) == -1
+    assert store.index_at(450) == 1
+    assert store.index_at(10_000) == 3
+    assert store.next_boundary_ms(1) == 1500
+    assert store.next_boundary_ms(3) is None
+    assert store.segment_count == 2
+    assert store.segment_of(2) == 1
+    assert store.segment_range(0) == (0, 2)
+    assert store.segment_time_range(1) == (1500, 2000)
+
+
+def test_edit_and_clear():
+    store = TranscriptStore(WORDS)
+    store.set_word(1, " planet.")
+    assert store.word(1) == " planet."
+    store.clear()
+    assert len(store) == 0 and store.segment_count == 0
@@ -0,0 +1,60 @@
+import os
+
+from Echoscribe.Core.tts_service import TtsService
+
+
+class FakeEngine:
+    """Stands in for pyttsx3: renders every word as a 1000-byte file."""
+
+    def __init__(self):
+        self.properties = {"rate": 200}
+        self.rendered = []
+
+    def getProperty(self, name):
+        return self.properties.get(name)
+
+    def setProperty(self, name, value):
+        self.properties[name] = value
+
+    def save_to_file(self, text, path):
+        self.rendered.append(text)
+        with open(path, "wb") as f:
+            f.write(bytes(1000))
+
+    def runAndWait(self):
+        pass
+
+
+def make_service(tmp_path, max_bytes):
+    service = TtsService(tmp_path / "tts", on_ready=lambda word, path: None, max_bytes=max_bytes)
+    service.voice_id = "en"
+    return service
+
+
+def test_synthesized_words_are_cached(tmp_path):
+    service = make_service(tmp_path, 10_000)
+    engine = FakeEngine()
+    path = service._synthesize(engine, "hello", 200)
+    assert path == service.cache_path("hello", "en", 200)
+    assert service._synthesize(engine, "hello", 200) == path
+    assert engine.rendered == ["hello"]
+    assert service.cache_path("hello", "en", 250) != path
+
+
+def test_evicts_least_recently_used(tmp_path):
+    service = make_service(tmp_path, 2500)
+    engine = FakeEngine()
+    for i, word in enumerate(("old", "used", "other")):
+        path = service._synthesize(engine, word, 200)
+        os.utime(path, (1000 + i, 1000 + i))
+    assert not service.cache_path("old", "en", 200).exists()
+    # Speaking a cached word makes it the most recently used file
+    service.speak("used")
+    service._synthesize(engine, "new", 200)
+    assert not service.cache_path("other", "en", 200).exists()
+    assert service.cache_path("used", "en", 200).exists()
+    assert service.cache_path("new", "en", 200).exists()
+    assert service.size_bytes() <= service.max_bytes
+    assert service.clear() == 2
+    assert service.size_bytes() == 0
+    service.stop()